@@ -79,10 +79,12 @@ from .helpers import (
     entity,
     entity_registry,
     floor_registry,
+    import_prewarm,
     issue_registry,
     label_registry,
     recorder,
     restore_state,
+    startup_trace,
     template,
     translation,
 )
@@ -262,6 +264,7 @@ async def async_setup_hass(
     async def create_hass() -> core.HomeAssistant:
         """Create the hass object and do basic setup."""
         hass = core.HomeAssistant(runtime_config.config_dir)
+        startup_trace.async_setup(hass)
         loader.async_setup(hass)
 
         await async_enable_logging(
@@ -454,6 +457,10 @@ async def async_from_config_dict(
     # Prime custom component cache early so we know if registry entries are tied
     # to a custom integration
     await loader.async_get_custom_components(hass)
+    # Pre-warm the modules the previous start imported while we set up
+    hass.async_create_background_task(
+        import_prewarm.async_setup(hass), "import prewarm", eager_start=True
+    )
     await async_load_base_functionality(hass)
 
     # Set up core.
@@ -972,9 +979,10 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
-    domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
-        hass, config
-    )
+    with startup_trace.trace_span(hass, "resolve domains", "bootstrap"):
+        domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
+            hass, config
+        )
 
     # Initialize recorder
     if "recorder" in domains_to_setup:
@@ -1020,7 +1028,8 @@ async def _async_set_up_integrations(
                 for dep in integration.all_dependencies
             )
             async_set_domains_to_be_loaded(hass, to_be_loaded)
-            await async_setup_multi_components(hass, domain_group, config)
+            with startup_trace.trace_span(hass, f"stage {name}", "bootstrap"):
+                await async_setup_multi_components(hass, domain_group, config)
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
@@ -1032,7 +1041,8 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                with startup_trace.trace_span(hass, "stage 1", "bootstrap"):
+                    await async_setup_multi_components(hass, stage_1_domains, config)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
@@ -1048,7 +1058,8 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                with startup_trace.trace_span(hass, "stage 2", "bootstrap"):
+                    await async_setup_multi_components(hass, stage_2_domains, config)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
@@ -1059,7 +1070,8 @@ async def _async_set_up_integrations(
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
         async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+            with startup_trace.trace_span(hass, "wrap up", "bootstrap"):
+                await hass.async_block_till_done()
     except TimeoutError:
         _LOGGER.warning(
             "Setup timed out for bootstrap waiting on %s - moving forward",
@@ -15,6 +15,10 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
 )
+from homeassistant.helpers.entity import (
+    COALESCE_OPTIONS_DOMAIN,
+    COALESCE_OPTIONS_SCHEMA,
+)
 from homeassistant.helpers.json import json_dumps
 
 
@@ -206,6 +210,18 @@ def websocket_update_entity(
         )
         return
 
+    if (
+        msg.get("options_domain") == COALESCE_OPTIONS_DOMAIN
+        and msg["options"] is not None
+    ):
+        try:
+            msg["options"] = COALESCE_OPTIONS_SCHEMA(msg["options"])
+        except vol.Invalid as err:
+            connection.send_message(
+                websocket_api.error_message(msg["id"], "invalid_info", str(err))
+            )
+            return
+
     changes = {}
 
     for key in (
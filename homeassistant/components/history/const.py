@@ -5,3 +5,7 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+MAX_HISTORY_CHUNK_SIZE = 32768
+# The client has to request the chunks after these with the cursor,
+# so a slow client does not get the whole history queued up at once
+MAX_HISTORY_CHUNKS_PER_REQUEST = 8
@@ -7,6 +7,7 @@ from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
+from threading import Event as ThreadingEvent
 from typing import Any, cast
 
 import voluptuous as vol
@@ -35,10 +36,15 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import json_bytes
-from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.async_ import create_eager_task, run_callback_threadsafe
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    MAX_HISTORY_CHUNK_SIZE,
+    MAX_HISTORY_CHUNKS_PER_REQUEST,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -93,6 +99,99 @@ def _ws_get_significant_states(
     )
 
 
+@callback
+def _async_send_empty_history(
+    connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Send an empty history during period response."""
+    if "chunk_size" not in msg:
+        connection.send_result(msg["id"], {})
+        return
+    connection.send_result(msg["id"])
+    connection.send_message(_generate_chunk_message(msg["id"], {}, None, True))
+
+
+def _generate_chunk_message(
+    msg_id: int,
+    states: dict[str, list[dict[str, Any]]],
+    cursor: tuple[int, float, int] | None,
+    done: bool,
+) -> bytes:
+    """Generate a history chunk message."""
+    return json_bytes(
+        messages.event_message(
+            msg_id, {"states": states, "cursor": cursor, "done": done}
+        )
+    )
+
+
+def _ws_send_significant_states_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+    cursor: tuple[int, float, int] | None,
+    stop_event: ThreadingEvent,
+) -> None:
+    """Fetch history significant_states in chunks and send them from the executor.
+
+    A chunk is sent as soon as the next one has been fetched, so at most
+    two chunks are held in memory. The cursor of a chunk is the position
+    to continue after it and None for the last chunk of the history.
+
+    At most MAX_HISTORY_CHUNKS_PER_REQUEST chunks are sent per request,
+    the last message of a request is marked done. If its cursor is not
+    None, the client requests the following chunks with the cursor once
+    it has processed the ones it has, so it sets the pace.
+    """
+    chunks = history.iter_significant_states_chunks(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+        chunk_size,
+        cursor,
+    )
+    pending: dict[str, list[dict[str, Any]]] | None = None
+    pending_cursor: tuple[int, float, int] | None = None
+    sent = 0
+    # Look ahead one chunk to know if the pending one is the last
+    for next_cursor, states in chunks:
+        if pending is not None:
+            sent += 1
+            done = sent == MAX_HISTORY_CHUNKS_PER_REQUEST
+            run_callback_threadsafe(
+                hass.loop,
+                connection.send_message,
+                _generate_chunk_message(msg_id, pending, pending_cursor, done),
+            ).result()
+            if done:
+                chunks.close()
+                return
+        if stop_event.is_set():
+            chunks.close()
+            return
+        pending = cast(dict[str, list[dict[str, Any]]], states)
+        pending_cursor = next_cursor
+    run_callback_threadsafe(
+        hass.loop,
+        connection.send_message,
+        _generate_chunk_message(msg_id, pending or {}, None, True),
+    ).result()
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,6 +202,12 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunk_size"): vol.All(
+            int, vol.Range(min=1, max=MAX_HISTORY_CHUNK_SIZE)
+        ),
+        vol.Optional("cursor"): vol.All(
+            vol.Coerce(tuple), vol.ExactSequence((int, vol.Coerce(float), int))
+        ),
     }
 )
 @websocket_api.async_response
@@ -129,7 +234,7 @@ async def ws_get_history_during_period(
         end_time = None
 
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -149,12 +254,39 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if (chunk_size := msg.get("chunk_size")) is not None:
+        msg_id: int = msg["id"]
+        stop_event = ThreadingEvent()
+        connection.subscriptions[msg_id] = stop_event.set
+        connection.send_result(msg_id)
+        try:
+            await get_instance(hass).async_add_executor_job(
+                _ws_send_significant_states_chunks,
+                hass,
+                connection,
+                msg_id,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                chunk_size,
+                msg.get("cursor"),
+                stop_event,
+            )
+        finally:
+            if connection.subscriptions.get(msg_id) == stop_event.set:
+                connection.subscriptions.pop(msg_id)
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -19,14 +19,25 @@ import voluptuous as vol
 
 from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.const import (
+    CONF_SCAN_INTERVAL,
+    CONF_TYPE,
+    EVENT_HOMEASSISTANT_STOP,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import save_json
+from homeassistant.helpers.loop_watchdog import LoopWatchdog
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.startup_trace import async_get_tracer
+from homeassistant.util.timer_wheel import get_timer_wheel
+
+from .const import DOMAIN, LOOP_WATCHDOG
 
-from .const import DOMAIN
+PLATFORMS = [Platform.SENSOR]
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -40,6 +51,8 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_EVENT_BUS_LISTENER_STATS = "event_bus_listener_stats"
+SERVICE_DUMP_STARTUP_TRACE = "dump_startup_trace"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,6 +76,8 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_EVENT_BUS_LISTENER_STATS,
+    SERVICE_DUMP_STARTUP_TRACE,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -86,6 +101,16 @@ async def async_setup_entry(  # noqa: C901
     lock = asyncio.Lock()
     domain_data = hass.data[DOMAIN] = {}
 
+    watchdog = domain_data[LOOP_WATCHDOG] = LoopWatchdog(hass)
+    watchdog.async_start()
+
+    async def _async_stop_watchdog(_: Event) -> None:
+        await watchdog.async_stop()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_watchdog)
+    )
+
     async def _async_run_profile(call: ServiceCall) -> None:
         async with lock:
             await _async_generate_profile(hass, call)
@@ -94,6 +119,13 @@ async def async_setup_entry(  # noqa: C901
         async with lock:
             await _async_generate_memory_profile(hass, call)
 
+    async def _async_run_event_bus_listener_stats(call: ServiceCall) -> None:
+        async with lock:
+            await _async_generate_event_bus_listener_stats(hass, call)
+
+    async def _async_run_dump_startup_trace(call: ServiceCall) -> None:
+        await _async_dump_startup_trace(hass, call)
+
     async def _async_start_log_objects(call: ServiceCall) -> None:
         if LOG_INTERVAL_SUB in domain_data:
             raise HomeAssistantError("Object logging already started")
@@ -259,6 +291,11 @@ async def async_setup_entry(  # noqa: C901
             for handle in getattr(hass.loop, "_scheduled"):
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
+            # The timers of the timer wheel share one event loop timer
+            wheel = get_timer_wheel(hass.loop)
+            _LOGGER.critical("Timer wheel: %s", wheel.stats())
+            for timer in wheel.timers():
+                _LOGGER.critical("Scheduled: %s", timer)
 
     async def _async_asyncio_debug(call: ServiceCall) -> None:
         """Enable or disable asyncio debug."""
@@ -293,6 +330,16 @@ async def async_setup_entry(  # noqa: C901
         ),
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_EVENT_BUS_LISTENER_STATS,
+        _async_run_event_bus_listener_stats,
+        schema=vol.Schema(
+            {vol.Optional(CONF_SECONDS, default=60.0): vol.Coerce(float)}
+        ),
+    )
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -382,16 +429,27 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_DUMP_STARTUP_TRACE,
+        _async_run_dump_startup_trace,
+    )
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
-    hass.data.pop(DOMAIN)
+    await hass.data.pop(DOMAIN)[LOOP_WATCHDOG].async_stop()
     return True
 
 
@@ -463,6 +521,57 @@ async def _async_generate_memory_profile(hass: HomeAssistant, call: ServiceCall)
     )
 
 
+async def _async_generate_event_bus_listener_stats(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    start_time = int(time.time() * 1000000)
+    persistent_notification.async_create(
+        hass,
+        (
+            "The event bus listener stats have started. This notification will be"
+            " updated when they are complete."
+        ),
+        title="Event bus listener stats started",
+        notification_id=f"event_bus_listener_stats_{start_time}",
+    )
+    # Profiling which was enabled through the websocket API stays enabled
+    already_enabled = hass.bus.profiler is not None
+    profiler = hass.bus.async_enable_profiling()
+    try:
+        await asyncio.sleep(float(call.data[CONF_SECONDS]))
+    finally:
+        if not already_enabled:
+            hass.bus.async_disable_profiling()
+    listener_stats = profiler.async_stats()
+
+    stats_path = hass.config.path(f"event_bus_listener_stats.{start_time}.json")
+    await hass.async_add_executor_job(save_json, stats_path, listener_stats)
+    persistent_notification.async_create(
+        hass,
+        f"Wrote event bus listener stats to {stats_path}",
+        title="Event bus listener stats complete",
+        notification_id=f"event_bus_listener_stats_{start_time}",
+    )
+
+
+async def _async_dump_startup_trace(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Write the trace of the startup in the Chrome trace event format."""
+    if (tracer := async_get_tracer(hass)) is None:
+        raise HomeAssistantError("The startup was not traced")
+    start_time = int(time.time() * 1000000)
+    trace_path = hass.config.path(f"startup_trace.{start_time}.json")
+    await hass.async_add_executor_job(save_json, trace_path, tracer.as_chrome_trace())
+    persistent_notification.async_create(
+        hass,
+        (
+            f"Wrote the startup trace to {trace_path}, open it in"
+            " https://ui.perfetto.dev or chrome://tracing"
+        ),
+        title="Startup trace complete",
+        notification_id=f"startup_trace_{start_time}",
+    )
+
+
 def _write_profile(profiler, cprofile_path, callgrind_path):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -0,0 +1,113 @@
+"""Sensor platform for the Profiler integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.loop_watchdog import LoopWatchdog
+from homeassistant.helpers.typing import StateType
+
+from .const import DEFAULT_NAME, DOMAIN, LOOP_WATCHDOG
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+@dataclass(kw_only=True, frozen=True)
+class ProfilerSensorEntityDescription(SensorEntityDescription):
+    """Describes a Profiler sensor entity."""
+
+    value_fn: Callable[[LoopWatchdog], StateType]
+
+
+def _last_slow_callback(watchdog: LoopWatchdog) -> str | None:
+    """Return the integration or location of the last slow callback."""
+    if not watchdog.slow_callbacks:
+        return None
+    slow_callback = watchdog.slow_callbacks[-1]
+    return slow_callback.integration or slow_callback.location
+
+
+SENSOR_TYPES: tuple[ProfilerSensorEntityDescription, ...] = (
+    ProfilerSensorEntityDescription(
+        key="event_loop_lag_p99",
+        translation_key="event_loop_lag_p99",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=1,
+        value_fn=lambda watchdog: watchdog.lag.percentile(99) * 1000,
+    ),
+    ProfilerSensorEntityDescription(
+        key="event_loop_lag_max",
+        translation_key="event_loop_lag_max",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=1,
+        value_fn=lambda watchdog: watchdog.lag.max * 1000,
+    ),
+    ProfilerSensorEntityDescription(
+        key="slow_callbacks",
+        translation_key="slow_callbacks",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda watchdog: watchdog.slow_callback_count,
+    ),
+    ProfilerSensorEntityDescription(
+        key="last_slow_callback",
+        translation_key="last_slow_callback",
+        value_fn=_last_slow_callback,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the Profiler sensor platform."""
+    watchdog: LoopWatchdog = hass.data[DOMAIN][LOOP_WATCHDOG]
+    async_add_entities(
+        ProfilerSensor(watchdog, description, entry.entry_id)
+        for description in SENSOR_TYPES
+    )
+
+
+class ProfilerSensor(SensorEntity):
+    """Representation of a sensor of the event loop watchdog."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity_description: ProfilerSensorEntityDescription
+
+    def __init__(
+        self,
+        watchdog: LoopWatchdog,
+        entity_description: ProfilerSensorEntityDescription,
+        entry_id: str,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = entity_description
+        self._attr_unique_id = f"{entry_id}-{entity_description.key}"
+        self._watchdog = watchdog
+        self._attr_device_info = DeviceInfo(
+            name=DEFAULT_NAME,
+            identifiers={(DOMAIN, entry_id)},
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the sensor."""
+        return self.entity_description.value_fn(self._watchdog)
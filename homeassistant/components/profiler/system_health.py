@@ -0,0 +1,48 @@
+"""Provide info to system health."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.loop_watchdog import LoopWatchdog
+from homeassistant.helpers.template import compiled_template_cache_stats
+
+from .const import DOMAIN, LOOP_WATCHDOG
+
+MAX_SLOW_CALLBACKS = 5
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get info for the info page."""
+    if DOMAIN not in hass.data:
+        return {}
+    watchdog: LoopWatchdog = hass.data[DOMAIN][LOOP_WATCHDOG]
+    lag = watchdog.lag
+    recent = [
+        f"{slow_callback.integration or slow_callback.location}"
+        f" ({slow_callback.duration * 1000:.0f} ms)"
+        for slow_callback in reversed(watchdog.slow_callbacks)
+    ][:MAX_SLOW_CALLBACKS]
+    template_cache = compiled_template_cache_stats()
+    return {
+        "event_loop_lag_p50": f"{lag.percentile(50) * 1000:.1f} ms",
+        "event_loop_lag_p99": f"{lag.percentile(99) * 1000:.1f} ms",
+        "event_loop_lag_max": f"{lag.max * 1000:.1f} ms",
+        "slow_callbacks": watchdog.slow_callback_count,
+        "recent_slow_callbacks": ", ".join(recent) or "none",
+        "compiled_template_cache": (
+            f"{template_cache['size']}/{template_cache['max_size']} templates,"
+            f" {template_cache['hits']} hits, {template_cache['misses']} misses,"
+            f" {template_cache['evictions']} evictions"
+        ),
+    }
@@ -47,20 +47,28 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_URL = "sqlite:///{hass_config_path}"
 DEFAULT_DB_FILE = "home-assistant_v2.db"
+DEFAULT_SPOOL_FILE = "home-assistant_v2.spool"
 DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 5
+DEFAULT_HISTORY_CACHE_SIZE = 0
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
+CONF_DB_READ_URLS = "db_read_urls"
+CONF_DB_READ_POOL_SIZE = "db_read_pool_size"
+CONF_DB_PARTITIONING = "db_partitioning"
+CONF_DB_SPOOL = "db_spool"
+CONF_SPLIT_VOLATILE_ATTRIBUTES = "split_volatile_attributes"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_HISTORY_CACHE_SIZE = "history_cache_size"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -101,6 +109,17 @@ CONFIG_SCHEMA = vol.Schema(
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
                     vol.Optional(CONF_DB_URL): vol.All(cv.string, validate_db_url),
+                    vol.Optional(CONF_DB_READ_URLS, default=list): vol.All(
+                        cv.ensure_list, [vol.All(cv.string, validate_db_url)]
+                    ),
+                    vol.Optional(CONF_DB_READ_POOL_SIZE): vol.All(
+                        vol.Coerce(int), vol.Range(min=1)
+                    ),
+                    vol.Optional(CONF_DB_PARTITIONING, default=False): cv.boolean,
+                    vol.Optional(CONF_DB_SPOOL, default=False): cv.boolean,
+                    vol.Optional(
+                        CONF_SPLIT_VOLATILE_ATTRIBUTES, default=False
+                    ): cv.boolean,
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
@@ -113,6 +132,9 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(
+                        CONF_HISTORY_CACHE_SIZE, default=DEFAULT_HISTORY_CACHE_SIZE
+                    ): cv.positive_int,
                 }
             ),
         )
@@ -142,6 +164,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
+    history_cache_size = conf[CONF_HISTORY_CACHE_SIZE]
+    db_read_urls = conf[CONF_DB_READ_URLS]
+    db_read_pool_size = conf.get(CONF_DB_READ_POOL_SIZE)
+    db_partitioning = conf[CONF_DB_PARTITIONING]
+    db_spool_path = (
+        hass.config.path(DEFAULT_SPOOL_FILE) if conf[CONF_DB_SPOOL] else None
+    )
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
@@ -163,8 +192,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        history_cache_size=history_cache_size * 1024**2,
+        db_read_urls=db_read_urls,
+        db_read_pool_size=db_read_pool_size,
+        db_partitioning=db_partitioning,
+        db_spool_path=db_spool_path,
+        split_volatile_attributes=conf[CONF_SPLIT_VOLATILE_ATTRIBUTES],
     )
     get_instance.cache_clear()
+    await instance.async_load_purge_progress()
     instance.async_initialize()
     instance.async_register()
     instance.start()
@@ -16,6 +16,8 @@ from .util import get_instance
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the recorder websocket API."""
     websocket_api.async_register_command(hass, ws_info)
+    websocket_api.async_register_command(hass, ws_purge_progress)
+    websocket_api.async_register_command(hass, ws_read_pools)
 
 
 @websocket_api.websocket_command(
@@ -54,3 +56,35 @@ def ws_info(
         "thread_running": is_running,
     }
     connection.send_result(msg["id"], recorder_info)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/purge_progress",
+    }
+)
+@callback
+def ws_purge_progress(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the progress of the running or last purge."""
+    progress = None
+    if (instance := get_instance(hass)) and instance.purge_progress is not None:
+        progress = instance.purge_progress.as_dict()
+    connection.send_result(msg["id"], progress)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/read_pools",
+    }
+)
+@callback
+def ws_read_pools(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the metrics of the read pools."""
+    read_pools = []
+    if instance := get_instance(hass):
+        read_pools = [read_pool.as_dict() for read_pool in instance.read_pools]
+    connection.send_result(msg["id"], read_pools)
@@ -30,6 +30,11 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
+# When the spool is enabled events are written to the spool
+# instead of being kept in memory once the backlog reaches this size
+SPOOL_QUEUE_BACKLOG = 10000
+SPOOL_REPLAY_BATCH_SIZE = 1000
+
 # The maximum number of rows (events) we purge in one delete statement
 
 # sqlite3 has a limit of 999 until version 3.32.0
@@ -54,10 +59,16 @@ ATTR_APPLY_FILTER = "apply_filter"
 
 KEEPALIVE_TIME = 30
 
+PURGE_PROGRESS_STORAGE_KEY = f"{DOMAIN}.purge_progress"
+PURGE_PROGRESS_STORAGE_VERSION = 1
+PURGE_PROGRESS_SAVE_DELAY = 10
+
 CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
 LAST_REPORTED_SCHEMA_VERSION = 43
+STATISTICS_ROLLUPS_SCHEMA_VERSION = 48
+VOLATILE_ATTRS_SCHEMA_VERSION = 49
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
@@ -9,6 +9,7 @@ import contextlib
 from datetime import datetime, timedelta
 from functools import cached_property
 import logging
+from pathlib import Path
 import queue
 import sqlite3
 import threading
@@ -16,7 +17,14 @@ import time
 from typing import TYPE_CHECKING, Any, cast
 
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -44,12 +52,13 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
 )
 from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
-from . import migration, statistics
+from . import migration, partitions, statistics
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -61,11 +70,17 @@ from .const import (
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    PURGE_PROGRESS_SAVE_DELAY,
+    PURGE_PROGRESS_STORAGE_KEY,
+    PURGE_PROGRESS_STORAGE_VERSION,
+    SPOOL_QUEUE_BACKLOG,
+    SPOOL_REPLAY_BATCH_SIZE,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
 from .db_schema import (
+    PARTITIONED_TABLES,
     SCHEMA_VERSION,
     Base,
     EventData,
@@ -78,16 +93,28 @@ from .db_schema import (
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .history.cache import HistoryCache
 from .migration import (
     EntityIDMigration,
     EventIDPostMigration,
     EventsContextIDMigration,
     EventTypeIDMigration,
     StatesContextIDMigration,
+    StatisticsRollupsMigration,
+)
+from .models import (
+    VOLATILE_ATTRS_SEPARATOR,
+    DatabaseEngine,
+    StatisticData,
+    StatisticMetaData,
+    UnsupportedDialect,
 )
-from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import get_migration_changes
+from .read_pool import ReadPool, sqlite_read_only_url
+from .spool import EventSpool
+from .statistics_accumulator import StatisticsAccumulator
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -102,12 +129,14 @@ from .tasks import (
     ClearStatisticsTask,
     CommitTask,
     CompileMissingStatisticsTask,
+    CreatePartitionsTask,
     DatabaseLockTask,
     ImportStatisticsTask,
     KeepAliveTask,
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    ReplaySpoolTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -143,11 +172,13 @@ COMMIT_TASK = CommitTask()
 KEEP_ALIVE_TASK = KeepAliveTask()
 WAIT_TASK = WaitTask()
 ADJUST_LRU_SIZE_TASK = AdjustLRUSizeTask()
+REPLAY_SPOOL_TASK = ReplaySpoolTask()
 
 DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
 QUEUE_CHECK_INTERVAL = timedelta(minutes=5)
+SPOOL_CHECK_INTERVAL = timedelta(seconds=30)
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -173,6 +204,12 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        history_cache_size: int = 0,
+        db_read_urls: list[str] | None = None,
+        db_read_pool_size: int | None = None,
+        db_partitioning: bool = False,
+        db_spool_path: str | None = None,
+        split_volatile_attributes: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -190,6 +227,25 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.db_read_urls = db_read_urls or []
+        self.db_read_pool_size = db_read_pool_size
+        self.read_pools: list[ReadPool] = []
+        self.db_partitioning = db_partitioning
+        # The tables which are range partitioned, read from the database
+        # since they stay partitioned if db_partitioning is turned off
+        self.partitioned_tables: set[str] = set()
+        # Events are written to the spool instead of the
+        # database while _spooling is set
+        self._spool = (
+            EventSpool(Path(db_spool_path), lambda: self.dialect_name)
+            if db_spool_path
+            else None
+        )
+        self._spooling = False
+        # The events in the event session which are not committed yet,
+        # they are spooled if the commit fails because the database
+        # is unreachable
+        self._uncommitted_events: list[Event[Any]] = []
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -212,14 +268,37 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # States and Events are inserted with executemany instead of
+        # going through the session when the database can return the
+        # generated ids in the order the rows were inserted
+        self._bulk_insert = False
+        self._pending_bulk_states: list[States] = []
+        self._pending_bulk_events: list[Events] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
         self.event_data_manager = EventDataManager(self)
         self.event_type_manager = EventTypeManager(self)
         self.states_meta_manager = StatesMetaManager(self)
-        self.state_attributes_manager = StateAttributesManager(self)
+        self.state_attributes_manager = StateAttributesManager(
+            self, split_volatile_attributes
+        )
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        # The history cache is only enabled when a size in bytes is configured
+        self.history_cache = (
+            HistoryCache(history_cache_size) if history_cache_size else None
+        )
+        # States are only added to the history cache once they are committed
+        self._pending_history_cache: list[tuple[str, States, str]] = []
+        self.statistics_accumulator = StatisticsAccumulator()
+        # Daily and monthly statistics are read from the rollup
+        # tables once they have been built for the current time zone
+        self.statistics_rollups_ready = False
+        # Progress of the running or last purge
+        self.purge_progress: PurgeProgress | None = None
+        self._purge_progress_store: Store[dict[str, Any]] = Store(
+            hass, PURGE_PROGRESS_STORAGE_VERSION, PURGE_PROGRESS_STORAGE_KEY
+        )
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -236,6 +315,7 @@ class Recorder(threading.Thread):
         self._commit_listener: CALLBACK_TYPE | None = None
         self._periodic_listener: CALLBACK_TYPE | None = None
         self._nightly_listener: CALLBACK_TYPE | None = None
+        self._spool_listener: CALLBACK_TYPE | None = None
         self._dialect_name: SupportedDialect | None = None
         self.enabled = True
 
@@ -274,10 +354,54 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_session(self) -> Session:
+        """Get a new sqlalchemy session which is only used for reading.
+
+        Sessions are spread over the read pools if there are any, the
+        recorder thread always reads from its own connection as the
+        read pools may lag behind what it has written.
+        """
+        if not (read_pools := self.read_pools) or threading.get_ident() == (
+            self.thread_id
+        ):
+            return self.get_session()
+        return min(read_pools, key=_read_pool_load).get_session()
+
     def queue_task(self, task: RecorderTask | Event) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
 
+    def queue_statistics_rollups_rebuild(self) -> None:
+        """Rebuild the daily and monthly statistics rollups.
+
+        Statistics are read from the hourly statistics until the rebuild is done.
+        """
+        if self.statistics_rollups_ready:
+            self.statistics_rollups_ready = False
+            self.queue_task(migration.RebuildStatisticsRollupsTask())
+
+    async def async_load_purge_progress(self) -> None:
+        """Load the progress of a purge which did not finish before shutdown."""
+        if (data := await self._purge_progress_store.async_load()) is not None:
+            self.purge_progress = PurgeProgress.from_dict(data)
+
+    def save_purge_progress(self) -> None:
+        """Save the purge progress from the recorder thread."""
+        self.hass.add_job(self._async_save_purge_progress)
+
+    @callback
+    def _async_save_purge_progress(self) -> None:
+        """Save the purge progress or remove it once the purge is done."""
+        if (progress := self.purge_progress) is None:
+            return
+        if progress.done:
+            self.hass.async_create_task(self._purge_progress_store.async_remove())
+            return
+        data = progress.as_dict()
+        self._purge_progress_store.async_delay_save(
+            lambda: data, PURGE_PROGRESS_SAVE_DELAY
+        )
+
     def set_enable(self, enable: bool) -> None:
         """Enable or disable recording events and states."""
         self.enabled = enable
@@ -385,6 +509,27 @@ class Recorder(threading.Thread):
         )
         self._async_stop_queue_watcher_and_event_listener()
 
+    @callback
+    def _async_check_spool(self, *_: Any) -> None:
+        """Start spooling events if the backlog is too large or replay the spool."""
+        if self._spool is None:
+            return
+        if self._spooling:
+            # Only try to replay once the recorder has caught up with the
+            # queue, it is most likely still unable to reach the database
+            if self.backlog < SPOOL_QUEUE_BACKLOG:
+                self.queue_task(REPLAY_SPOOL_TASK)
+            return
+        if self.backlog < SPOOL_QUEUE_BACKLOG:
+            return
+        _LOGGER.warning(
+            "The recorder backlog queue reached %s events; events will be written "
+            "to the spool %s until they can be written to the database",
+            self.backlog,
+            self._spool.path,
+        )
+        self._start_spooling()
+
     def _available_memory(self) -> int:
         """Return the available memory in bytes."""
         if not self._psutil:
@@ -427,6 +572,9 @@ class Recorder(threading.Thread):
         if self._periodic_listener:
             self._periodic_listener()
             self._periodic_listener = None
+        if self._spool_listener:
+            self._spool_listener()
+            self._spool_listener = None
 
     async def _async_close(self, event: Event) -> None:
         """Empty the queue if its still present at close."""
@@ -513,11 +661,18 @@ class Recorder(threading.Thread):
         Called after all migration steps are finished.
         """
         self._async_setup_periodic_tasks()
+        if (progress := self.purge_progress) is not None and not progress.done:
+            # Resume the purge which was interrupted by the last shutdown
+            self.queue_task(
+                PurgeTask(progress.purge_before, progress.repack, progress.apply_filter)
+            )
         self.async_recorder_ready.set()
 
     @callback
     def async_nightly_tasks(self, now: datetime) -> None:
         """Trigger the purge."""
+        if self.partitioned_tables:
+            self.queue_task(CreatePartitionsTask())
         if self.auto_purge:
             # Purge will schedule the periodic cleanups
             # after it completes to ensure it does not happen
@@ -649,6 +804,14 @@ class Recorder(threading.Thread):
                 name="Recorder commit",
             )
 
+        if self._spool:
+            self._spool_listener = async_track_time_interval(
+                self.hass,
+                self._async_check_spool,
+                SPOOL_CHECK_INTERVAL,
+                name="Recorder spool",
+            )
+
         # Run nightly tasks at 4:12am
         self._nightly_listener = async_track_time_change(
             self.hass, self.async_nightly_tasks, hour=4, minute=12, second=0
@@ -696,6 +859,19 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_states_or_events(self, session: Session, obj: States | Events) -> None:
+        """Add States or Events to the session or to the pending bulk insert."""
+        # Older schemas may be missing some of the columns
+        # we insert so they always go through the session
+        if not self._bulk_insert or self.schema_version != SCHEMA_VERSION:
+            self._add_to_session(session, obj)
+            return
+        self._event_session_has_pending_writes = True
+        if type(obj) is States:
+            self._pending_bulk_states.append(obj)
+        else:
+            self._pending_bulk_events.append(cast(Events, obj))
+
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
         persistent_notification.create(
@@ -780,11 +956,14 @@ class Recorder(threading.Thread):
             self._dismiss_migration_in_progress()
             self._setup_run()
 
+        self._setup_partitions()
+
         # Catch up with missed statistics
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
         self._adjust_lru_size()
         self.hass.add_job(self._async_set_recorder_ready_migration_done)
+        self._open_spool()
         self._run_event_loop()
 
     def _activate_and_set_db_ready(
@@ -809,6 +988,7 @@ class Recorder(threading.Thread):
                 EventTypeIDMigration,
                 EntityIDMigration,
                 EventIDPostMigration,
+                StatisticsRollupsMigration,
             ):
                 migrator = migrator_cls(schema_status.start_version, migration_changes)
                 migrator.do_migrate(self, session)
@@ -885,6 +1065,11 @@ class Recorder(threading.Thread):
             # and since its never subclassed, we can
             # use a fast type check
             if type(task) is Event:
+                if self._spooling:
+                    self._spool_event(task)
+                    return
+                if self._spool is not None:
+                    self._uncommitted_events.append(task)
                 self._process_one_event(task)
                 return
             # If its not an event, commit everything
@@ -898,6 +1083,8 @@ class Recorder(threading.Thread):
             if self._handle_database_error(err, setup_run=True):
                 return
             _LOGGER.exception("Unhandled database error while processing task %s", task)
+            if isinstance(err, (exc.InternalError, exc.OperationalError)):
+                self._spool_uncommitted_events()
         except SQLAlchemyError:
             _LOGGER.exception("SQLAlchemyError error processing task %s", task)
         else:
@@ -1019,6 +1206,100 @@ class Recorder(threading.Thread):
             self.backlog,
         )
 
+    def _open_spool(self) -> None:
+        """Open the spool and keep spooling if it has events to replay."""
+        if (spool := self._spool) is None:
+            return
+        try:
+            spool.open()
+        except OSError:
+            _LOGGER.exception("Error opening the recorder spool %s", spool.path)
+            self._spool = None
+            return
+        # New events must be written after the spooled events
+        # to keep them in order
+        if spool.pending:
+            self._start_spooling()
+
+    def _start_spooling(self) -> None:
+        """Write new events to the spool until it is replayed."""
+        self._spooling = True
+        # The cache must not answer queries while states are missing
+        # from the database
+        if self.history_cache is not None:
+            self.history_cache.reset()
+        # The spooled states are replayed out of order with the
+        # compiled statistics periods
+        self.statistics_accumulator.pause()
+
+    def _stop_spooling(self) -> None:
+        """Write new events to the database again."""
+        self._spooling = False
+        self.statistics_accumulator.resume()
+
+    def _spool_uncommitted_events(self) -> None:
+        """Spool the events of the event session after the database went away.
+
+        The event session is rolled back after the failure so the
+        events would otherwise be lost.
+        """
+        events = self._uncommitted_events
+        self._uncommitted_events = []
+        if self._spool is None:
+            return
+        if not self._spooling:
+            _LOGGER.warning(
+                "The database is unreachable; events will be written to the "
+                "spool %s until they can be written to the database",
+                self._spool.path,
+            )
+            self._start_spooling()
+        for event in events:
+            self._spool_event(event)
+
+    def _spool_event(self, event: Event[Any]) -> None:
+        """Write an event to the spool."""
+        if not self.enabled:
+            return
+        assert self._spool is not None
+        try:
+            self._spool.append(event)
+        except OSError:
+            _LOGGER.exception(
+                "Error writing to the recorder spool %s; events will no longer"
+                " be spooled",
+                self._spool.path,
+            )
+            self._spool = None
+            self._stop_spooling()
+            self._process_one_event(event)
+
+    def _replay_spool(self) -> None:
+        """Write the spooled events to the database in batches.
+
+        The events stay in the spool until the batch they are in is
+        committed so they are not lost if the database goes away again.
+        """
+        if (spool := self._spool) is None or not self._spooling:
+            return
+        spool.flush()
+        try:
+            self._send_keep_alive()
+        except SQLAlchemyError as err:
+            _LOGGER.debug("Database is not reachable yet, keep spooling: %s", err)
+            self._reopen_event_session()
+            return
+        replayed = 0
+        while spool.pending:
+            events, offset = spool.read_batch(SPOOL_REPLAY_BATCH_SIZE)
+            for event in events:
+                self._process_one_event(event)
+            self._commit_event_session_or_retry()
+            spool.mark_replayed(offset)
+            replayed += len(events)
+        self._stop_spooling()
+        _LOGGER.info("Replayed %s events from the recorder spool", replayed)
+
     def _process_one_event(self, event: Event[Any]) -> None:
         if not self.enabled:
             return
@@ -1049,7 +1330,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_states_or_events(session, dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1074,7 +1355,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_states_or_events(session, dbevent)
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1111,9 +1392,12 @@ class Recorder(threading.Thread):
             dbstate.entity_id = None
 
         if entity_id is None or not (
-            shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
+            serialized_attrs := state_attributes_manager.serialize_split_from_event(
+                event
+            )
         ):
             return
+        shared_attrs_bytes, volatile_attrs_bytes = serialized_attrs
 
         # Map the entity_id to the StatesMeta table
         if pending_states_meta := states_meta_manager.get_pending(entity_id):
@@ -1135,6 +1419,8 @@ class Recorder(threading.Thread):
         # Map the event data to the StateAttributes table
         shared_attrs = shared_attrs_bytes.decode("utf-8")
         dbstate.attributes = None
+        if volatile_attrs_bytes is not None:
+            dbstate.volatile_attrs = volatile_attrs_bytes.decode("utf-8")
         # Matching attributes found in the pending commit
         if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
             dbstate.state_attributes = pending_event_data
@@ -1157,7 +1443,21 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if self.history_cache is not None and states_meta_manager.active:
+            self._pending_history_cache.append(
+                (
+                    entity_id,
+                    dbstate,
+                    shared_attrs
+                    if dbstate.volatile_attrs is None
+                    else f"{shared_attrs}{VOLATILE_ATTRS_SEPARATOR}{dbstate.volatile_attrs}",
+                )
+            )
+        self.statistics_accumulator.add(
+            event.data["new_state"], entity_id, dbstate.last_updated_ts
+        )
+
+        self._add_states_or_events(session, dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1205,6 +1505,9 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._pending_bulk_states or self._pending_bulk_events:
+            self._bulk_insert_states_and_events(session)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1222,7 +1525,13 @@ class Recorder(threading.Thread):
                 )
         session.commit()
 
+        self._uncommitted_events.clear()
         self._event_session_has_pending_writes = False
+        self._pending_bulk_states.clear()
+        self._pending_bulk_events.clear()
+        if pending_history_cache := self._pending_history_cache:
+            self._pending_history_cache = []
+            self._add_to_history_cache(pending_history_cache)
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1240,6 +1549,51 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _add_to_history_cache(self, committed: list[tuple[str, States, str]]) -> None:
+        """Add the committed states to the history cache."""
+        assert self.history_cache is not None
+        history_cache = self.history_cache
+        for entity_id, dbstate, attributes in committed:
+            history_cache.add(
+                entity_id,
+                dbstate.state_id,
+                dbstate.state,
+                dbstate.last_updated_ts,
+                dbstate.last_changed_ts,
+                attributes,
+            )
+
+    def _bulk_insert_states_and_events(self, session: Session) -> None:
+        """Insert the pending States and Events with executemany.
+
+        The StatesMeta, StateAttributes, EventTypes and EventData rows
+        the new rows reference are flushed first so their ids are known.
+        """
+        session.flush()
+        if events := self._pending_bulk_events:
+            session.execute(
+                insert(Events), [_event_insert_params(dbevent) for dbevent in events]
+            )
+        if not (states := self._pending_bulk_states):
+            return
+        state_ids = session.scalars(
+            insert(States).returning(States.state_id, sort_by_parameter_order=True),
+            [_state_insert_params(dbstate) for dbstate in states],
+        ).all()
+        for dbstate, state_id in zip(states, state_ids, strict=True):
+            dbstate.state_id = state_id
+        # The old state of a state inserted in the same batch
+        # did not have a state_id yet when it was inserted
+        if old_state_ids := [
+            {"state_id": dbstate.state_id, "old_state_id": old_state.state_id}
+            for dbstate in states
+            if dbstate.old_state_id is None
+            and (old_state := dbstate.old_state) is not None
+            and old_state.state_id is not None
+        ]:
+            with session.no_autoflush:
+                session.execute(update(States), old_state_ids)
+
     def _handle_sqlite_corruption(self, setup_run: bool) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1260,6 +1614,15 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self._pending_bulk_states.clear()
+        self._pending_bulk_events.clear()
+        self._pending_history_cache.clear()
+        self._uncommitted_events.clear()
+        self._event_session_has_pending_writes = False
+        # Pending states may be rolled back so the cache
+        # can no longer be trusted to match the database
+        if self.history_cache is not None:
+            self.history_cache.reset()
 
         if not self.event_session:
             return
@@ -1389,23 +1752,8 @@ class Recorder(threading.Thread):
             kwargs["recorder_and_worker_thread_ids"] = (
                 self.recorder_and_worker_thread_ids
             )
-        elif self.db_url.startswith(
-            (
-                MARIADB_URL_PREFIX,
-                MARIADB_PYMYSQL_URL_PREFIX,
-                MYSQLDB_URL_PREFIX,
-                MYSQLDB_PYMYSQL_URL_PREFIX,
-            )
-        ):
-            kwargs["connect_args"] = {"charset": "utf8mb4"}
-            if self.db_url.startswith((MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)):
-                # If they have configured MySQLDB but don't have
-                # the MySQLDB module installed this will throw
-                # an ImportError which we suppress here since
-                # sqlalchemy will give them a better error when
-                # it tried to import it below.
-                with contextlib.suppress(ImportError):
-                    kwargs["connect_args"]["conv"] = build_mysqldb_conv()
+        elif _is_mysql_url(self.db_url):
+            kwargs["connect_args"] = _mysql_connect_args(self.db_url)
 
         # Disable extended logging for non SQLite databases
         if not self.db_url.startswith(SQLITE_URL_PREFIX):
@@ -1423,15 +1771,67 @@ class Recorder(threading.Thread):
         migration.pre_migrate_schema(self.engine)
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
+        self._bulk_insert = (
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
+        self._setup_read_pools()
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_read_pools(self) -> None:
+        """Set up the pools of connections used for reading."""
+        pool_size = self.db_read_pool_size or POOL_SIZE
+        read_urls = self.db_read_urls
+        if not read_urls and self.db_read_pool_size and self._using_file_sqlite:
+            read_urls = [sqlite_read_only_url(self.db_url)]
+        for url in read_urls:
+            connect_args: dict[str, Any] = {}
+            if url.startswith(SQLITE_URL_PREFIX):
+                connect_args["check_same_thread"] = False
+            elif _is_mysql_url(url):
+                connect_args = _mysql_connect_args(url)
+            self.read_pools.append(ReadPool(self, url, pool_size, connect_args))
+
     def _close_connection(self) -> None:
         """Close the connection."""
+        for read_pool in self.read_pools:
+            read_pool.dispose()
+        self.read_pools = []
         if self.engine:
             self.engine.dispose()
             self.engine = None
         self._get_session = None
 
+    def _setup_partitions(self) -> None:
+        """Partition the tables if enabled and create the upcoming partitions."""
+        if self.dialect_name != SupportedDialect.POSTGRESQL:
+            if self.db_partitioning:
+                _LOGGER.warning(
+                    "Partitioning the database tables is only supported with"
+                    " PostgreSQL, the tables will not be partitioned"
+                )
+            return
+        with session_scope(session=self.get_session(), read_only=True) as session:
+            self.partitioned_tables = partitions.get_partitioned_tables(session)
+        if self.db_partitioning and (
+            unpartitioned_tables := PARTITIONED_TABLES.keys() - self.partitioned_tables
+        ):
+            migration.migrate_to_partitioned_tables(
+                self.get_session, sorted(unpartitioned_tables)
+            )
+            with session_scope(session=self.get_session(), read_only=True) as session:
+                self.partitioned_tables = partitions.get_partitioned_tables(session)
+        self._create_partitions()
+
+    def _create_partitions(self) -> None:
+        """Create the upcoming partitions of the partitioned tables."""
+        now = dt_util.utcnow()
+        for table in sorted(self.partitioned_tables):
+            try:
+                with session_scope(session=self.get_session()) as session:
+                    partitions.create_partitions(session, table, now)
+            except SQLAlchemyError:
+                _LOGGER.exception("Error creating the partitions of %s", table)
+
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
         with session_scope(session=self.get_session()) as session:
@@ -1476,6 +1876,8 @@ class Recorder(threading.Thread):
         try:
             self._end_session()
         finally:
+            if self._spool:
+                self._spool.close()
             if self._db_executor:
                 # We shutdown the executor without forcefully
                 # joining the threads until after we have tried
@@ -1486,3 +1888,84 @@ class Recorder(threading.Thread):
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
                 self._db_executor.join_threads_or_timeout()
+
+
+def _read_pool_load(read_pool: ReadPool) -> int:
+    """Return the load of a read pool."""
+    return read_pool.load
+
+
+def _is_mysql_url(db_url: str) -> bool:
+    """Return if the URL is a MariaDB or MySQL URL."""
+    return db_url.startswith(
+        (
+            MARIADB_URL_PREFIX,
+            MARIADB_PYMYSQL_URL_PREFIX,
+            MYSQLDB_URL_PREFIX,
+            MYSQLDB_PYMYSQL_URL_PREFIX,
+        )
+    )
+
+
+def _mysql_connect_args(db_url: str) -> dict[str, Any]:
+    """Return the connect args for a MariaDB or MySQL URL."""
+    connect_args: dict[str, Any] = {"charset": "utf8mb4"}
+    if db_url.startswith((MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)):
+        # If they have configured MySQLDB but don't have
+        # the MySQLDB module installed this will throw
+        # an ImportError which we suppress here since
+        # sqlalchemy will give them a better error when
+        # it tried to import it below.
+        with contextlib.suppress(ImportError):
+            connect_args["conv"] = build_mysqldb_conv()
+    return connect_args
+
+
+def _event_insert_params(dbevent: Events) -> dict[str, Any]:
+    """Return the insert parameters for an Events row."""
+    if (event_type_id := dbevent.event_type_id) is None and (
+        event_types := dbevent.event_type_rel
+    ):
+        event_type_id = event_types.event_type_id
+    if (data_id := dbevent.data_id) is None and (event_data := dbevent.event_data_rel):
+        data_id = event_data.data_id
+    return {
+        "origin_idx": dbevent.origin_idx,
+        "time_fired_ts": dbevent.time_fired_ts,
+        "context_id_bin": dbevent.context_id_bin,
+        "context_user_id_bin": dbevent.context_user_id_bin,
+        "context_parent_id_bin": dbevent.context_parent_id_bin,
+        "event_type_id": event_type_id,
+        "data_id": data_id,
+    }
+
+
+def _state_insert_params(dbstate: States) -> dict[str, Any]:
+    """Return the insert parameters for a States row."""
+    if (metadata_id := dbstate.metadata_id) is None and (
+        states_meta := dbstate.states_meta_rel
+    ):
+        metadata_id = states_meta.metadata_id
+    if (attributes_id := dbstate.attributes_id) is None and (
+        state_attributes := dbstate.state_attributes
+    ):
+        attributes_id = state_attributes.attributes_id
+    if (old_state_id := dbstate.old_state_id) is None and (
+        old_state := dbstate.old_state
+    ):
+        old_state_id = old_state.state_id
+    return {
+        "entity_id": dbstate.entity_id,
+        "state": dbstate.state,
+        "last_updated_ts": dbstate.last_updated_ts,
+        "last_changed_ts": dbstate.last_changed_ts,
+        "last_reported_ts": dbstate.last_reported_ts,
+        "old_state_id": old_state_id,
+        "attributes_id": attributes_id,
+        "volatile_attrs": dbstate.volatile_attrs,
+        "origin_idx": dbstate.origin_idx,
+        "context_id_bin": dbstate.context_id_bin,
+        "context_user_id_bin": dbstate.context_user_id_bin,
+        "context_parent_id_bin": dbstate.context_parent_id_bin,
+        "metadata_id": metadata_id,
+    }
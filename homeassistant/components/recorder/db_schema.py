@@ -56,6 +56,7 @@ from homeassistant.util.json import (
 
 from .const import ALL_DOMAIN_EXCLUDE_ATTRS, SupportedDialect
 from .models import (
+    VOLATILE_ATTRS_SEPARATOR,
     StatisticData,
     StatisticDataTimestamp,
     StatisticMetaData,
@@ -77,7 +78,7 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 47
+SCHEMA_VERSION = 49
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -93,6 +94,8 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAILY = "statistics_daily"
+TABLE_STATISTICS_MONTHLY = "statistics_monthly"
 TABLE_MIGRATION_CHANGES = "migration_changes"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
@@ -116,6 +119,8 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
 ]
 
 TABLES_TO_CHECK = [
@@ -125,6 +130,14 @@ TABLES_TO_CHECK = [
     TABLE_SCHEMA_CHANGES,
 ]
 
+# Tables which are range partitioned by day when db_partitioning is enabled
+# on PostgreSQL, mapped to the timestamp column they are partitioned by.
+PARTITIONED_TABLES = {
+    TABLE_STATES: "last_updated_ts",
+    TABLE_EVENTS: "time_fired_ts",
+    TABLE_STATISTICS_SHORT_TERM: "start_ts",
+}
+
 LAST_UPDATED_INDEX_TS = "ix_states_last_updated_ts"
 METADATA_ID_LAST_UPDATED_INDEX_TS = "ix_states_metadata_id_last_updated_ts"
 EVENTS_CONTEXT_ID_BIN_INDEX = "ix_events_context_id_bin"
@@ -474,6 +487,9 @@ class States(Base):
         ID_TYPE, ForeignKey("states_meta.metadata_id")
     )
     states_meta_rel: Mapped[StatesMeta | None] = relationship("StatesMeta")
+    # The attributes which change on most updates of the entity, they are
+    # stored with the state to keep the shared attributes deduplicated
+    volatile_attrs: Mapped[str | None] = mapped_column(Text)
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -604,6 +620,13 @@ class StateAttributes(Base):
         # None state means the state was removed from the state machine
         if (state := event.data["new_state"]) is None:
             return b"{}"
+        return StateAttributes.attrs_bytes(
+            state, StateAttributes.recorded_attributes(state), dialect
+        )
+
+    @staticmethod
+    def recorded_attributes(state: State) -> dict[str, Any]:
+        """Return the attributes of a state which are recorded."""
         if state_info := state.state_info:
             unrecorded_attributes = state_info["unrecorded_attributes"]
             exclude_attrs = {
@@ -617,10 +640,15 @@ class StateAttributes(Base):
                 exclude_attrs -= _MATCH_ALL_KEEP
         else:
             exclude_attrs = ALL_DOMAIN_EXCLUDE_ATTRS
+        return {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
+
+    @staticmethod
+    def attrs_bytes(
+        state: State, attributes: dict[str, Any], dialect: SupportedDialect | None
+    ) -> bytes:
+        """Serialize the recorded attributes of a state."""
         encoder = json_bytes_strip_null if dialect == PSQL_DIALECT else json_bytes
-        bytes_result = encoder(
-            {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
-        )
+        bytes_result = encoder(attributes)
         if len(bytes_result) > MAX_STATE_ATTRS_BYTES:
             _LOGGER.warning(
                 "State attributes for %s exceed maximum size of %s bytes. "
@@ -790,6 +818,50 @@ class LegacyStatisticsShortTerm(LegacyBase, _StatisticsShortTerm):
     )
 
 
+class _StatisticsRollup(StatisticsBase):
+    """Long term statistics rolled up to longer periods."""
+
+    # The number of hourly means which were rolled up, used to
+    # weigh the daily means when rolling them up to months
+    mean_count: Mapped[int | None] = mapped_column(Integer)
+
+
+class StatisticsDaily(Base, _StatisticsRollup):
+    """Long term statistics rolled up to days in the configured time zone."""
+
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_daily_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_DAILY
+
+
+class StatisticsMonthly(Base, _StatisticsRollup):
+    """Long term statistics rolled up to months in the configured time zone."""
+
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_monthly_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_MONTHLY
+
+
 class _StatisticsMeta:
     """Statistics meta data."""
 
@@ -927,6 +999,13 @@ SHARED_ATTR_OR_LEGACY_ATTRIBUTES = case(
     (StateAttributes.shared_attrs.is_(None), States.attributes),
     else_=StateAttributes.shared_attrs,
 ).label("attributes")
+SHARED_AND_VOLATILE_ATTRS_OR_LEGACY_ATTRIBUTES = case(
+    (StateAttributes.shared_attrs.is_(None), States.attributes),
+    (States.volatile_attrs.is_(None), StateAttributes.shared_attrs),
+    else_=StateAttributes.shared_attrs
+    + VOLATILE_ATTRS_SEPARATOR
+    + States.volatile_attrs,
+).label("attributes")
 SHARED_DATA_OR_LEGACY_EVENT_DATA = case(
     (EventData.shared_data.is_(None), Events.event_data), else_=EventData.shared_data
 ).label("event_data")
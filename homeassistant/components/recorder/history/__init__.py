@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
@@ -11,12 +12,14 @@ from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.recorder import get_instance
 
 from ..filters import Filters
+from ..util import DEFAULT_YIELD_STATES_ROWS
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
+    iter_significant_states_chunks as _modern_iter_significant_states_chunks,
     state_changes_during_period as _modern_state_changes_during_period,
 )
 
@@ -28,6 +31,7 @@ __all__ = [
     "get_last_state_changes",
     "get_significant_states",
     "get_significant_states_with_session",
+    "iter_significant_states_chunks",
     "state_changes_during_period",
 ]
 
@@ -152,6 +156,63 @@ def get_significant_states_with_session(
     )
 
 
+def iter_significant_states_chunks(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    chunk_size: int = DEFAULT_YIELD_STATES_ROWS,
+    cursor: tuple[int, float, int] | None = None,
+) -> Iterator[
+    tuple[tuple[int, float, int] | None, dict[str, list[State | dict[str, Any]]]]
+]:
+    """Yield dicts of significant states during a time period in chunks.
+
+    Each chunk is yielded with the cursor to pass to continue after it.
+    """
+    if get_instance(hass).states_meta_manager.active:
+        yield from _modern_iter_significant_states_chunks(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+            chunk_size,
+            cursor,
+        )
+        return
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states as _legacy_get_significant_states,
+    )
+
+    # The legacy schema is only used until the migration has finished
+    # so it is not worth streaming the rows, everything is one chunk
+    if cursor is None and (
+        states := _legacy_get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+    ):
+        yield None, states
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
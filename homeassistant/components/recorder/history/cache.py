@@ -0,0 +1,342 @@
+"""In-memory columnar cache of recent state history."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import timedelta
+import sys
+import threading
+from typing import Any, NamedTuple
+
+from homeassistant.core import split_entity_id
+
+from .const import SIGNIFICANT_DOMAINS
+
+# How much history we keep for each entity. This covers the
+# default 24 hour window requested by the frontend with some
+# room for the start time state.
+HISTORY_CACHE_MAX_AGE = timedelta(hours=25).total_seconds()
+
+# Only trim the leading rows of a timeline once at least this many
+# of them are older than HISTORY_CACHE_MAX_AGE to amortize the cost
+# of shifting the arrays.
+TRIM_THRESHOLD = 64
+
+# Estimated memory used by a single row in a timeline: 2 doubles, a
+# state_id, a pointer to the interned state string and an attributes index
+ROW_SIZE = 8 + 8 + 8 + 8 + 4
+# Estimated fixed overhead of a timeline
+TIMELINE_SIZE = 512
+
+# Rows returned from the cache mimic the rows returned by the
+# queries in modern.py so they can be passed to _sorted_states_to_dict
+
+
+class _CachedRow(NamedTuple):
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    state_id: int
+
+
+class _CachedRowWithLastChanged(NamedTuple):
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    state_id: int
+
+
+class _CachedRowWithAttributes(NamedTuple):
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    attributes: str
+    state_id: int
+
+
+class _CachedRowWithLastChangedAndAttributes(NamedTuple):
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    attributes: str
+    state_id: int
+
+
+_ROW_TYPES: dict[tuple[bool, bool], type[tuple]] = {
+    (False, False): _CachedRow,
+    (True, False): _CachedRowWithLastChanged,
+    (False, True): _CachedRowWithAttributes,
+    (True, True): _CachedRowWithLastChangedAndAttributes,
+}
+
+
+@dataclass(slots=True)
+class HistoryCacheStats:
+    """Statistics about the history cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class _EntityTimeline:
+    """Columnar timeline of the recorded states of a single entity."""
+
+    __slots__ = (
+        "last_updated_ts",
+        "last_changed_ts",
+        "state_ids",
+        "states",
+        "attributes_ids",
+        "attributes",
+        "attributes_to_id",
+        "size",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the timeline."""
+        self.last_updated_ts = array("d")
+        # 0.0 is stored when last_changed is the same as last_updated
+        self.last_changed_ts = array("d")
+        self.state_ids = array("Q")
+        self.states: list[str | None] = []
+        self.attributes_ids = array("I")
+        self.attributes: list[str] = []
+        self.attributes_to_id: dict[str, int] = {}
+        self.size = TIMELINE_SIZE
+
+    def append(
+        self,
+        state_id: int,
+        state: str | None,
+        last_updated_ts: float,
+        last_changed_ts: float | None,
+        shared_attrs: str,
+    ) -> int:
+        """Append a row and return the number of bytes added."""
+        added = ROW_SIZE
+        if (attributes_id := self.attributes_to_id.get(shared_attrs)) is None:
+            attributes_id = self.attributes_to_id[shared_attrs] = len(self.attributes)
+            self.attributes.append(shared_attrs)
+            added += sys.getsizeof(shared_attrs)
+        self.last_updated_ts.append(last_updated_ts)
+        self.last_changed_ts.append(last_changed_ts or 0.0)
+        self.state_ids.append(state_id)
+        self.states.append(sys.intern(state) if state is not None else None)
+        self.attributes_ids.append(attributes_id)
+        self.size += added
+        return added
+
+    def trim(self, oldest_ts: float) -> int:
+        """Drop rows that are no longer needed and return the number of bytes freed.
+
+        The newest row before oldest_ts is kept since it is
+        the state at the start of the cached window.
+        """
+        if (idx := bisect_left(self.last_updated_ts, oldest_ts) - 1) < TRIM_THRESHOLD:
+            return 0
+        del self.last_updated_ts[:idx]
+        del self.last_changed_ts[:idx]
+        del self.state_ids[:idx]
+        del self.states[:idx]
+        del self.attributes_ids[:idx]
+        freed = idx * ROW_SIZE
+        if len(self.attributes) > len(self.attributes_ids):
+            # More unique attributes than rows left, rebuild
+            # the attributes table to release the unused ones
+            freed += self._compact_attributes()
+        self.size -= freed
+        return freed
+
+    def _compact_attributes(self) -> int:
+        """Drop attributes that are no longer referenced."""
+        old_attributes = self.attributes
+        self.attributes = []
+        self.attributes_to_id = {}
+        new_ids = array("I")
+        for attributes_id in self.attributes_ids:
+            shared_attrs = old_attributes[attributes_id]
+            if (new_id := self.attributes_to_id.get(shared_attrs)) is None:
+                new_id = self.attributes_to_id[shared_attrs] = len(self.attributes)
+                self.attributes.append(shared_attrs)
+            new_ids.append(new_id)
+        self.attributes_ids = new_ids
+        return sum(sys.getsizeof(attrs) for attrs in old_attributes) - sum(
+            sys.getsizeof(attrs) for attrs in self.attributes
+        )
+
+
+class HistoryCache:
+    """Cache the recent state history of entities in memory.
+
+    The cache is fed from the recorder thread with every state
+    that is written to the database and is read from the
+    database executor threads when history is requested.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the history cache with a max size in bytes."""
+        self.max_size = max_size
+        self.size = 0
+        self.stats = HistoryCacheStats()
+        # Ordered by when the timeline was last queried
+        # so the least recently queried ones are evicted first
+        self._timelines: OrderedDict[str, _EntityTimeline] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached entities."""
+        return len(self._timelines)
+
+    def add(
+        self,
+        entity_id: str,
+        state_id: int,
+        state: str | None,
+        last_updated_ts: float,
+        last_changed_ts: float | None,
+        shared_attrs: str,
+    ) -> None:
+        """Add a recorded state to the cache."""
+        with self._lock:
+            if (timeline := self._timelines.get(entity_id)) is None:
+                timeline = self._timelines[entity_id] = _EntityTimeline()
+                self.size += timeline.size
+            elif timeline.last_updated_ts[-1] > last_updated_ts:
+                # Time went backwards, we can no longer
+                # answer queries for this entity
+                self.size -= self._timelines.pop(entity_id).size
+                return
+            self.size += timeline.append(
+                state_id, state, last_updated_ts, last_changed_ts, shared_attrs
+            )
+            self.size -= timeline.trim(last_updated_ts - HISTORY_CACHE_MAX_AGE)
+            while self.size > self.max_size and self._timelines:
+                self.size -= self._timelines.popitem(last=False)[1].size
+                self.stats.evictions += 1
+
+    def invalidate(self, entity_ids: Iterable[str]) -> None:
+        """Remove entities from the cache."""
+        with self._lock:
+            for entity_id in entity_ids:
+                if (timeline := self._timelines.pop(entity_id, None)) is not None:
+                    self.size -= timeline.size
+
+    def purge(
+        self,
+        purge_before_ts: float,
+        entity_filter: Callable[[str], bool] | None = None,
+    ) -> None:
+        """Remove entities that may have had rows purged from the database."""
+        with self._lock:
+            purged_entity_ids = [
+                entity_id
+                for entity_id, timeline in self._timelines.items()
+                if timeline.last_updated_ts[0] < purge_before_ts
+                and (entity_filter is None or entity_filter(entity_id))
+            ]
+            for entity_id in purged_entity_ids:
+                self.size -= self._timelines.pop(entity_id).size
+
+    def reset(self) -> None:
+        """Remove everything from the cache."""
+        with self._lock:
+            self._timelines.clear()
+            self.size = 0
+
+    def get_significant_states_rows(
+        self,
+        entity_id_to_metadata_id: dict[str, int | None],
+        start_time_ts: float,
+        end_time_ts: float | None,
+        significant_changes_only: bool,
+        no_attributes: bool,
+        include_start_time_state: bool,
+        run_start_ts: float | None,
+    ) -> list[tuple] | None:
+        """Return the rows for a significant states query.
+
+        Returns None if the cache does not fully cover the
+        requested window for all entities.
+        """
+        include_last_changed = not significant_changes_only
+        row_type = _ROW_TYPES[(include_last_changed, not no_attributes)]
+        # The database only looks for the start time state in the current
+        # run when more than one entity is requested
+        min_start_state_ts = (
+            run_start_ts
+            if run_start_ts is not None
+            and sum(
+                metadata_id is not None
+                for metadata_id in entity_id_to_metadata_id.values()
+            )
+            > 1
+            else 0.0
+        )
+        rows: list[tuple] = []
+        with self._lock:
+            timelines = self._timelines
+            covered: list[tuple[int, str, _EntityTimeline]] = []
+            for entity_id, metadata_id in entity_id_to_metadata_id.items():
+                if metadata_id is None:
+                    continue
+                if (
+                    timeline := timelines.get(entity_id)
+                ) is None or timeline.last_updated_ts[0] >= start_time_ts:
+                    self.stats.misses += 1
+                    return None
+                covered.append((metadata_id, entity_id, timeline))
+            self.stats.hits += 1
+            for metadata_id, entity_id, timeline in covered:
+                timelines.move_to_end(entity_id)
+                last_updated = timeline.last_updated_ts
+                last_changed = timeline.last_changed_ts
+                state_ids = timeline.state_ids
+                states = timeline.states
+                attributes_ids = timeline.attributes_ids
+                attributes = timeline.attributes
+                # The timeline starts before start_time_ts so there
+                # is always a row for the state at the start time
+                start_state_idx = bisect_left(last_updated, start_time_ts) - 1
+                if (
+                    include_start_time_state
+                    and last_updated[start_state_idx] >= min_start_state_ts
+                ):
+                    start_row: list[Any] = [metadata_id, states[start_state_idx], 0]
+                    if include_last_changed:
+                        start_row.append(0)
+                    if not no_attributes:
+                        start_row.append(attributes[attributes_ids[start_state_idx]])
+                    start_row.append(0)
+                    rows.append(row_type(*start_row))
+                start_idx = bisect_right(last_updated, start_time_ts)
+                end_idx = (
+                    bisect_left(last_updated, end_time_ts)
+                    if end_time_ts
+                    else len(last_updated)
+                )
+                significant_domain = (
+                    split_entity_id(entity_id)[0] in SIGNIFICANT_DOMAINS
+                )
+                for idx in range(start_idx, end_idx):
+                    if (
+                        significant_changes_only
+                        and not significant_domain
+                        and last_changed[idx]
+                        and last_changed[idx] != last_updated[idx]
+                    ):
+                        continue
+                    row: list[Any] = [metadata_id, states[idx], last_updated[idx]]
+                    if include_last_changed:
+                        row.append(last_changed[idx] or None)
+                    if not no_attributes:
+                        row.append(attributes[attributes_ids[idx]])
+                    row.append(state_ids[idx])
+                    rows.append(row_type(*row))
+        return rows
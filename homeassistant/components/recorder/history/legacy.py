@@ -166,7 +166,7 @@ def get_significant_states(
     compressed_state_format: bool = False,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
-    with session_scope(hass=hass, read_only=True) as session:
+    with session_scope(hass=hass, read_only=True, replica=True) as session:
         return get_significant_states_with_session(
             hass,
             session,
@@ -364,7 +364,7 @@ def state_changes_during_period(
     if not entity_id:
         raise ValueError("entity_id must be provided")
     entity_ids = [entity_id.lower()]
-    with session_scope(hass=hass, read_only=True) as session:
+    with session_scope(hass=hass, read_only=True, replica=True) as session:
         stmt = _state_changed_during_period_stmt(
             start_time,
             end_time,
@@ -419,7 +419,7 @@ def get_last_state_changes(
     entity_id_lower = entity_id.lower()
     entity_ids = [entity_id_lower]
 
-    with session_scope(hass=hass, read_only=True) as session:
+    with session_scope(hass=hass, read_only=True, replica=True) as session:
         stmt = _get_last_state_changes_stmt(number_of_states, entity_id_lower)
         states = list(execute_stmt_lambda_element(session, stmt))
         return cast(
@@ -4,18 +4,20 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
-from itertools import groupby
+from itertools import batched, groupby
 from operator import itemgetter
 from typing import Any, cast
 
 from sqlalchemy import (
     CompoundSelect,
+    Label,
     Select,
     Subquery,
     and_,
     func,
     lambda_stmt,
     literal,
+    or_,
     select,
     union_all,
 )
@@ -27,8 +29,13 @@ from homeassistant.core import HomeAssistant, State, split_entity_id
 from homeassistant.helpers.recorder import get_instance
 import homeassistant.util.dt as dt_util
 
-from ..const import LAST_REPORTED_SCHEMA_VERSION
-from ..db_schema import SHARED_ATTR_OR_LEGACY_ATTRIBUTES, StateAttributes, States
+from ..const import LAST_REPORTED_SCHEMA_VERSION, VOLATILE_ATTRS_SCHEMA_VERSION
+from ..db_schema import (
+    SHARED_AND_VOLATILE_ATTRS_OR_LEGACY_ATTRIBUTES,
+    SHARED_ATTR_OR_LEGACY_ATTRIBUTES,
+    StateAttributes,
+    States,
+)
 from ..filters import Filters
 from ..models import (
     LazyState,
@@ -37,7 +44,7 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
-from ..util import execute_stmt_lambda_element, session_scope
+from ..util import DEFAULT_YIELD_STATES_ROWS, execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
@@ -56,6 +63,7 @@ def _stmt_and_join_attributes(
     no_attributes: bool,
     include_last_changed: bool,
     include_last_reported: bool,
+    include_volatile_attrs: bool,
 ) -> Select:
     """Return the statement and if StateAttributes should be joined."""
     _select = select(States.metadata_id, States.state, States.last_updated_ts)
@@ -64,7 +72,7 @@ def _stmt_and_join_attributes(
     if include_last_reported:
         _select = _select.add_columns(States.last_reported_ts)
     if not no_attributes:
-        _select = _select.add_columns(SHARED_ATTR_OR_LEGACY_ATTRIBUTES)
+        _select = _select.add_columns(_attributes_column(include_volatile_attrs))
     return _select
 
 
@@ -72,6 +80,7 @@ def _stmt_and_join_attributes_for_start_state(
     no_attributes: bool,
     include_last_changed: bool,
     include_last_reported: bool,
+    include_volatile_attrs: bool,
 ) -> Select:
     """Return the statement and if StateAttributes should be joined."""
     _select = select(States.metadata_id, States.state)
@@ -81,10 +90,21 @@ def _stmt_and_join_attributes_for_start_state(
     if include_last_reported:
         _select = _select.add_columns(literal(value=0).label("last_reported_ts"))
     if not no_attributes:
-        _select = _select.add_columns(SHARED_ATTR_OR_LEGACY_ATTRIBUTES)
+        _select = _select.add_columns(_attributes_column(include_volatile_attrs))
     return _select
 
 
+def _attributes_column(include_volatile_attrs: bool) -> Label:
+    """Return the column of the attributes.
+
+    The volatile attributes can only be selected once the
+    states table has the volatile_attrs column.
+    """
+    if include_volatile_attrs:
+        return SHARED_AND_VOLATILE_ATTRS_OR_LEGACY_ATTRIBUTES
+    return SHARED_ATTR_OR_LEGACY_ATTRIBUTES
+
+
 def _select_from_subquery(
     subquery: Subquery | CompoundSelect,
     no_attributes: bool,
@@ -119,7 +139,7 @@ def get_significant_states(
     compressed_state_format: bool = False,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
-    with session_scope(hass=hass, read_only=True) as session:
+    with session_scope(hass=hass, read_only=True, replica=True) as session:
         return get_significant_states_with_session(
             hass,
             session,
@@ -145,10 +165,13 @@ def _significant_states_stmt(
     no_attributes: bool,
     include_start_time_state: bool,
     run_start_ts: float | None,
+    include_volatile_attrs: bool,
 ) -> Select | CompoundSelect:
     """Query the database for significant state changes."""
     include_last_changed = not significant_changes_only
-    stmt = _stmt_and_join_attributes(no_attributes, include_last_changed, False)
+    stmt = _stmt_and_join_attributes(
+        no_attributes, include_last_changed, False, include_volatile_attrs
+    )
     if significant_changes_only:
         # Since we are filtering on entity_id (metadata_id) we can avoid
         # the join of the states_meta table since we already know which
@@ -173,8 +196,14 @@ def _significant_states_stmt(
         stmt = stmt.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
+    # The state_id makes the sort order unique so the chunk cursor
+    # does not skip rows of an entity with the same last_updated_ts
+    stmt = stmt.add_columns(States.state_id)
     if not include_start_time_state or not run_start_ts:
-        return stmt.order_by(States.metadata_id, States.last_updated_ts)
+        return stmt.order_by(
+            States.metadata_id, States.last_updated_ts, States.state_id
+        )
+    states_subquery = stmt.subquery()
     unioned_subquery = union_all(
         _select_from_subquery(
             _get_start_time_state_stmt(
@@ -184,21 +213,54 @@ def _significant_states_stmt(
                 metadata_ids,
                 no_attributes,
                 include_last_changed,
+                include_volatile_attrs,
             ).subquery(),
             no_attributes,
             include_last_changed,
             False,
-        ),
+        ).add_columns(literal(value=0).label("state_id")),
         _select_from_subquery(
-            stmt.subquery(), no_attributes, include_last_changed, False
-        ),
+            states_subquery, no_attributes, include_last_changed, False
+        ).add_columns(states_subquery.c.state_id),
     ).subquery()
-    return _select_from_subquery(
-        unioned_subquery,
-        no_attributes,
-        include_last_changed,
-        False,
-    ).order_by(unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts)
+    return (
+        _select_from_subquery(
+            unioned_subquery,
+            no_attributes,
+            include_last_changed,
+            False,
+        )
+        .add_columns(unioned_subquery.c.state_id)
+        .order_by(
+            unioned_subquery.c.metadata_id,
+            unioned_subquery.c.last_updated_ts,
+            unioned_subquery.c.state_id,
+        )
+    )
+
+
+def _after_cursor(
+    metadata_id_column: Any,
+    last_updated_ts_column: Any,
+    state_id_column: Any,
+    cursor_metadata_id: int,
+    cursor_last_updated_ts: float,
+    cursor_state_id: int,
+) -> Any:
+    """Return the clause selecting the rows sorted after the cursor."""
+    return or_(
+        metadata_id_column > cursor_metadata_id,
+        and_(
+            metadata_id_column == cursor_metadata_id,
+            or_(
+                last_updated_ts_column > cursor_last_updated_ts,
+                and_(
+                    last_updated_ts_column == cursor_last_updated_ts,
+                    state_id_column > cursor_state_id,
+                ),
+            ),
+        ),
+    )
 
 
 def get_significant_states_with_session(
@@ -229,7 +291,130 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
-    entity_id_to_metadata_id: dict[str, int | None] | None = None
+    if (
+        significant_states := _significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+            None,
+        )
+    ) is None:
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = significant_states
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def iter_significant_states_chunks(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    chunk_size: int = DEFAULT_YIELD_STATES_ROWS,
+    cursor: tuple[int, float, int] | None = None,
+) -> Iterator[tuple[tuple[int, float, int], dict[str, list[State | dict[str, Any]]]]]:
+    """Yield the significant states during UTC period start_time - end_time in chunks.
+
+    The rows are fetched with a server side cursor and every chunk holds
+    the states of at most chunk_size rows, so the memory used does not
+    depend on the length of the period. The states of an entity may be
+    split over consecutive chunks, with minimal_response the first state
+    of each chunk is a full state.
+
+    Each chunk is yielded together with the metadata_id, last_updated_ts
+    and state_id of its last row, which can be passed as cursor to continue
+    after the chunk. The cursor is a position in the sort order of the rows, so
+    rows recorded or purged in the meantime do not shift it.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True, replica=True) as session:
+        if (
+            significant_states := _significant_states_rows(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+                chunk_size,
+                cursor,
+            )
+        ) is None:
+            return
+        rows, start_time_ts, entity_id_to_metadata_id = significant_states
+        metadata_id_idx = _FIELD_MAP["metadata_id"]
+        last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+        metadata_id_to_entity_id = {
+            v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+        }
+        for chunk in batched(rows, chunk_size):
+            # Keep the order of the requested entity_ids within the chunk
+            chunk_entity_ids = {
+                metadata_id_to_entity_id[row[metadata_id_idx]] for row in chunk
+            }
+            last_row = chunk[-1]
+            yield (
+                (
+                    last_row[metadata_id_idx],
+                    last_row[last_updated_ts_idx],
+                    last_row.state_id,
+                ),
+                _sorted_states_to_dict(
+                    chunk,
+                    start_time_ts,
+                    [
+                        entity_id
+                        for entity_id in entity_ids
+                        if entity_id in chunk_entity_ids
+                    ],
+                    entity_id_to_metadata_id,
+                    minimal_response,
+                    compressed_state_format,
+                    no_attributes=no_attributes,
+                ),
+            )
+
+
+def _significant_states_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    yield_per: int | None,
+    cursor: tuple[int, float, int] | None = None,
+) -> tuple[Iterable[Row], float | None, dict[str, int | None]] | None:
+    """Return the significant states rows sorted by metadata_id and last_updated.
+
+    Returns None if none of the entities has ever been recorded. If
+    yield_per is given the rows are streamed with a server side cursor
+    fetching yield_per rows at a time. If a cursor of metadata_id,
+    last_updated_ts and state_id is given, only the rows sorted after it
+    are returned.
+    """
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
     if not (
@@ -237,7 +422,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -253,7 +438,30 @@ def get_significant_states_with_session(
         include_start_time_state = False
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
+    result_start_time_ts = start_time_ts if include_start_time_state else None
+    if (history_cache := instance.history_cache) is not None and (
+        cached_rows := history_cache.get_significant_states_rows(
+            entity_id_to_metadata_id,
+            start_time_ts,
+            end_time_ts,
+            significant_changes_only,
+            no_attributes,
+            include_start_time_state,
+            run_start_ts,
+        )
+    ) is not None:
+        if cursor is not None:
+            metadata_id_idx = _FIELD_MAP["metadata_id"]
+            last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+            cached_rows = [
+                row
+                for row in cached_rows
+                if (row[metadata_id_idx], row[last_updated_ts_idx], row.state_id)
+                > cursor
+            ]
+        return cached_rows, result_start_time_ts, entity_id_to_metadata_id
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+    include_volatile_attrs = instance.schema_version >= VOLATILE_ATTRS_SCHEMA_VERSION
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
             start_time_ts,
@@ -265,6 +473,7 @@ def get_significant_states_with_session(
             no_attributes,
             include_start_time_state,
             run_start_ts,
+            include_volatile_attrs,
         ),
         track_on=[
             bool(single_metadata_id),
@@ -273,17 +482,31 @@ def get_significant_states_with_session(
             significant_changes_only,
             no_attributes,
             include_start_time_state,
+            include_volatile_attrs,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
-        entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
-    )
+    if cursor is not None:
+        cursor_metadata_id, cursor_last_updated_ts, cursor_state_id = cursor
+        # Filter on the selected columns so the cursor also applies to the
+        # states at the start time which are unioned with the other states
+        stmt += lambda q: q.where(
+            _after_cursor(
+                q.selected_columns.metadata_id,
+                q.selected_columns.last_updated_ts,
+                q.selected_columns.state_id,
+                cursor_metadata_id,
+                cursor_last_updated_ts,
+                cursor_state_id,
+            )
+        )
+    rows: Iterable[Row]
+    if yield_per is None:
+        rows = execute_stmt_lambda_element(
+            session, stmt, None, end_time, orm_rows=False
+        )
+    else:
+        rows = session.connection().execution_options(yield_per=yield_per).execute(stmt)
+    return rows, result_start_time_ts, entity_id_to_metadata_id
 
 
 def get_full_significant_states_with_session(
@@ -328,9 +551,12 @@ def _state_changed_during_period_stmt(
     include_start_time_state: bool,
     run_start_ts: float | None,
     include_last_reported: bool,
+    include_volatile_attrs: bool,
 ) -> Select | CompoundSelect:
     stmt = (
-        _stmt_and_join_attributes(no_attributes, False, include_last_reported)
+        _stmt_and_join_attributes(
+            no_attributes, False, include_last_reported, include_volatile_attrs
+        )
         .filter(
             (
                 (States.last_changed_ts == States.last_updated_ts)
@@ -363,6 +589,7 @@ def _state_changed_during_period_stmt(
                     no_attributes,
                     False,
                     include_last_reported,
+                    include_volatile_attrs,
                 ).subquery(),
                 no_attributes,
                 False,
@@ -392,14 +619,14 @@ def state_changes_during_period(
     include_start_time_state: bool = True,
 ) -> dict[str, list[State]]:
     """Return states changes during UTC period start_time - end_time."""
-    has_last_reported = (
-        get_instance(hass).schema_version >= LAST_REPORTED_SCHEMA_VERSION
-    )
+    schema_version = get_instance(hass).schema_version
+    has_last_reported = schema_version >= LAST_REPORTED_SCHEMA_VERSION
+    has_volatile_attrs = schema_version >= VOLATILE_ATTRS_SCHEMA_VERSION
     if not entity_id:
         raise ValueError("entity_id must be provided")
     entity_ids = [entity_id.lower()]
 
-    with session_scope(hass=hass, read_only=True) as session:
+    with session_scope(hass=hass, read_only=True, replica=True) as session:
         instance = get_instance(hass)
         if not (
             possible_metadata_id := instance.states_meta_manager.get(
@@ -428,6 +655,7 @@ def state_changes_during_period(
                 include_start_time_state,
                 run_start_ts,
                 has_last_reported,
+                has_volatile_attrs,
             ),
             track_on=[
                 bool(end_time_ts),
@@ -435,6 +663,7 @@ def state_changes_during_period(
                 bool(limit),
                 include_start_time_state,
                 has_last_reported,
+                has_volatile_attrs,
             ],
         )
         return cast(
@@ -452,9 +681,11 @@ def state_changes_during_period(
         )
 
 
-def _get_last_state_changes_single_stmt(metadata_id: int) -> Select:
+def _get_last_state_changes_single_stmt(
+    metadata_id: int, include_volatile_attrs: bool
+) -> Select:
     return (
-        _stmt_and_join_attributes(False, False, False)
+        _stmt_and_join_attributes(False, False, False, include_volatile_attrs)
         .join(
             (
                 lastest_state_for_metadata_id := (
@@ -481,10 +712,15 @@ def _get_last_state_changes_single_stmt(metadata_id: int) -> Select:
 
 
 def _get_last_state_changes_multiple_stmt(
-    number_of_states: int, metadata_id: int, include_last_reported: bool
+    number_of_states: int,
+    metadata_id: int,
+    include_last_reported: bool,
+    include_volatile_attrs: bool,
 ) -> Select:
     return (
-        _stmt_and_join_attributes(False, False, include_last_reported)
+        _stmt_and_join_attributes(
+            False, False, include_last_reported, include_volatile_attrs
+        )
         .where(
             States.state_id
             == (
@@ -506,9 +742,9 @@ def get_last_state_changes(
     hass: HomeAssistant, number_of_states: int, entity_id: str
 ) -> dict[str, list[State]]:
     """Return the last number_of_states."""
-    has_last_reported = (
-        get_instance(hass).schema_version >= LAST_REPORTED_SCHEMA_VERSION
-    )
+    schema_version = get_instance(hass).schema_version
+    has_last_reported = schema_version >= LAST_REPORTED_SCHEMA_VERSION
+    has_volatile_attrs = schema_version >= VOLATILE_ATTRS_SCHEMA_VERSION
     entity_id_lower = entity_id.lower()
     entity_ids = [entity_id_lower]
 
@@ -516,7 +752,7 @@ def get_last_state_changes(
     # because it has to scan the table to find the last number_of_states states
     # because the metadata_id_last_updated_ts index is in ascending order.
 
-    with session_scope(hass=hass, read_only=True) as session:
+    with session_scope(hass=hass, read_only=True, replica=True) as session:
         instance = get_instance(hass)
         if not (
             possible_metadata_id := instance.states_meta_manager.get(
@@ -528,14 +764,20 @@ def get_last_state_changes(
         entity_id_to_metadata_id: dict[str, int | None] = {entity_id_lower: metadata_id}
         if number_of_states == 1:
             stmt = lambda_stmt(
-                lambda: _get_last_state_changes_single_stmt(metadata_id),
+                lambda: _get_last_state_changes_single_stmt(
+                    metadata_id, has_volatile_attrs
+                ),
+                track_on=[has_volatile_attrs],
             )
         else:
             stmt = lambda_stmt(
                 lambda: _get_last_state_changes_multiple_stmt(
-                    number_of_states, metadata_id, has_last_reported
+                    number_of_states,
+                    metadata_id,
+                    has_last_reported,
+                    has_volatile_attrs,
                 ),
-                track_on=[has_last_reported],
+                track_on=[has_last_reported, has_volatile_attrs],
             )
         states = list(execute_stmt_lambda_element(session, stmt, orm_rows=False))
         return cast(
@@ -556,13 +798,14 @@ def _get_start_time_state_for_entities_stmt(
     metadata_ids: list[int],
     no_attributes: bool,
     include_last_changed: bool,
+    include_volatile_attrs: bool,
 ) -> Select:
     """Baked query to get states for specific entities."""
     # We got an include-list of entities, accelerate the query by filtering already
     # in the inner and the outer query.
     stmt = (
         _stmt_and_join_attributes_for_start_state(
-            no_attributes, include_last_changed, False
+            no_attributes, include_last_changed, False, include_volatile_attrs
         )
         .join(
             (
@@ -621,6 +864,7 @@ def _get_start_time_state_stmt(
     metadata_ids: list[int],
     no_attributes: bool,
     include_last_changed: bool,
+    include_volatile_attrs: bool,
 ) -> Select:
     """Return the states at a specific point in time."""
     if single_metadata_id:
@@ -632,6 +876,7 @@ def _get_start_time_state_stmt(
             no_attributes,
             include_last_changed,
             False,
+            include_volatile_attrs,
         )
     # We have more than one entity to look at so we need to do a query on states
     # since the last recorder run started.
@@ -641,6 +886,7 @@ def _get_start_time_state_stmt(
         metadata_ids,
         no_attributes,
         include_last_changed,
+        include_volatile_attrs,
     )
 
 
@@ -650,12 +896,16 @@ def _get_single_entity_start_time_stmt(
     no_attributes: bool,
     include_last_changed: bool,
     include_last_reported: bool,
+    include_volatile_attrs: bool,
 ) -> Select:
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
     stmt = (
         _stmt_and_join_attributes_for_start_state(
-            no_attributes, include_last_changed, include_last_reported
+            no_attributes,
+            include_last_changed,
+            include_last_reported,
+            include_volatile_attrs,
         )
         .filter(
             States.last_updated_ts < epoch_time,
@@ -29,6 +29,7 @@ from sqlalchemy.sql.expression import true
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.ulid import ulid_at_time, ulid_to_bytes
 
@@ -53,6 +54,7 @@ from .const import (
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUPS_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
@@ -63,6 +65,7 @@ from .db_schema import (
     LEGACY_STATES_EVENT_ID_INDEX,
     MYSQL_COLLATE,
     MYSQL_DEFAULT_CHARSET,
+    PARTITIONED_TABLES,
     SCHEMA_VERSION,
     STATISTICS_TABLES,
     TABLE_STATES,
@@ -75,12 +78,21 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
 from .models import process_timestamp
 from .models.time import datetime_to_timestamp_or_none
+from .partitions import (
+    DEFAULT_PARTITION_SUFFIX,
+    LEGACY_PARTITION_SUFFIX,
+    PARTITION_DURATION,
+    create_partitions,
+    partition_start,
+)
 from .queries import (
     batch_cleanup_entity_ids,
     delete_duplicate_short_term_statistics_row,
@@ -99,7 +111,12 @@ from .queries import (
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import cleanup_statistics_timestamp_migration, get_start_time
+from .statistics import (
+    cleanup_statistics_timestamp_migration,
+    get_start_time,
+    reduce_month_ts_factory,
+    update_statistics_rollups,
+)
 from .tasks import RecorderTask
 from .util import (
     database_job_retry_wrapper,
@@ -350,6 +367,142 @@ def migrate_schema_live(
     return schema_status
 
 
+def migrate_to_partitioned_tables(
+    session_maker: Callable[[], Session], tables: Iterable[str]
+) -> None:
+    """Convert tables to range partitioned tables on PostgreSQL.
+
+    The existing table becomes the partition of everything before the next
+    day so no rows have to be copied. It is dropped by the purge as soon as
+    all of its rows are older than purge_keep_days.
+
+    Foreign keys which reference a partitioned table, like the old_state_id
+    of the states, are not created on the partitioned table since the unique
+    constraints of a partitioned table must include the partition column.
+    The recorder keeps these references consistent itself.
+    """
+    for table in tables:
+        _LOGGER.warning(
+            "Converting table %s to a partitioned table. %s",
+            table,
+            MIGRATION_NOTE_MINUTES,
+        )
+        try:
+            with session_scope(session=session_maker()) as session:
+                _partition_table(session, Base.metadata.tables[table])
+        except SQLAlchemyError:
+            _LOGGER.exception(
+                "Could not convert table %s to a partitioned table", table
+            )
+
+
+def _partition_table(session: Session, table: Table) -> None:
+    """Convert a table to a range partitioned table.
+
+    All statements run in a single transaction so the table is left
+    untouched if any of them fails.
+    """
+    name = table.name
+    column = PARTITIONED_TABLES[name]
+    legacy = f"{name}{LEGACY_PARTITION_SUFFIX}"
+    (id_column,) = table.primary_key.columns.keys()
+    connection = session.connection()
+    inspector = sqlalchemy.inspect(connection)
+    pk_name = inspector.get_pk_constraint(name)["name"]
+    index_names = [index["name"] for index in inspector.get_indexes(name)]
+
+    # Index names are unique per schema, move the names
+    # of the existing table out of the way of the new table
+    session.execute(text(f"ALTER TABLE {name} RENAME TO {legacy}"))
+    session.execute(
+        text(f"ALTER TABLE {legacy} RENAME CONSTRAINT {pk_name} TO {legacy}_pkey")
+    )
+    for index_name in index_names:
+        session.execute(
+            text(
+                f"ALTER INDEX {index_name}"
+                f" RENAME TO {index_name}{LEGACY_PARTITION_SUFFIX}"
+            )
+        )
+
+    next_id = session.execute(
+        text(f"SELECT COALESCE(MAX({id_column}), 0) + 1 FROM {legacy}")  # noqa: S608
+    ).scalar_one()
+    max_ts = session.execute(
+        text(f"SELECT MAX({column}) FROM {legacy}")  # noqa: S608
+    ).scalar()
+    # The existing rows stay in the legacy partition which
+    # ends with the day of the newest row or today
+    cutover = partition_start(max(time(), max_ts or 0)) + PARTITION_DURATION
+
+    session.execute(
+        text(
+            f"CREATE TABLE {name} (LIKE {legacy} INCLUDING DEFAULTS)"
+            f" PARTITION BY RANGE ({column})"
+        )
+    )
+    # Identity columns of partitioned tables need PostgreSQL 17,
+    # use a sequence which continues after the existing ids instead
+    sequence = f"{name}_{id_column}_partitioned_seq"
+    session.execute(
+        text(
+            f"CREATE SEQUENCE {sequence} START WITH {next_id}"
+            f" OWNED BY {name}.{id_column}"
+        )
+    )
+    session.execute(
+        text(
+            f"ALTER TABLE {name} ALTER COLUMN {id_column}"
+            f" SET DEFAULT nextval('{sequence}')"
+        )
+    )
+    # A check constraint which implies the partition bound lets PostgreSQL
+    # skip scanning the legacy table when it is attached and when the
+    # partition column is made NOT NULL, so the table is only scanned once
+    bound = f"{legacy}_bound"
+    session.execute(
+        text(
+            f"ALTER TABLE {legacy} ADD CONSTRAINT {bound} CHECK"
+            f" ({column} IS NOT NULL AND {column} < {cutover.timestamp()!r})"
+        )
+    )
+    # The primary key of a partitioned table must include the partition column
+    for table_name in (name, legacy):
+        session.execute(
+            text(f"ALTER TABLE {table_name} ALTER COLUMN {column} SET NOT NULL")
+        )
+    session.execute(text(f"ALTER TABLE {name} ADD PRIMARY KEY ({id_column}, {column})"))
+    for index in table.indexes:
+        index.create(connection)
+    for foreign_key in table.foreign_key_constraints:
+        if foreign_key.referred_table.name not in PARTITIONED_TABLES:
+            connection.execute(AddConstraint(foreign_key))
+            continue
+        _LOGGER.info(
+            "Not creating the foreign key %s of table %s since it references"
+            " the partitioned table %s",
+            ", ".join(foreign_key.column_keys),
+            name,
+            foreign_key.referred_table.name,
+        )
+
+    session.execute(
+        text(
+            f"ALTER TABLE {name} ATTACH PARTITION {legacy}"
+            f" FOR VALUES FROM (MINVALUE) TO ({cutover.timestamp()!r})"
+        )
+    )
+    # The partition bound is enforced by the partitioned table now
+    session.execute(text(f"ALTER TABLE {legacy} DROP CONSTRAINT {bound}"))
+    session.execute(
+        text(
+            f"CREATE TABLE {name}{DEFAULT_PARTITION_SUFFIX}"
+            f" PARTITION OF {name} DEFAULT"
+        )
+    )
+    create_partitions(session, name, dt_util.utcnow())
+
+
 def _create_index(
     session_maker: Callable[[], Session], table_name: str, index_name: str
 ) -> None:
@@ -1656,6 +1809,20 @@ class _SchemaVersion45Migrator(_SchemaVersionMigrator, target_version=45):
         # undefined state after the migration.
 
 
+class _SchemaVersion48Migrator(_SchemaVersionMigrator, target_version=48):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The rollup tables are filled by StatisticsRollupsMigration
+        for table in (StatisticsDaily, StatisticsMonthly):
+            cast(Table, table.__table__).create(self.engine, checkfirst=True)
+
+
+class _SchemaVersion49Migrator(_SchemaVersionMigrator, target_version=49):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        _add_columns(self.session_maker, "states", ["volatile_attrs TEXT"])
+
+
 FOREIGN_COLUMNS = (
     (
         "events",
@@ -2643,6 +2810,67 @@ class EventIDPostMigration(BaseRunTimeMigration):
         return DataMigrationStatus(needs_migrate=False, migration_done=True)
 
 
+class StatisticsRollupsMigration(BaseRunTimeMigration):
+    """Migration to roll up long term statistics to days and months."""
+
+    required_schema_version = STATISTICS_ROLLUPS_SCHEMA_VERSION
+    migration_id = "statistics_rollups"
+
+    def __init__(self, schema_version: int, migration_changes: dict[str, int]) -> None:
+        """Initialize a new StatisticsRollupsMigration."""
+        super().__init__(schema_version, migration_changes)
+        self._next_start_ts: float | None = None
+
+    def migrate_data_impl(self, instance: Recorder) -> DataMigrationStatus:
+        """Roll up the statistics of one month, return if the migration is done."""
+        _LOGGER.debug("Roll up statistics")
+        with session_scope(session=instance.get_session()) as session:
+            if self._next_start_ts is None:
+                # Existing rollups may have been made for another time zone
+                session.query(StatisticsDaily).delete(synchronize_session=False)
+                session.query(StatisticsMonthly).delete(synchronize_session=False)
+                self._next_start_ts = session.query(
+                    func.min(Statistics.start_ts)
+                ).scalar()
+            last_start_ts = session.query(func.max(Statistics.start_ts)).scalar()
+            if self._next_start_ts is None or last_start_ts is None:
+                return DataMigrationStatus(needs_migrate=False, migration_done=True)
+            _, month_start_end = reduce_month_ts_factory()
+            month_start_ts, month_end_ts = month_start_end(self._next_start_ts)
+            update_statistics_rollups(session, month_start_ts, month_end_ts)
+            self._next_start_ts = month_end_ts
+        is_done = month_end_ts > last_start_ts
+        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+
+    def migration_done(self, instance: Recorder, session: Session) -> None:
+        """Will be called after migrate returns True."""
+        instance.statistics_rollups_ready = True
+
+    def needs_migrate_impl(
+        self, instance: Recorder, session: Session
+    ) -> DataMigrationStatus:
+        """Return if the migration needs to run."""
+        has_statistics = session.query(Statistics.id).limit(1).scalar() is not None
+        return DataMigrationStatus(
+            needs_migrate=has_statistics, migration_done=not has_statistics
+        )
+
+
+@dataclass(slots=True)
+class RebuildStatisticsRollupsTask(RecorderTask):
+    """An object to insert into the recorder queue to rebuild statistics rollups."""
+
+    def run(self, instance: Recorder) -> None:
+        """Forget the rollups were built and build them again."""
+        with session_scope(session=instance.get_session()) as session:
+            session.query(MigrationChanges).filter_by(
+                migration_id=StatisticsRollupsMigration.migration_id
+            ).delete(synchronize_session=False)
+        instance.queue_task(
+            MigrationTask(StatisticsRollupsMigration(SCHEMA_VERSION, {}))
+        )
+
+
 @dataclass(slots=True)
 class EntityIDPostMigrationTask(RecorderTask):
     """An object to insert into the recorder queue to cleanup after entity_ids migration."""
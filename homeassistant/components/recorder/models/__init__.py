@@ -11,6 +11,7 @@ from .context import (
 from .database import DatabaseEngine, DatabaseOptimizer, UnsupportedDialect
 from .event import extract_event_type_ids
 from .state import LazyState, extract_metadata_ids, row_to_compressed_state
+from .state_attributes import VOLATILE_ATTRS_SEPARATOR
 from .statistics import (
     CalendarStatisticPeriod,
     FixedStatisticPeriod,
@@ -41,6 +42,7 @@ __all__ = [
     "StatisticPeriod",
     "StatisticResult",
     "UnsupportedDialect",
+    "VOLATILE_ATTRS_SEPARATOR",
     "bytes_to_ulid_or_none",
     "bytes_to_uuid_hex_or_none",
     "datetime_to_timestamp_or_none",
@@ -8,6 +8,9 @@ from typing import Any
 from homeassistant.util.json import json_loads_object
 
 EMPTY_JSON_OBJECT = "{}"
+# Separates the shared attributes from the volatile attributes of a
+# state, it cannot be part of the JSON encoded attributes
+VOLATILE_ATTRS_SEPARATOR = "\x1e"
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -19,6 +22,18 @@ def decode_attributes_from_source(
         return {}
     if (attributes := attr_cache.get(source)) is not None:
         return attributes
+    if VOLATILE_ATTRS_SEPARATOR in source:
+        # The volatile attributes differ for almost every row so only
+        # the shared attributes are cached
+        shared_attrs, _, volatile_attrs = source.partition(VOLATILE_ATTRS_SEPARATOR)
+        try:
+            volatile = json_loads_object(volatile_attrs)
+        except ValueError:
+            _LOGGER.exception(
+                "Error converting row to state attributes: %s", volatile_attrs
+            )
+            volatile = {}
+        return decode_attributes_from_source(shared_attrs, attr_cache) | volatile
     try:
         attr_cache[source] = attributes = json_loads_object(source)
     except ValueError:
@@ -0,0 +1,171 @@
+"""Daily range partitions of the recorder tables on PostgreSQL."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+import math
+import re
+
+from sqlalchemy import bindparam, column, select, table as table_clause, text
+from sqlalchemy.orm.session import Session
+
+import homeassistant.util.dt as dt_util
+
+from .db_schema import PARTITIONED_TABLES
+
+_LOGGER = logging.getLogger(__name__)
+
+PARTITION_DURATION = timedelta(days=1)
+# Partitions are created in advance so a late nightly
+# maintenance does not send new rows to the default partition
+PARTITIONS_AHEAD = timedelta(days=3)
+
+DEFAULT_PARTITION_SUFFIX = "_default"
+LEGACY_PARTITION_SUFFIX = "_legacy"
+
+_UPPER_BOUND = re.compile(r"TO \('?([^')]+)'?\)")
+
+
+@dataclass(slots=True, frozen=True)
+class Partition:
+    """A partition of a range partitioned table."""
+
+    name: str
+    # The exclusive upper bound of the partition, None for the default partition
+    end_ts: float | None
+
+
+def get_partitioned_tables(session: Session) -> set[str]:
+    """Return the recorder tables which are range partitioned."""
+    return set(
+        session.execute(
+            text(
+                "SELECT relname FROM pg_class WHERE relkind = 'p'"
+                " AND relname IN :tables AND pg_table_is_visible(oid)"
+            ).bindparams(bindparam("tables", expanding=True)),
+            {"tables": list(PARTITIONED_TABLES)},
+        ).scalars()
+    )
+
+
+def get_partitions(session: Session, table: str) -> list[Partition]:
+    """Return the partitions of a table ordered by their upper bound."""
+    rows = session.execute(
+        text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)"
+            " FROM pg_inherits"
+            " JOIN pg_class parent ON parent.oid = pg_inherits.inhparent"
+            " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+            " WHERE parent.relname = :table AND pg_table_is_visible(parent.oid)"
+        ),
+        {"table": table},
+    ).all()
+    return sorted(
+        (Partition(name, _upper_bound(bound)) for name, bound in rows),
+        key=_partition_sort_key,
+    )
+
+
+def _upper_bound(bound: str) -> float | None:
+    """Return the upper bound of a partition bound expression."""
+    if match := _UPPER_BOUND.search(bound):
+        return float(match.group(1))
+    return None
+
+
+def _partition_sort_key(partition: Partition) -> float:
+    """Sort the default partition last."""
+    return math.inf if partition.end_ts is None else partition.end_ts
+
+
+def partition_name(table: str, start: datetime) -> str:
+    """Return the name of the partition of table starting at start."""
+    return f"{table}_p{dt_util.as_utc(start):%Y%m%d}"
+
+
+def partition_start(timestamp: float) -> datetime:
+    """Return the start of the partition the timestamp falls into."""
+    return dt_util.utc_from_timestamp(timestamp).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def create_partition(
+    session: Session, table: str, start: datetime, end: datetime
+) -> None:
+    """Create the partition of table for the period start - end.
+
+    Rows of the period which were written to the default partition are
+    moved to the new partition before it is attached, since the
+    partition cannot be attached while the default partition has rows
+    which belong to it. The check constraint which matches the bound
+    of the partition lets PostgreSQL attach it without scanning it.
+    """
+    column = PARTITIONED_TABLES[table]
+    name = partition_name(table, start)
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
+    _LOGGER.debug("Creating partition %s", name)
+    session.execute(text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS)"))
+    session.execute(
+        text(
+            f"ALTER TABLE {name} ADD CONSTRAINT {name}_bound CHECK"
+            f" ({column} IS NOT NULL AND {column} >= {start_ts!r}"
+            f" AND {column} < {end_ts!r})"
+        )
+    )
+    session.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {table}{DEFAULT_PARTITION_SUFFIX}"  # noqa: S608
+            f" WHERE {column} >= :start_ts AND {column} < :end_ts RETURNING *)"
+            f" INSERT INTO {name} SELECT * FROM moved"
+        ),
+        {"start_ts": start_ts, "end_ts": end_ts},
+    )
+    session.execute(
+        text(
+            f"ALTER TABLE {table} ATTACH PARTITION {name}"
+            f" FOR VALUES FROM ({start_ts!r}) TO ({end_ts!r})"
+        )
+    )
+    session.execute(text(f"ALTER TABLE {name} DROP CONSTRAINT {name}_bound"))
+
+
+def create_partitions(session: Session, table: str, now: datetime) -> None:
+    """Create the missing partitions of table up to PARTITIONS_AHEAD after now."""
+    end_ts = max(
+        (
+            partition.end_ts
+            for partition in get_partitions(session, table)
+            if partition.end_ts is not None
+        ),
+        default=None,
+    )
+    start = partition_start(now.timestamp() if end_ts is None else end_ts)
+    until = now + PARTITIONS_AHEAD
+    while start < until:
+        end = start + PARTITION_DURATION
+        create_partition(session, table, start, end)
+        start = end
+
+
+def drop_partition(session: Session, table: str, name: str) -> None:
+    """Detach and drop a partition of table."""
+    _LOGGER.debug("Dropping partition %s", name)
+    session.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+    session.execute(text(f"DROP TABLE {name}"))
+
+
+def get_distinct_ids(session: Session, name: str, column_name: str) -> set[int]:
+    """Return the distinct ids a partition references in a column."""
+    id_column = column(column_name)
+    return set(
+        session.execute(
+            select(id_column)
+            .select_from(table_clause(name))
+            .where(id_column.is_not(None))
+            .distinct()
+        ).scalars()
+    )
@@ -1,10 +1,12 @@
-"""A pool for sqlite connections."""
+"""Connection pools for the recorder."""
 
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
 import logging
 import threading
+import time
 import traceback
 from typing import Any
 
@@ -12,6 +14,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.pool import (
     ConnectionPoolEntry,
     NullPool,
+    QueuePool,
     SingletonThreadPool,
     StaticPool,
 )
@@ -170,3 +173,46 @@ class MutexPool(StaticPool):
                 self._reference_counter,
             )
         return conn
+
+
+@dataclass(slots=True)
+class PoolMetrics:
+    """Metrics of a connection pool."""
+
+    waiting: int = 0
+    checkouts: int = 0
+    wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+
+class MeteredQueuePool(QueuePool):
+    """A QueuePool which keeps track of how long checkouts wait for a connection."""
+
+    def __init__(self, creator: Any, **kw: Any) -> None:
+        """Create the pool."""
+        super().__init__(creator, **kw)
+        self.metrics = PoolMetrics()
+        self._metrics_lock = threading.Lock()
+
+    def recreate(self) -> MeteredQueuePool:
+        """Recreate the pool keeping its metrics."""
+        pool = super().recreate()
+        assert isinstance(pool, MeteredQueuePool)
+        pool.metrics = self.metrics
+        pool._metrics_lock = self._metrics_lock  # noqa: SLF001
+        return pool
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        metrics = self.metrics
+        with self._metrics_lock:
+            metrics.waiting += 1
+        start = time.monotonic()
+        try:
+            return super()._do_get()
+        finally:
+            wait_time = time.monotonic() - start
+            with self._metrics_lock:
+                metrics.waiting -= 1
+                metrics.checkouts += 1
+                metrics.wait_time += wait_time
+                metrics.max_wait_time = max(metrics.max_wait_time, wait_time)
@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
+from homeassistant.util import dt as dt_util
 from homeassistant.util.collection import chunked_or_all
 
-from .db_schema import Events, States, StatesMeta
+from . import partitions
+from .db_schema import TABLE_EVENTS, TABLE_STATES, Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
     attributes_ids_exist_in_states,
@@ -32,12 +36,15 @@ from .queries import (
     disconnect_states_rows,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
+    find_events_id_range_to_purge,
     find_events_to_purge,
+    find_existing_state_ids,
     find_latest_statistics_runs_run_id,
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
     find_short_term_statistics_to_purge,
+    find_states_id_range_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
@@ -52,6 +59,76 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
+# Seconds a purge task may spend deleting batches before it is
+# rescheduled behind the events which queued up in the meantime
+DEFAULT_PURGE_TIME_BUDGET = 2.0
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of a purge.
+
+    The progress is persisted to resume the purge after a restart.
+    """
+
+    purge_before: datetime
+    repack: bool
+    apply_filter: bool
+    states_purged: int = 0
+    events_purged: int = 0
+    states_remaining: int | None = None
+    events_remaining: int | None = None
+    done: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the progress."""
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "repack": self.repack,
+            "apply_filter": self.apply_filter,
+            "states_purged": self.states_purged,
+            "events_purged": self.events_purged,
+            "states_remaining": self.states_remaining,
+            "events_remaining": self.events_remaining,
+            "done": self.done,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PurgeProgress | None:
+        """Return the progress from its dict representation.
+
+        Returns None if the dict is not a valid progress.
+        """
+        try:
+            if (purge_before := dt_util.parse_datetime(data["purge_before"])) is None:
+                return None
+            return cls(
+                purge_before,
+                bool(data["repack"]),
+                bool(data["apply_filter"]),
+                int(data["states_purged"]),
+                int(data["events_purged"]),
+                _optional_int(data["states_remaining"]),
+                _optional_int(data["events_remaining"]),
+                bool(data["done"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.warning("Ignoring invalid purge progress: %s", data)
+            return None
+
+    def add_purged(self, states: int, events: int) -> None:
+        """Add purged rows to the progress."""
+        self.states_purged += states
+        self.events_purged += events
+        if self.states_remaining is not None:
+            self.states_remaining = max(self.states_remaining - states, 0)
+        if self.events_remaining is not None:
+            self.events_remaining = max(self.events_remaining - events, 0)
+
+
+def _optional_int(value: Any) -> int | None:
+    """Return the value as an int or None."""
+    return None if value is None else int(value)
 
 
 @retryable_database_job("purge")
@@ -62,16 +139,26 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    progress: PurgeProgress | None = None,
+    time_budget: float | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    If a time budget is given, no new batches are started once it is
+    spent and the purge has to be continued by calling it again.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    deadline = None if time_budget is None else time.monotonic() + time_budget
     with session_scope(session=instance.get_session()) as session:
+        if instance.partitioned_tables:
+            _drop_expired_partitions(instance, session, purge_before)
+        if progress is not None and progress.states_remaining is None:
+            _estimate_rows_to_purge(session, purge_before, progress)
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
         if instance.use_legacy_events_index and _purging_legacy_format(session):
@@ -79,19 +166,30 @@ def purge_old_data(
                 "Purge running in legacy format as there are states with event_id"
                 " remaining"
             )
-            has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
+            has_more_to_purge |= _purge_legacy_format(
+                instance, session, purge_before, progress
+            )
+            if progress is not None and not has_more_to_purge:
+                progress.states_remaining = progress.events_remaining = 0
         else:
             _LOGGER.debug(
                 "Purge running in new format as there are NO states with event_id"
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
-            has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+            has_more_states = _purge_states_and_attributes_ids(
+                instance, session, states_batch_size, purge_before, progress, deadline
             )
-            has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+            has_more_events = _purge_events_and_data_ids(
+                instance, session, events_batch_size, purge_before, progress, deadline
             )
+            has_more_to_purge |= has_more_states or has_more_events
+            # The estimate also counts the newer rows between the ids to
+            # purge, so nothing is left once a table has no more to purge
+            if progress is not None and not has_more_states:
+                progress.states_remaining = 0
+            if progress is not None and not has_more_events:
+                progress.events_remaining = 0
 
         statistics_runs = _select_statistics_runs_to_purge(
             session, purge_before, instance.max_bind_vars
@@ -128,13 +226,93 @@ def purge_old_data(
     return True
 
 
+def _drop_expired_partitions(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> None:
+    """Drop the partitions which only have rows from before purge_before.
+
+    The rows of the partition which is only partly expired are
+    deleted in batches by the regular purge.
+    """
+    purge_before_ts = purge_before.timestamp()
+    for table in sorted(instance.partitioned_tables):
+        for partition in partitions.get_partitions(session, table):
+            if partition.end_ts is None or partition.end_ts > purge_before_ts:
+                continue
+            attributes_ids: set[int] = set()
+            data_ids: set[int] = set()
+            if table == TABLE_STATES:
+                attributes_ids = partitions.get_distinct_ids(
+                    session, partition.name, "attributes_id"
+                )
+            elif table == TABLE_EVENTS:
+                data_ids = partitions.get_distinct_ids(
+                    session, partition.name, "data_id"
+                )
+            _LOGGER.debug("Dropping expired partition %s", partition.name)
+            # The old_state_id of newer states may still point to states
+            # of the partition, there is no foreign key to keep intact
+            partitions.drop_partition(session, table, partition.name)
+            if table == TABLE_STATES:
+                _evict_dropped_state_ids(instance, session)
+            _purge_unused_attributes_ids(instance, session, attributes_ids)
+            _purge_unused_data_ids(instance, session, data_ids)
+
+
+def _evict_dropped_state_ids(instance: Recorder, session: Session) -> None:
+    """Evict the committed states which were dropped with a partition."""
+    committed_state_ids = instance.states_manager.committed_state_ids()
+    existing_state_ids: set[int] = set()
+    for state_ids_chunk in chunked_or_all(committed_state_ids, instance.max_bind_vars):
+        existing_state_ids.update(
+            session.execute(find_existing_state_ids(state_ids_chunk)).scalars()
+        )
+    instance.states_manager.evict_purged_state_ids(
+        committed_state_ids - existing_state_ids
+    )
+
+
+def _estimate_rows_to_purge(
+    session: Session, purge_before: datetime, progress: PurgeProgress
+) -> None:
+    """Estimate the number of states and events left to purge.
+
+    Counting the rows would scan the whole range to purge, so the estimate
+    is the range of ids up to the newest row to purge, which only takes
+    two index lookups per table.
+    """
+    purge_before_ts = purge_before.timestamp()
+    progress.states_remaining = _id_range_size(
+        session, find_states_id_range_to_purge(purge_before_ts)
+    )
+    progress.events_remaining = _id_range_size(
+        session, find_events_id_range_to_purge(purge_before_ts)
+    )
+
+
+def _id_range_size(session: Session, stmt: StatementLambdaElement) -> int:
+    """Return the size of the id range found by the statement."""
+    first_id, last_id = session.execute(stmt).one()
+    if first_id is None or last_id is None:
+        return 0
+    return max(last_id - first_id + 1, 0)
+
+
+def _deadline_passed(deadline: float | None) -> bool:
+    """Return if the time budget of the purge is spent."""
+    return deadline is not None and time.monotonic() >= deadline
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
 
 
 def _purge_legacy_format(
-    instance: Recorder, session: Session, purge_before: datetime
+    instance: Recorder,
+    session: Session,
+    purge_before: datetime,
+    progress: PurgeProgress | None,
 ) -> bool:
     """Purge rows that are still linked by the event_ids."""
     (
@@ -163,6 +341,8 @@ def _purge_legacy_format(
     )
     _purge_state_ids(instance, session, detached_state_ids)
     _purge_unused_attributes_ids(instance, session, detached_attributes_ids)
+    if progress is not None:
+        progress.add_purged(len(state_ids) + len(detached_state_ids), len(event_ids))
     return bool(
         event_ids
         or state_ids
@@ -178,6 +358,8 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress | None,
+    deadline: float | None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -201,6 +383,10 @@ def _purge_states_and_attributes_ids(
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if progress is not None:
+            progress.add_purged(len(state_ids), 0)
+        if _deadline_passed(deadline):
+            break
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -215,6 +401,8 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress | None,
+    deadline: float | None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -236,6 +424,10 @@ def _purge_events_and_data_ids(
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if progress is not None:
+            progress.add_purged(0, len(event_ids))
+        if _deadline_passed(deadline):
+            break
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
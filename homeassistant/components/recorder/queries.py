@@ -530,6 +530,13 @@ def data_ids_exist_in_events(
     )
 
 
+def find_existing_state_ids(state_ids: Iterable[int]) -> StatementLambdaElement:
+    """Find which of the state ids still exist."""
+    return lambda_stmt(
+        lambda: select(States.state_id).where(States.state_id.in_(state_ids))
+    )
+
+
 def disconnect_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     """Disconnect states rows."""
     return lambda_stmt(
@@ -636,6 +643,34 @@ def find_states_to_purge(
     )
 
 
+def find_events_id_range_to_purge(purge_before: float) -> StatementLambdaElement:
+    """Find the lowest event id and the id of the newest event to purge."""
+    return lambda_stmt(
+        lambda: select(
+            select(func.min(Events.event_id)).scalar_subquery(),
+            select(Events.event_id)
+            .filter(Events.time_fired_ts < purge_before)
+            .order_by(Events.time_fired_ts.desc())
+            .limit(1)
+            .scalar_subquery(),
+        )
+    )
+
+
+def find_states_id_range_to_purge(purge_before: float) -> StatementLambdaElement:
+    """Find the lowest state id and the id of the newest state to purge."""
+    return lambda_stmt(
+        lambda: select(
+            select(func.min(States.state_id)).scalar_subquery(),
+            select(States.state_id)
+            .filter(States.last_updated_ts < purge_before)
+            .order_by(States.last_updated_ts.desc())
+            .limit(1)
+            .scalar_subquery(),
+        )
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
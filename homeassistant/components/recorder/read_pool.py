@@ -0,0 +1,99 @@
+"""Read only connection pools for history, logbook and statistics queries."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, cast
+
+from sqlalchemy import create_engine, event as sqlalchemy_event
+from sqlalchemy.engine import make_url
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.session import Session
+
+from .pool import MeteredQueuePool, PoolMetrics
+from .util import setup_connection_for_dialect
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+
+def sqlite_read_only_url(db_url: str) -> str:
+    """Return the URL to open a SQLite database file read only."""
+    url = make_url(db_url)
+    return url.set(
+        database=f"file:{url.database}",
+        query={**url.query, "mode": "ro", "uri": "true"},
+    ).render_as_string(hide_password=False)
+
+
+class ReadPool:
+    """A pool of connections only used for reading.
+
+    The connections go to a read only replica of the database or,
+    for SQLite, to the database file opened read only which allows
+    reading concurrently with the recorder thread in WAL mode.
+    """
+
+    def __init__(
+        self,
+        instance: Recorder,
+        url: str,
+        pool_size: int,
+        connect_args: dict[str, Any],
+    ) -> None:
+        """Initialize the pool."""
+        self._instance = instance
+        self.name = make_url(url).render_as_string(hide_password=True)
+        self.engine = create_engine(
+            url,
+            poolclass=MeteredQueuePool,
+            pool_size=pool_size,
+            max_overflow=0,
+            connect_args=connect_args,
+            future=True,
+        )
+        sqlalchemy_event.listen(self.engine, "connect", self._setup_connection)
+        self._get_session = sessionmaker(bind=self.engine, future=True)
+
+    def _setup_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific connection settings."""
+        setup_connection_for_dialect(
+            self._instance, self.engine.dialect.name, dbapi_connection, False
+        )
+
+    @property
+    def _pool(self) -> MeteredQueuePool:
+        return cast(MeteredQueuePool, self.engine.pool)
+
+    @property
+    def metrics(self) -> PoolMetrics:
+        """Return the metrics of the pool."""
+        return self._pool.metrics
+
+    @property
+    def load(self) -> int:
+        """Return the number of checked out and waiting connections."""
+        return self._pool.checkedout() + self._pool.metrics.waiting
+
+    def get_session(self) -> Session:
+        """Get a new sqlalchemy session."""
+        return self._get_session()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics of the pool as a dict."""
+        metrics = self.metrics
+        return {
+            "name": self.name,
+            "size": self._pool.size(),
+            "checked_out": self._pool.checkedout(),
+            "waiting": metrics.waiting,
+            "checkouts": metrics.checkouts,
+            "wait_time": metrics.wait_time,
+            "max_wait_time": metrics.max_wait_time,
+        }
+
+    def dispose(self) -> None:
+        """Close all connections of the pool."""
+        self.engine.dispose()
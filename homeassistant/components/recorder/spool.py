@@ -0,0 +1,323 @@
+"""Append-only on-disk spool for events the recorder cannot write yet.
+
+When the database is unreachable the events pile up in the recorder
+queue. Instead of holding them in memory they are appended to the
+spool and replayed in batches once the database is reachable again.
+
+The spool starts with a header holding the offset of the first record
+which has not been replayed yet, followed by length prefixed records.
+Records only carry the fields of the Event and State objects the
+recorder writes to the database.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import os
+from pathlib import Path
+import struct
+from typing import Any, BinaryIO
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, EventStateChangedData, State
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS, json_loads_object
+
+from .const import SupportedDialect
+from .db_schema import EventData, StateAttributes
+
+_LOGGER = logging.getLogger(__name__)
+
+_HEADER = struct.Struct("<Q")
+_RECORD_LENGTH = struct.Struct("<I")
+# kind, origin_idx, time_fired_ts
+_EVENT = struct.Struct("<BBd")
+# last_changed_ts, last_updated_ts, last_reported_ts
+_NEW_STATE = struct.Struct("<ddd")
+# last_reported_ts
+_OLD_STATE = struct.Struct("<d")
+_STRING_LENGTH = struct.Struct("<H")
+_BLOB_LENGTH = struct.Struct("<I")
+_NONE_STRING = 0xFFFF
+
+_KIND_EVENT = 0
+_KIND_STATE_CHANGED = 1
+_HAS_NEW_STATE = 2
+_HAS_OLD_STATE = 4
+
+_ORIGINS = list(EventOrigin)
+
+
+def _pack_string(value: str | None) -> bytes:
+    """Pack a length prefixed string."""
+    if value is None:
+        return _STRING_LENGTH.pack(_NONE_STRING)
+    encoded = value.encode("utf-8")
+    return _STRING_LENGTH.pack(len(encoded)) + encoded
+
+
+def _pack_blob(value: bytes) -> bytes:
+    """Pack a length prefixed blob."""
+    return _BLOB_LENGTH.pack(len(value)) + value
+
+
+class _Reader:
+    """Read the fields of a record."""
+
+    __slots__ = ("_data", "_pos")
+
+    def __init__(self, data: bytes) -> None:
+        """Initialize the reader."""
+        self._data = data
+        self._pos = 0
+
+    def unpack(self, fmt: struct.Struct) -> tuple[Any, ...]:
+        """Unpack a fixed size struct."""
+        values = fmt.unpack_from(self._data, self._pos)
+        self._pos += fmt.size
+        return values
+
+    def string(self) -> str | None:
+        """Read a length prefixed string."""
+        (length,) = self.unpack(_STRING_LENGTH)
+        if length == _NONE_STRING:
+            return None
+        return self.blob_of(length).decode("utf-8")
+
+    def blob(self) -> bytes:
+        """Read a length prefixed blob."""
+        (length,) = self.unpack(_BLOB_LENGTH)
+        return self.blob_of(length)
+
+    def blob_of(self, length: int) -> bytes:
+        """Read length bytes."""
+        value = self._data[self._pos : self._pos + length]
+        self._pos += length
+        return value
+
+
+def encode_event(event: Event, dialect: SupportedDialect | None) -> bytes | None:
+    """Encode an event as a spool record.
+
+    Returns None if the event data cannot be serialized, such an
+    event would not be recorded either.
+    """
+    context = event.context
+    context_fields = (
+        _pack_string(event.event_type)
+        + _pack_string(context.id)
+        + _pack_string(context.user_id)
+        + _pack_string(context.parent_id)
+    )
+    if event.event_type != EVENT_STATE_CHANGED:
+        try:
+            data = EventData.shared_data_bytes_from_event(event, dialect)
+        except JSON_ENCODE_EXCEPTIONS as ex:
+            _LOGGER.warning("Event is not JSON serializable: %s: %s", event, ex)
+            return None
+        return (
+            _EVENT.pack(_KIND_EVENT, event.origin.idx, event.time_fired_timestamp)
+            + context_fields
+            + _pack_blob(data)
+        )
+
+    state_data: EventStateChangedData = event.data
+    kind = _KIND_STATE_CHANGED
+    state_fields = _pack_string(state_data["entity_id"])
+    if (new_state := state_data["new_state"]) is not None:
+        kind |= _HAS_NEW_STATE
+        try:
+            # Only the attributes which are recorded are spooled
+            attributes = StateAttributes.shared_attrs_bytes_from_event(event, dialect)
+        except JSON_ENCODE_EXCEPTIONS as ex:
+            _LOGGER.warning("State is not JSON serializable: %s: %s", new_state, ex)
+            return None
+        state_fields += (
+            _pack_string(new_state.state)
+            + _NEW_STATE.pack(
+                new_state.last_changed_timestamp,
+                new_state.last_updated_timestamp,
+                new_state.last_reported_timestamp,
+            )
+            + _pack_blob(attributes)
+        )
+    if (old_state := state_data["old_state"]) is not None:
+        # The recorder only needs to know when the old state was last reported
+        kind |= _HAS_OLD_STATE
+        state_fields += _pack_string(old_state.state) + _OLD_STATE.pack(
+            old_state.last_reported_timestamp
+        )
+    return (
+        _EVENT.pack(kind, event.origin.idx, event.time_fired_timestamp)
+        + context_fields
+        + state_fields
+    )
+
+
+def decode_event(record: bytes) -> Event:
+    """Decode a spool record to an event."""
+    reader = _Reader(record)
+    kind, origin_idx, time_fired_ts = reader.unpack(_EVENT)
+    event_type = reader.string()
+    assert event_type is not None
+    context = Context(
+        id=reader.string(), user_id=reader.string(), parent_id=reader.string()
+    )
+    origin = _ORIGINS[origin_idx]
+    if not kind & _KIND_STATE_CHANGED:
+        return Event(
+            event_type,
+            json_loads_object(reader.blob()),
+            origin,
+            time_fired_ts,
+            context,
+        )
+
+    entity_id = reader.string()
+    assert entity_id is not None
+    new_state: State | None = None
+    old_state: State | None = None
+    if kind & _HAS_NEW_STATE:
+        state = reader.string()
+        last_changed_ts, last_updated_ts, last_reported_ts = reader.unpack(_NEW_STATE)
+        new_state = State(
+            entity_id,
+            state or "",
+            json_loads_object(reader.blob()),
+            last_changed=dt_util.utc_from_timestamp(last_changed_ts),
+            last_reported=dt_util.utc_from_timestamp(last_reported_ts),
+            last_updated=dt_util.utc_from_timestamp(last_updated_ts),
+            context=context,
+            validate_entity_id=False,
+            last_updated_timestamp=last_updated_ts,
+        )
+    if kind & _HAS_OLD_STATE:
+        state = reader.string()
+        (last_reported_ts,) = reader.unpack(_OLD_STATE)
+        old_state = State(
+            entity_id,
+            state or "",
+            last_reported=dt_util.utc_from_timestamp(last_reported_ts),
+            validate_entity_id=False,
+        )
+    return Event(
+        event_type,
+        {"entity_id": entity_id, "old_state": old_state, "new_state": new_state},
+        origin,
+        time_fired_ts,
+        context,
+    )
+
+
+class EventSpool:
+    """An append-only file of events waiting to be written to the database.
+
+    This class is not thread-safe and must only be used from the
+    recorder thread.
+    """
+
+    def __init__(
+        self, path: Path, dialect_getter: Callable[[], SupportedDialect | None]
+    ) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self._dialect_getter = dialect_getter
+        self._file: BinaryIO | None = None
+        self._replay_offset = _HEADER.size
+        self._size = _HEADER.size
+
+    @property
+    def pending(self) -> bool:
+        """Return if there are events which have not been replayed yet."""
+        return self._size > self._replay_offset
+
+    def open(self) -> None:
+        """Open the spool, creating it if it does not exist."""
+        if not self.path.exists():
+            with self.path.open("wb") as file:
+                file.write(_HEADER.pack(_HEADER.size))
+        self._file = file = self.path.open("r+b")
+        header = file.read(_HEADER.size)
+        self._size = file.seek(0, os.SEEK_END)
+        if len(header) < _HEADER.size:
+            self._truncate()
+            return
+        (self._replay_offset,) = _HEADER.unpack(header)
+        if self.pending:
+            _LOGGER.info(
+                "The recorder spool %s has %s bytes of events to replay",
+                self.path,
+                self._size - self._replay_offset,
+            )
+
+    def close(self) -> None:
+        """Close the spool."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def append(self, event: Event) -> None:
+        """Append an event to the spool."""
+        assert self._file is not None
+        if (record := encode_event(event, self._dialect_getter())) is None:
+            return
+        file = self._file
+        file.seek(self._size)
+        file.write(_RECORD_LENGTH.pack(len(record)))
+        file.write(record)
+        self._size += _RECORD_LENGTH.size + len(record)
+
+    def flush(self) -> None:
+        """Flush the appended events to disk."""
+        assert self._file is not None
+        self._file.flush()
+
+    def read_batch(self, batch_size: int) -> tuple[list[Event], int]:
+        """Read up to batch_size events which have not been replayed yet.
+
+        Returns the events and the offset to pass to mark_replayed
+        once they have been committed to the database.
+        """
+        assert self._file is not None
+        file = self._file
+        file.seek(self._replay_offset)
+        offset = self._replay_offset
+        events: list[Event] = []
+        while len(events) < batch_size and offset < self._size:
+            length = -1
+            record = b""
+            if len(prefix := file.read(_RECORD_LENGTH.size)) == _RECORD_LENGTH.size:
+                (length,) = _RECORD_LENGTH.unpack(prefix)
+                record = file.read(length)
+            if len(record) != length:
+                # A record which was not completely written before a crash
+                _LOGGER.warning(
+                    "Discarding truncated record at the end of the recorder spool"
+                )
+                self._size = offset
+                break
+            offset += _RECORD_LENGTH.size + length
+            events.append(decode_event(record))
+        return events, offset
+
+    def mark_replayed(self, offset: int) -> None:
+        """Remember the events up to offset are in the database."""
+        if offset >= self._size:
+            self._truncate()
+            return
+        assert self._file is not None
+        self._replay_offset = offset
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(offset))
+        self._file.flush()
+
+    def _truncate(self) -> None:
+        """Remove all events from the spool."""
+        assert self._file is not None
+        file = self._file
+        file.seek(0)
+        file.write(_HEADER.pack(_HEADER.size))
+        file.truncate(_HEADER.size)
+        file.flush()
+        self._replay_offset = self._size = _HEADER.size
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Collection, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
@@ -59,6 +59,8 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -443,6 +445,118 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         for metadata_id, summary_item in summary.items()
     )
 
+    # Roll up the day and month the hour belongs to
+    if summary:
+        update_statistics_rollups(session, start_time_ts, end_time_ts, list(summary))
+
+
+def _rollup_period(
+    session: Session,
+    table: type[StatisticsDaily | StatisticsMonthly],
+    start_ts: float,
+    end_ts: float,
+    metadata_ids: Collection[int] | None,
+) -> None:
+    """Roll up the statistics of a single day or month.
+
+    Days are rolled up from hourly statistics, months are rolled up
+    from days with the daily means weighted by their number of hours.
+    """
+    source: type[Statistics | StatisticsDaily]
+    if table is StatisticsDaily:
+        source = Statistics
+        mean_count = func.count(Statistics.mean)
+        mean_column = func.avg(Statistics.mean)
+    else:
+        source = StatisticsDaily
+        mean_count = func.sum(StatisticsDaily.mean_count)
+        mean_column = func.sum(
+            StatisticsDaily.mean * StatisticsDaily.mean_count
+        ) / func.nullif(mean_count, 0)
+    source_filter = (source.start_ts >= start_ts) & (source.start_ts < end_ts)
+    table_filter = table.start_ts == start_ts
+    if metadata_ids is not None:
+        source_filter &= source.metadata_id.in_(metadata_ids)
+        table_filter &= table.metadata_id.in_(metadata_ids)
+
+    summary: dict[int, StatisticDataTimestamp] = {}
+    mean_counts: dict[int, int] = {}
+    for metadata_id, _mean, _min, _max, _mean_count in session.execute(
+        select(
+            source.metadata_id,
+            mean_column,
+            func.min(source.min),
+            func.max(source.max),
+            mean_count,
+        )
+        .filter(source_filter)
+        .group_by(source.metadata_id)
+    ):
+        summary[metadata_id] = {
+            "start_ts": start_ts,
+            "mean": _mean,
+            "min": _min,
+            "max": _max,
+        }
+        mean_counts[metadata_id] = _mean_count
+
+    # The sum, state and last reset of the period are the ones of its last row
+    last = (
+        select(
+            source.metadata_id,
+            source.last_reset_ts,
+            source.state,
+            source.sum,
+            func.row_number()
+            .over(
+                partition_by=source.metadata_id,
+                order_by=source.start_ts.desc(),
+            )
+            .label("rownum"),
+        )
+        .filter(source_filter)
+        .subquery()
+    )
+    for metadata_id, last_reset_ts, state, _sum, _ in session.execute(
+        select(last).filter(last.c.rownum == 1)
+    ):
+        summary[metadata_id].update(
+            {"last_reset_ts": last_reset_ts, "state": state, "sum": _sum}
+        )
+
+    session.query(table).filter(table_filter).delete(synchronize_session=False)
+    for metadata_id, summary_item in summary.items():
+        rollup = table.from_stats_ts(metadata_id, summary_item)
+        rollup.mean_count = mean_counts[metadata_id]
+        session.add(rollup)
+
+
+def update_statistics_rollups(
+    session: Session,
+    start_ts: float,
+    end_ts: float,
+    metadata_ids: Collection[int] | None = None,
+) -> None:
+    """Update the daily and monthly statistics overlapping start-end."""
+    rollups: tuple[
+        tuple[
+            type[StatisticsDaily | StatisticsMonthly],
+            Callable[[float], tuple[float, float]],
+        ],
+        ...,
+    ] = (
+        # Days must be rolled up first since months are rolled up from days
+        (StatisticsDaily, reduce_day_ts_factory()[1]),
+        (StatisticsMonthly, reduce_month_ts_factory()[1]),
+    )
+    for table, period_start_end in rollups:
+        period_start_ts, period_end_ts = period_start_end(start_ts)
+        while True:
+            _rollup_period(session, table, period_start_ts, period_end_ts, metadata_ids)
+            if period_end_ts >= end_ts:
+                break
+            period_start_ts, period_end_ts = period_start_end(period_end_ts)
+
 
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
@@ -545,6 +659,12 @@ def _compile_statistics(
         return modified_statistic_ids
 
     _LOGGER.debug("Compiling statistics for %s-%s", start, end)
+    if not execute_stmt_lambda_element(
+        session, _get_first_id_stmt(start - StatisticsShortTerm.duration)
+    ):
+        # The previous period was not compiled, the accumulated
+        # statistics can't be trusted to be continuous
+        instance.statistics_accumulator.reset()
     platform_stats: list[StatisticResult] = []
     current_metadata: dict[str, tuple[int, StatisticMetaData]] = {}
     # Collect statistics from all platforms implementing support
@@ -1450,7 +1570,7 @@ def statistic_during_period(
 
     result: dict[str, Any] = {}
 
-    with session_scope(hass=hass, read_only=True) as session:
+    with session_scope(hass=hass, read_only=True, replica=True) as session:
         # Fetch metadata for the given statistic_id
         if not (
             metadata := get_instance(hass).statistics_meta_manager.get(
@@ -1706,7 +1826,8 @@ def _statistics_during_period_with_session(
         # for custom integrations that call this method.
         statistic_ids = set(statistic_ids)  # type: ignore[unreachable]
     # Fetch metadata for the given (or all) statistic_ids
-    metadata = get_instance(hass).statistics_meta_manager.get_many(
+    instance = get_instance(hass)
+    metadata = instance.statistics_meta_manager.get_many(
         session, statistic_ids=statistic_ids
     )
     if not metadata:
@@ -1756,35 +1877,55 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    rollup_result: dict[str, list[StatisticsRow]] | None = None
+    if period in ("day", "month") and instance.statistics_rollups_ready:
+        rollup_result = _statistics_rollups_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata_ids,
+            metadata,
+            period,
+            units,
+            types,
+        )
 
-    if not stats:
-        return {}
+    if rollup_result is not None:
+        if not rollup_result:
+            return {}
+        result = rollup_result
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
+        if not stats:
+            return {}
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        result = _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
+
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
         _augment_result_with_change(
@@ -1795,6 +1936,58 @@ def _statistics_during_period_with_session(
     return result
 
 
+def _statistics_rollups_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata_ids: list[int] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]] | None:
+    """Return daily or monthly statistics from the rollup tables.
+
+    Returns None if the rollups were made for another time zone,
+    a rebuild of the rollups is then scheduled.
+    """
+    table: type[StatisticsDaily | StatisticsMonthly]
+    if period == "day":
+        table = StatisticsDaily
+        _, period_start_end = reduce_day_ts_factory()
+    else:
+        table = StatisticsMonthly
+        _, period_start_end = reduce_month_ts_factory()
+    stmt = _generate_statistics_during_period_stmt(
+        start_time, end_time, metadata_ids, table, types
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+    if not stats:
+        return {}
+
+    for row in stats:
+        if period_start_end(row.start_ts)[0] != row.start_ts:
+            _LOGGER.debug(
+                "Statistics rollups do not match the time zone, rebuilding them"
+            )
+            get_instance(hass).queue_statistics_rollups_rebuild()
+            return None
+
+    result = _sorted_statistics_to_dict(
+        hass, stats, statistic_ids, metadata, True, table, units, types
+    )
+    # Each row is a full period already, the end of
+    # the period depends on the time zone and DST
+    for stat_list in result.values():
+        for row in stat_list:
+            row["end"] = period_start_end(row["start"])[1]
+    return result
+
+
 def statistics_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -1809,7 +2002,7 @@ def statistics_during_period(
     If end_time is omitted, returns statistics newer than or equal to start_time.
     If statistic_ids is omitted, returns statistics for all statistics ids.
     """
-    with session_scope(hass=hass, read_only=True) as session:
+    with session_scope(hass=hass, read_only=True, replica=True) as session:
         return _statistics_during_period_with_session(
             hass,
             session,
@@ -2318,13 +2511,22 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    starts: list[datetime] = []
     for stat in statistics:
+        starts.append(stat["start"])
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
 
     if table != StatisticsShortTerm:
+        if starts:
+            update_statistics_rollups(
+                session,
+                min(starts).timestamp(),
+                (max(starts) + Statistics.duration).timestamp(),
+                (metadata_id,),
+            )
         return True
 
     # We just inserted new short term statistics, so we need to update the
@@ -2454,9 +2656,47 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        _adjust_sum_statistics_rollups(
+            session,
+            metadata[statistic_id][0],
+            start_time.replace(minute=0),
+            sum_adjustment,
+        )
+
     return True
 
 
+def _adjust_sum_statistics_rollups(
+    session: Session,
+    metadata_id: int,
+    start_time: datetime,
+    adj: float,
+) -> None:
+    """Adjust the daily and monthly statistics.
+
+    The day and month start_time is in are rolled up again, the sum of
+    later days and months is adjusted in the database.
+    """
+    start_time_ts = start_time.timestamp()
+    _, day_end_ts = reduce_day_ts_factory()[1](start_time_ts)
+    _, month_end_ts = reduce_month_ts_factory()[1](start_time_ts)
+    _adjust_sum_statistics(
+        session,
+        StatisticsDaily,
+        metadata_id,
+        dt_util.utc_from_timestamp(day_end_ts),
+        adj,
+    )
+    _adjust_sum_statistics(
+        session,
+        StatisticsMonthly,
+        metadata_id,
+        dt_util.utc_from_timestamp(month_end_ts),
+        adj,
+    )
+    update_statistics_rollups(session, start_time_ts, start_time_ts + 1, (metadata_id,))
+
+
 def _change_statistics_unit_for_table(
     session: Session,
     table: type[StatisticsBase],
@@ -2514,6 +2754,8 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsDaily,
+            StatisticsMonthly,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
@@ -0,0 +1,211 @@
+"""Incremental accumulation of short term statistics."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import math
+from typing import NamedTuple
+
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import State
+
+from .db_schema import StatisticsShortTerm
+
+PERIOD_SECONDS = StatisticsShortTerm.duration.total_seconds()
+
+
+class AccumulatedStatistics(NamedTuple):
+    """Statistics accumulated for a single 5-minute period."""
+
+    unit_of_measurement: str | None
+    min: float
+    max: float
+    mean: float
+
+
+def _float_or_none(state: str | None) -> float | None:
+    """Return the state as a finite float or None."""
+    try:
+        if state is not None and math.isfinite(value := float(state)):
+            return value
+    except (ValueError, TypeError):
+        pass
+    return None
+
+
+class _PeriodAccumulator:
+    """Running min, max and time weighted sum of a single period."""
+
+    __slots__ = ("base", "first_ts", "last", "last_ts", "min", "max", "integral")
+
+    def __init__(self, base: float | None) -> None:
+        """Initialize the period with the value at its start."""
+        self.base = base
+        self.first_ts = 0.0
+        self.last: float | None = None
+        self.last_ts = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.integral = 0.0
+
+    def add(self, value: float, timestamp: float) -> None:
+        """Add a value to the period."""
+        if self.last is None:
+            self.first_ts = timestamp
+        else:
+            self.integral += self.last * (timestamp - self.last_ts)
+        self.last = value
+        self.last_ts = timestamp
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+
+class _EntityAccumulator:
+    """Accumulate the states of an entity into 5-minute periods."""
+
+    __slots__ = ("unit", "covered_since_ts", "watermark_ts", "value", "value_ts")
+
+    def __init__(self, unit: str | None, value: float | None, timestamp: float) -> None:
+        """Initialize the accumulator with the first known state."""
+        self.unit = unit
+        # Periods starting after covered_since_ts have a known start state
+        self.covered_since_ts = timestamp
+        # The end of the last flushed period
+        self.watermark_ts = 0.0
+        self.value = value
+        self.value_ts = timestamp
+
+
+class StatisticsAccumulator:
+    """Accumulate min, max and mean of numeric states as they are recorded.
+
+    This allows the 5-minute statistics of tracked entities to be
+    compiled without reading the states of the period back from the
+    database. The accumulator is only used from the recorder thread.
+
+    An entity is only covered for a period if its state at the start of the
+    period is known, its unit did not change and all earlier periods were
+    flushed in order. Callers fall back to the database for everything else.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the accumulator."""
+        self._entities: dict[str, _EntityAccumulator] = {}
+        self._periods: dict[str, dict[float, _PeriodAccumulator]] = {}
+        self._paused = False
+
+    def __len__(self) -> int:
+        """Return the number of tracked entities."""
+        return len(self._entities)
+
+    def track(self, states: Iterable[State]) -> None:
+        """Track the given entities and stop tracking all others.
+
+        Entities which are not tracked yet are seeded with their current state.
+        """
+        if self._paused:
+            return
+        entities = self._entities
+        tracked = {state.entity_id: state for state in states}
+        for entity_id in entities.keys() - tracked.keys():
+            del entities[entity_id]
+            self._periods.pop(entity_id, None)
+        for entity_id, state in tracked.items():
+            if entity_id not in entities:
+                entities[entity_id] = _EntityAccumulator(
+                    state.attributes.get(ATTR_UNIT_OF_MEASUREMENT),
+                    _float_or_none(state.state),
+                    state.last_updated_timestamp,
+                )
+                self._periods[entity_id] = {}
+
+    def add(self, state: State | None, entity_id: str, timestamp: float) -> None:
+        """Add a recorded state of a tracked entity."""
+        if (entity := self._entities.get(entity_id)) is None:
+            return
+        if state is None:
+            unit = entity.unit
+            value = None
+        else:
+            unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+            value = _float_or_none(state.state)
+        if unit != entity.unit or timestamp < entity.value_ts:
+            # The unit changed or time went backwards, start over
+            self._entities[entity_id] = _EntityAccumulator(unit, value, timestamp)
+            self._periods[entity_id] = {}
+            return
+        periods = self._periods[entity_id]
+        period_start_ts = timestamp - timestamp % PERIOD_SECONDS
+        if (period := periods.get(period_start_ts)) is None:
+            period = periods[period_start_ts] = _PeriodAccumulator(entity.value)
+        if value is not None:
+            period.add(value, timestamp)
+        entity.value = value
+        entity.value_ts = timestamp
+
+    def invalidate(self, entity_ids: Iterable[str]) -> None:
+        """Stop tracking entities."""
+        for entity_id in entity_ids:
+            self._entities.pop(entity_id, None)
+            self._periods.pop(entity_id, None)
+
+    def reset(self) -> None:
+        """Stop tracking all entities."""
+        self._entities.clear()
+        self._periods.clear()
+
+    def pause(self) -> None:
+        """Stop tracking all entities until resumed.
+
+        Used while states are not recorded in order, e.g. when they
+        are spooled and replayed later.
+        """
+        self.reset()
+        self._paused = True
+
+    def resume(self) -> None:
+        """Track entities again from the next call to track."""
+        self._paused = False
+
+    def flush(
+        self, entity_id: str, start_ts: float, end_ts: float
+    ) -> AccumulatedStatistics | None:
+        """Return the statistics of a period and drop everything before its end.
+
+        Returns None if the period is not covered or there
+        were no numeric states during the period.
+        """
+        if (entity := self._entities.get(entity_id)) is None:
+            return None
+        periods = self._periods[entity_id]
+        period = periods.pop(start_ts, None)
+        for period_start_ts in [ts for ts in periods if ts < start_ts]:
+            del periods[period_start_ts]
+        covered = start_ts > entity.covered_since_ts and start_ts >= entity.watermark_ts
+        entity.watermark_ts = end_ts
+        if not covered:
+            return None
+        if period is None:
+            # No states during the period, the state at the start of
+            # the period is the state before the next recorded one
+            base = periods[min(periods)].base if periods else entity.value
+            if base is None:
+                return None
+            return AccumulatedStatistics(entity.unit, base, base, base)
+        base = period.base
+        if (last := period.last) is None:
+            if base is None:
+                return None
+            return AccumulatedStatistics(entity.unit, base, base, base)
+        integral = period.integral + last * (end_ts - period.last_ts)
+        if base is None:
+            # The mean starts at the first numeric state
+            mean = integral / (end_ts - period.first_ts)
+            return AccumulatedStatistics(entity.unit, period.min, period.max, mean)
+        integral += base * (period.first_ts - start_ts)
+        return AccumulatedStatistics(
+            entity.unit,
+            min(base, period.min),
+            max(base, period.max),
+            integral / (end_ts - start_ts),
+        )
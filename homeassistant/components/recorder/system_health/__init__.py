@@ -55,6 +55,19 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_history_cache_info(instance: Recorder) -> dict[str, Any]:
+    """Get history cache info."""
+    if (history_cache := instance.history_cache) is None:
+        return {}
+    return {
+        "history_cache_entities": len(history_cache),
+        "history_cache_size": round(history_cache.size / 1024 / 1024, 2),
+        "history_cache_hits": history_cache.stats.hits,
+        "history_cache_misses": history_cache.stats.misses,
+    }
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -72,4 +85,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | _async_get_history_cache_info(instance)
@@ -4,14 +4,17 @@ from __future__ import annotations
 
 from collections.abc import Collection, Iterable
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
+from lru import LRU
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import ATTR_ICON, ATTR_UNIT_OF_MEASUREMENT
 from homeassistant.core import Event, EventStateChangedData
 from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
+from ..const import VOLATILE_ATTRS_SCHEMA_VERSION
 from ..db_schema import StateAttributes
 from ..queries import get_shared_attributes
 from ..util import execute_stmt_lambda_element
@@ -28,15 +31,71 @@ if TYPE_CHECKING:
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
 
+# An attribute which changed in this many consecutive updates of
+# an entity is considered volatile and stored with the state
+VOLATILE_ATTRIBUTE_CHANGES = 3
+
+# The logbook queries these attributes from the shared attributes
+# in SQL, so they are never stored with the state
+NEVER_VOLATILE_ATTRIBUTES = frozenset({ATTR_ICON, ATTR_UNIT_OF_MEASUREMENT})
+
 _LOGGER = logging.getLogger(__name__)
 
 
+class _AttributeChanges:
+    """Learn which attributes of an entity change on most updates."""
+
+    __slots__ = ("attributes", "changes", "volatile")
+
+    def __init__(self, attributes: dict[str, Any]) -> None:
+        """Initialize with the first attributes of the entity."""
+        self.attributes = attributes
+        self.changes: dict[str, int] = {}
+        self.volatile: set[str] = set()
+
+    def update(self, attributes: dict[str, Any]) -> set[str]:
+        """Track the changed attributes and return the volatile ones."""
+        old_attributes = self.attributes
+        changes = self.changes
+        volatile = self.volatile
+        for key, value in attributes.items():
+            if key in volatile or key in NEVER_VOLATILE_ATTRIBUTES:
+                continue
+            if key not in old_attributes or old_attributes[key] == value:
+                changes.pop(key, None)
+            elif (count := changes.get(key, 0) + 1) >= VOLATILE_ATTRIBUTE_CHANGES:
+                del changes[key]
+                volatile.add(key)
+            else:
+                changes[key] = count
+        self.attributes = attributes
+        return volatile
+
+
 class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     """Manage the StateAttributes table."""
 
-    def __init__(self, recorder: Recorder) -> None:
+    def __init__(
+        self, recorder: Recorder, split_volatile_attributes: bool = False
+    ) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        # The attribute changes are only tracked if the volatile
+        # attributes are stored apart from the shared attributes
+        self._attribute_changes: LRU[str, _AttributeChanges] | None = (
+            LRU(CACHE_SIZE) if split_volatile_attributes else None
+        )
+
+    @property
+    def _split_volatile_attributes(self) -> bool:
+        """Return if the volatile attributes are stored apart."""
+        recorder = self.recorder
+        return (
+            self._attribute_changes is not None
+            and recorder.schema_version >= VOLATILE_ATTRS_SCHEMA_VERSION
+            # Only the modern history queries read the volatile attributes
+            and recorder.states_meta_manager.active
+        )
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
@@ -52,6 +111,66 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             )
             return None
 
+    def serialize_split_from_event(
+        self, event: Event[EventStateChangedData]
+    ) -> tuple[bytes, bytes | None] | None:
+        """Serialize the shared and the volatile attributes of the new state.
+
+        The volatile attributes are None unless the entity has attributes
+        which changed in its last updates, those are split off so the
+        shared attributes can still be deduplicated.
+        """
+        if (
+            not self._split_volatile_attributes
+            or (state := event.data["new_state"]) is None
+        ):
+            if (shared_attrs_bytes := self.serialize_from_event(event)) is None:
+                return None
+            return shared_attrs_bytes, None
+        attributes = StateAttributes.recorded_attributes(state)
+        entity_id = state.entity_id
+        attribute_changes = self._attribute_changes
+        assert attribute_changes is not None
+        if (entity_changes := attribute_changes.get(entity_id)) is None:
+            attribute_changes[entity_id] = _AttributeChanges(attributes)
+            volatile_keys: set[str] = set()
+        else:
+            volatile_keys = entity_changes.update(attributes)
+        dialect = self.recorder.dialect_name
+        try:
+            if not volatile_keys or not (
+                volatile := {
+                    key: value
+                    for key, value in attributes.items()
+                    if key in volatile_keys
+                }
+            ):
+                return StateAttributes.attrs_bytes(state, attributes, dialect), None
+            shared = {
+                key: value
+                for key, value in attributes.items()
+                if key not in volatile_keys
+            }
+            return (
+                StateAttributes.attrs_bytes(state, shared, dialect),
+                StateAttributes.attrs_bytes(state, volatile, dialect),
+            )
+        except JSON_ENCODE_EXCEPTIONS as ex:
+            _LOGGER.warning("State is not JSON serializable: %s: %s", state, ex)
+            return None
+
+    def adjust_lru_size(self, new_size: int) -> None:
+        """Adjust the LRU cache size.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().adjust_lru_size(new_size)
+        if (
+            attribute_changes := self._attribute_changes
+        ) is not None and new_size > attribute_changes.get_size():
+            attribute_changes.set_size(new_size)
+
     def load(
         self, events: list[Event[EventStateChangedData]], session: Session
     ) -> None:
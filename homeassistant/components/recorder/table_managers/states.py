@@ -75,6 +75,10 @@ class StatesManager:
         self._last_committed_id.clear()
         self._pending.clear()
 
+    def committed_state_ids(self) -> set[int]:
+        """Return the state_ids of the last committed states."""
+        return set(self._last_committed_id.values())
+
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
 
@@ -94,6 +94,9 @@ class UpdateStatesMetadataTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
+        if instance.history_cache is not None:
+            instance.history_cache.invalidate((self.entity_id, self.new_entity_id))
+        instance.statistics_accumulator.invalidate((self.entity_id, self.new_entity_id))
         entity_registry.update_states_metadata(
             instance,
             self.entity_id,
@@ -111,9 +114,24 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
+        if instance.history_cache is not None:
+            instance.history_cache.purge(self.purge_before.timestamp())
+        progress = instance.purge_progress
+        if progress is None or progress.purge_before != self.purge_before:
+            progress = instance.purge_progress = purge.PurgeProgress(
+                self.purge_before, self.repack, self.apply_filter
+            )
         if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
+            instance,
+            self.purge_before,
+            self.repack,
+            self.apply_filter,
+            progress=progress,
+            time_budget=purge.DEFAULT_PURGE_TIME_BUDGET,
         ):
+            progress.done = True
+            progress.states_remaining = progress.events_remaining = 0
+            instance.save_purge_progress()
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -121,7 +139,9 @@ class PurgeTask(RecorderTask):
             # tasks happen after a vacuum.
             periodic_db_cleanups(instance)
             return
-        # Schedule a new purge task if this one didn't finish
+        instance.save_purge_progress()
+        # Schedule a new purge task if this one didn't finish, it
+        # is queued behind the events which arrived in the meantime
         instance.queue_task(
             PurgeTask(self.purge_before, self.repack, self.apply_filter)
         )
@@ -136,6 +156,10 @@ class PurgeEntitiesTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
+        if instance.history_cache is not None:
+            instance.history_cache.purge(
+                self.purge_before.timestamp(), self.entity_filter
+            )
         if purge.purge_entity_data(instance, self.entity_filter, self.purge_before):
             return
         # Schedule a new purge task if this one didn't finish
@@ -154,6 +178,15 @@ class PerodicCleanupTask(RecorderTask):
         periodic_db_cleanups(instance)
 
 
+@dataclass(slots=True)
+class CreatePartitionsTask(RecorderTask):
+    """An object to insert into the recorder queue to create upcoming partitions."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._create_partitions()  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class StatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run a statistics task."""
@@ -280,6 +313,17 @@ class KeepAliveTask(RecorderTask):
         instance._send_keep_alive()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class ReplaySpoolTask(RecorderTask):
+    """Replay the spooled events once the database is reachable."""
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._replay_spool()  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class CommitTask(RecorderTask):
     """Commit the event session."""
@@ -23,6 +23,9 @@ from homeassistant.components.recorder.models import (
     StatisticMetaData,
     StatisticResult,
 )
+from homeassistant.components.recorder.statistics_accumulator import (
+    AccumulatedStatistics,
+)
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     REVOLUTIONS_PER_MINUTE,
@@ -368,6 +371,37 @@ def _wanted_statistics(sensor_states: list[State]) -> dict[str, set[str]]:
     }
 
 
+def _get_accumulated_statistics(
+    hass: HomeAssistant,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> dict[str, AccumulatedStatistics]:
+    """Return the statistics accumulated by the recorder during start-end."""
+    accumulator = get_instance(hass).statistics_accumulator
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
+    measurement_states = [
+        state
+        for state in sensor_states
+        if "sum" not in wanted_statistics[state.entity_id]
+    ]
+    accumulated: dict[str, AccumulatedStatistics] = {}
+    for state in measurement_states:
+        entity_id = state.entity_id
+        if (
+            (stats := accumulator.flush(entity_id, start_ts, end_ts)) is not None
+            # The values are normalized with the unit of the current state
+            and stats.unit_of_measurement
+            == state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        ):
+            accumulated[entity_id] = stats
+    # Keep accumulating the states of measurements for the next period
+    accumulator.track(measurement_states)
+    return accumulated
+
+
 def _last_reset_as_utc_isoformat(last_reset_s: Any, entity_id: str) -> str | None:
     """Parse last_reset and convert it to UTC."""
     if last_reset_s is None:
@@ -402,6 +436,9 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
+    accumulated = _get_accumulated_statistics(
+        hass, sensor_states, wanted_statistics, start, end
+    )
     # Get history between start and end
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
@@ -420,6 +457,7 @@ def compile_statistics(  # noqa: C901
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
+        and i.entity_id not in accumulated
     ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
@@ -434,6 +472,14 @@ def compile_statistics(  # noqa: C901
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if (accumulated_stats := accumulated.get(entity_id)) is not None:
+            # Normalized like the states the statistics were accumulated from
+            entities_with_float_states[entity_id] = [
+                (accumulated_stats.min, _state),
+                (accumulated_stats.max, _state),
+                (accumulated_stats.mean, _state),
+            ]
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
@@ -514,6 +560,12 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
+        if entity_id in accumulated:
+            # The statistics were accumulated while the states were recorded
+            (stat["min"], _), (stat["max"], _), (stat["mean"], _) = valid_float_states
+            result.append({"meta": meta, "stat": stat})
+            continue
+
         if "max" in wanted_statistics[entity_id]:
             stat["max"] = max(
                 *itertools.islice(zip(*valid_float_states, strict=False), 1)
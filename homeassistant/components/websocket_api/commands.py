@@ -79,6 +79,8 @@ def async_register_commands(
     """Register commands."""
     async_reg(hass, handle_call_service)
     async_reg(hass, handle_entity_source)
+    async_reg(hass, handle_event_bus_listener_stats)
+    async_reg(hass, handle_event_bus_set_profiling)
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_fire_event)
     async_reg(hass, handle_get_config)
@@ -330,6 +332,15 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
+    user = connection.user
+    if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
+        snapshot = hass.states.async_snapshot()
+        if not snapshot.unserializable:
+            _send_handle_get_states_response(
+                connection, msg["id"], list(snapshot.states.values())
+            )
+            return
+
     states = _async_get_allowed_states(hass, connection)
 
     try:
@@ -570,6 +581,42 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command(
+    {vol.Required("type"): "event_bus/set_profiling", vol.Required("enabled"): bool}
+)
+@decorators.require_admin
+def handle_event_bus_set_profiling(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle enabling or disabling profiling of the event bus listeners."""
+    if msg["enabled"]:
+        hass.bus.async_enable_profiling()
+    else:
+        hass.bus.async_disable_profiling()
+    connection.send_result(msg["id"])
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "event_bus/listener_stats"})
+@decorators.require_admin
+def handle_event_bus_listener_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle event bus listener stats command."""
+    if (profiler := hass.bus.profiler) is None:
+        connection.send_error(
+            msg["id"],
+            const.ERR_NOT_FOUND,
+            "Profiling of the event bus listeners is not enabled",
+        )
+        return
+    connection.send_result(
+        msg["id"],
+        {"started": profiler.started, "listeners": profiler.async_stats()},
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
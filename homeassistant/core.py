@@ -44,6 +44,7 @@ from typing import (
     overload,
 )
 from urllib.parse import urlparse
+import weakref
 
 from typing_extensions import TypeVar
 import voluptuous as vol
@@ -108,9 +109,11 @@ from .util.async_ import (
 from .util.event_type import EventType
 from .util.executor import InterruptibleThreadPoolExecutor
 from .util.hass_dict import HassDict
+from .util.histogram import LatencyHistogram
 from .util.json import JsonObjectType
 from .util.read_only_dict import ReadOnlyDict
 from .util.timeout import TimeoutManager
+from .util.timer_wheel import get_timer_wheel
 from .util.ulid import ulid_at_time, ulid_now
 from .util.unit_system import (
     _CONF_UNIT_SYSTEM_IMPERIAL,
@@ -146,6 +149,10 @@ DOMAIN = "homeassistant"
 # How long to wait to log tasks that are blocking
 BLOCK_LOG_TIMEOUT = 60
 
+# How many removed entities the state machine remembers for
+# StateMachine.async_changes_since before it prunes the oldest
+MAX_REMOVED_ENTITIES = 1024
+
 type ServiceResponse = JsonObjectType | None
 type EntityServiceResponse = dict[str, ServiceResponse]
 
@@ -1226,7 +1233,10 @@ class HomeAssistant:
 
     def _cancel_cancellable_timers(self) -> None:
         """Cancel timer handles marked as cancellable."""
-        for handle in get_scheduled_timer_handles(self.loop):
+        for handle in (
+            *get_scheduled_timer_handles(self.loop),
+            *get_timer_wheel(self.loop).timers(),
+        ):
             if (
                 not handle.cancelled()
                 and (args := handle._args)  # noqa: SLF001
@@ -1430,10 +1440,241 @@ class _OneTimeListener(Generic[_DataT]):
         return f"<_OneTimeListener {self.listener_job.target}>"
 
 
+class _KeyedListeners(Generic[_DataT]):
+    """Listeners of an event type indexed by a key of the event data."""
+
+    __slots__ = (
+        "count",
+        "dispatch_soon",
+        "jobs",
+        "key_getter",
+        "listener",
+        "match_all",
+    )
+
+    def __init__(
+        self,
+        key_getter: Callable[[_DataT], str | None],
+        dispatch_soon: bool,
+        match_all: bool,
+    ) -> None:
+        """Initialize the index."""
+        self.key_getter = key_getter
+        # The listeners run in the next iteration of the event loop
+        self.dispatch_soon = dispatch_soon
+        # The listeners of the MATCH_ALL key receive the events of all keys
+        self.match_all = match_all
+        self.jobs: defaultdict[str, list[_FilterableJobType[_DataT]]] = defaultdict(
+            list
+        )
+        # The number of subscriptions, a subscription can have several keys
+        self.count = 0
+        # The listener of the index on the event bus, set when it is added
+        self.listener: _FilterableJobType[_DataT] | None = None
+
+    @callback
+    def has_jobs(self, event_data: _DataT) -> bool:
+        """Return if there are listeners for the key of the event."""
+        if (key := self.key_getter(event_data)) is None:
+            return False
+        return key in self.jobs or (self.match_all and MATCH_ALL in self.jobs)
+
+    def get_jobs(self, event_data: _DataT) -> list[_FilterableJobType[_DataT]]:
+        """Return the jobs of the key of the event."""
+        if (key := self.key_getter(event_data)) is None:
+            return EMPTY_LIST
+        jobs = self.jobs
+        key_jobs: list[_FilterableJobType[_DataT]] = jobs.get(key, EMPTY_LIST)
+        if (
+            self.match_all
+            and key != MATCH_ALL
+            and (match_all_jobs := jobs.get(MATCH_ALL)) is not None
+        ):
+            return key_jobs + match_all_jobs
+        return key_jobs
+
+
+@callback
+def entity_id_event_key(event_data: Mapping[str, Any]) -> str | None:
+    """Return the entity_id of an event to index listeners by."""
+    return event_data.get("entity_id")
+
+
+@callback
+def device_id_event_key(event_data: Mapping[str, Any]) -> str | None:
+    """Return the device_id of an event to index listeners by."""
+    return event_data.get("device_id")
+
+
 # Empty list, used by EventBus.async_fire_internal
 EMPTY_LIST: list[Any] = []
 
 
+def _listener_target(job: HassJob[..., Any]) -> Any:
+    """Return the function a listener job ends up calling."""
+    target: Any = job.target
+    while True:
+        if isinstance(target, functools.partial):
+            target = target.func
+        elif isinstance(target, _OneTimeListener):
+            target = target.listener_job.target
+        else:
+            return target
+
+
+def _listener_integration(module: str) -> str:
+    """Return the integration a listener module belongs to."""
+    parts = module.split(".", 3)
+    if len(parts) > 2 and parts[0] == "homeassistant" and parts[1] == "components":
+        return parts[2]
+    if len(parts) > 1 and parts[0] == "custom_components":
+        return parts[1]
+    return parts[0]
+
+
+class ListenerStats:
+    """Statistics of the listeners with the same target."""
+
+    __slots__ = ("calls", "filter_calls", "filter_rejections", "histogram")
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.calls = 0
+        self.filter_calls = 0
+        self.filter_rejections = 0
+        self.histogram = LatencyHistogram()
+
+
+class EventBusProfiler:
+    """Measure the time spent in the event bus listeners.
+
+    The duration of a listener is the time the event loop spends running
+    its job when the event is fired, a coroutine function listener is
+    only accounted for the time it takes to create its task.
+    """
+
+    __slots__ = ("_job_stats", "_stats", "started")
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self.started = time.time()
+        # (integration, qualname) -> stats
+        self._stats: dict[tuple[str, str], ListenerStats] = {}
+        # The jobs are weakly referenced to not keep removed listeners alive
+        self._job_stats: weakref.WeakKeyDictionary[HassJob[..., Any], ListenerStats] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _stats_for_job(self, job: HassJob[..., Any]) -> ListenerStats:
+        """Return the statistics of a job."""
+        if (stats := self._job_stats.get(job)) is not None:
+            return stats
+        target = _listener_target(job)
+        module = getattr(target, "__module__", None) or ""
+        qualname = getattr(target, "__qualname__", None) or type(target).__qualname__
+        key = (_listener_integration(module), f"{module}.{qualname}")
+        if (stats := self._stats.get(key)) is None:
+            stats = self._stats[key] = ListenerStats()
+        self._job_stats[job] = stats
+        return stats
+
+    @callback
+    def async_fire(
+        self,
+        hass: HomeAssistant,
+        jobs: list[_FilterableJobType[_DataT]],
+        event_type: EventType[_DataT] | str,
+        event_data: _DataT | None,
+        origin: EventOrigin,
+        context: Context | None,
+        time_fired: float | None,
+    ) -> None:
+        """Run the listener jobs of an event and measure them.
+
+        This mirrors EventBus.async_fire_internal.
+        """
+        event: Event[_DataT] | None = None
+        for job, event_filter in jobs:
+            stats = self._stats_for_job(job)
+            if event_filter is not None:
+                stats.filter_calls += 1
+                try:
+                    if event_data is None or not event_filter(event_data):
+                        stats.filter_rejections += 1
+                        continue
+                except Exception:
+                    _LOGGER.exception("Error in event filter")
+                    stats.filter_rejections += 1
+                    continue
+
+            if not event:
+                event = Event(
+                    event_type,
+                    event_data,
+                    origin,
+                    time_fired,
+                    context,
+                )
+
+            self._async_run_job(hass, job, event, stats)
+
+    @callback
+    def async_run_job(
+        self, hass: HomeAssistant, job: HassJob[..., Any], event: Event[_DataT]
+    ) -> None:
+        """Run the job of a listener outside of firing the event and measure it.
+
+        This is used for the keyed listeners dispatched in the next
+        iteration of the event loop.
+        """
+        self._async_run_job(hass, job, event, self._stats_for_job(job))
+
+    @callback
+    def _async_run_job(
+        self,
+        hass: HomeAssistant,
+        job: HassJob[..., Any],
+        event: Event[_DataT],
+        stats: ListenerStats,
+    ) -> None:
+        """Run the job of a listener and add its duration to its statistics."""
+        start = time.perf_counter()
+        try:
+            hass.async_run_hass_job(job, event)
+        except Exception:
+            _LOGGER.exception("Error running job: %s", job)
+        stats.histogram.add(time.perf_counter() - start)
+        stats.calls += 1
+
+    @callback
+    def async_stats(self) -> list[dict[str, Any]]:
+        """Return the statistics of the listeners, slowest first."""
+        return sorted(
+            (
+                {
+                    "integration": integration,
+                    "listener": listener,
+                    "calls": stats.calls,
+                    "filter_calls": stats.filter_calls,
+                    "filter_rejections": stats.filter_rejections,
+                    "filter_rejection_rate": (
+                        stats.filter_rejections / stats.filter_calls
+                        if stats.filter_calls
+                        else 0.0
+                    ),
+                    **{
+                        f"duration_{key}": value
+                        for key, value in stats.histogram.as_dict().items()
+                        if key != "count"
+                    },
+                }
+                for (integration, listener), stats in self._stats.items()
+            ),
+            key=lambda listener_stats: listener_stats["duration_total"],
+            reverse=True,
+        )
+
+
 @functools.lru_cache
 def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> None:
     """Verify the length of the event type and raise if too long."""
@@ -1444,7 +1685,14 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+        "_profiler",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1453,7 +1701,11 @@ class EventBus:
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        self._keyed_listeners: dict[
+            EventType[Any] | str, list[_KeyedListeners[Any]]
+        ] = {}
         self._hass = hass
+        self._profiler: EventBusProfiler | None = None
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
 
@@ -1475,6 +1727,31 @@ class EventBus:
         """Return dictionary with events and the number of listeners."""
         return run_callback_threadsafe(self._hass.loop, self.async_listeners).result()
 
+    @property
+    def profiler(self) -> EventBusProfiler | None:
+        """Return the profiler of the listeners if profiling is enabled."""
+        return self._profiler
+
+    @callback
+    def async_enable_profiling(self) -> EventBusProfiler:
+        """Start measuring the listeners, if not already started.
+
+        This method must be run in the event loop.
+        """
+        if self._profiler is None:
+            self._profiler = EventBusProfiler()
+        return self._profiler
+
+    @callback
+    def async_disable_profiling(self) -> EventBusProfiler | None:
+        """Stop measuring the listeners and return the profiler.
+
+        This method must be run in the event loop.
+        """
+        profiler = self._profiler
+        self._profiler = None
+        return profiler
+
     def fire(
         self,
         event_type: EventType[_DataT] | str,
@@ -1539,6 +1816,18 @@ class EventBus:
         else:
             match_all_listeners = EMPTY_LIST
 
+        if self._profiler is not None:
+            self._profiler.async_fire(
+                self._hass,
+                listeners + match_all_listeners,
+                event_type,
+                event_data,
+                origin,
+                context,
+                time_fired,
+            )
+            return
+
         event: Event[_DataT] | None = None
         for job, event_filter in listeners + match_all_listeners:
             if event_filter is not None:
@@ -1638,6 +1927,139 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        key_getter: Callable[[_DataT], str | None],
+        keys: str | Iterable[str],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        job_type: HassJobType | None = None,
+        *,
+        dispatch_soon: bool = False,
+        match_all: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with one of the given keys.
+
+        The key of an event is returned by key_getter, which must be a
+        callable decorated with @callback. Listeners sharing the same
+        key_getter are kept in a dict by key, so the cost of firing an
+        event does not grow with the number of listeners like it does
+        with an event_filter. Events for which key_getter returns None
+        are not dispatched. If match_all is set, listeners of the MATCH_ALL
+        key receive the events of all keys.
+
+        Each index is a single listener on the event bus, so its
+        listeners run in the order of the first listener of the index
+        relative to the other listeners of the event type.
+
+        Use entity_id_event_key or device_id_event_key for events
+        with an entity_id or a device_id.
+
+        If dispatch_soon is set, the listeners run in the next iteration
+        of the event loop and the listeners of the key are looked up at
+        that time.
+
+        This method must be run in the event loop.
+        """
+        if not is_callback_check_partial(key_getter):
+            raise HomeAssistantError(f"Event key getter {key_getter} is not a callback")
+        indexes = self._keyed_listeners.setdefault(event_type, [])
+        for index in indexes:
+            if (
+                index.key_getter is key_getter
+                and index.dispatch_soon is dispatch_soon
+                and index.match_all is match_all
+            ):
+                break
+        else:
+            index = _KeyedListeners(key_getter, dispatch_soon, match_all)
+            index.listener = (
+                HassJob(
+                    functools.partial(
+                        self._async_dispatch_keyed_soon
+                        if dispatch_soon
+                        else self._async_dispatch_keyed,
+                        index,
+                    ),
+                    f"dispatch {event_type}",
+                    job_type=HassJobType.Callback,
+                ),
+                index.has_jobs,
+            )
+            self._listeners[event_type].append(index.listener)
+            indexes.append(index)
+        filterable_job: _FilterableJobType[_DataT] = (
+            HassJob(listener, f"listen {event_type} {keys}", job_type=job_type),
+            None,
+        )
+        if isinstance(keys, str):
+            keys = (keys,)
+        else:
+            keys = tuple(keys)
+        jobs = index.jobs
+        for key in keys:
+            jobs[key].append(filterable_job)
+        index.count += 1
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, index, keys, filterable_job
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        index: _KeyedListeners[_DataT],
+        keys: tuple[str, ...],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a listener of a specific event_type and keys.
+
+        This method must be run in the event loop.
+        """
+        jobs = index.jobs
+        try:
+            for key in keys:
+                jobs[key].remove(filterable_job)
+                if not jobs[key]:
+                    del jobs[key]
+        except ValueError:
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+            return
+        index.count -= 1
+        if index.count:
+            return
+        indexes = self._keyed_listeners[event_type]
+        indexes.remove(index)
+        if not indexes:
+            del self._keyed_listeners[event_type]
+        assert index.listener is not None
+        self._async_remove_listener(event_type, index.listener)
+
+    @callback
+    def _async_dispatch_keyed_soon(
+        self, index: _KeyedListeners[_DataT], event: Event[_DataT]
+    ) -> None:
+        """Dispatch an event to keyed listeners in the next loop iteration."""
+        self._hass.loop.call_soon(self._async_dispatch_keyed, index, event)
+
+    @callback
+    def _async_dispatch_keyed(
+        self, index: _KeyedListeners[_DataT], event: Event[_DataT]
+    ) -> None:
+        """Dispatch an event to the keyed listeners of its key."""
+        profiler = self._profiler
+        for job, _ in index.get_jobs(event.data).copy():
+            if profiler is not None:
+                profiler.async_run_job(self._hass, job, event)
+                continue
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", job)
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1727,6 +2149,60 @@ class EventBus:
             )
 
 
+class _InternedAttributes(ReadOnlyDict[str, Any]):
+    """Attributes shared by the states with structurally identical attributes."""
+
+    @cached_property
+    def json_fragment(self) -> json_fragment:
+        """Return a JSON fragment of the attributes."""
+        return json_fragment(json_bytes(self))
+
+
+_JSON_SCALAR_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def _freeze_attribute(value: Any) -> Any:
+    """Return a hashable form of an attribute value.
+
+    Only JSON scalars and dicts and lists of them can be frozen, since
+    other values which compare equal, like datetimes in different time
+    zones or Decimal("1.0") and Decimal("1.00"), serialize differently.
+    The type is part of the hashable form since the scalars 1 and True
+    compare equal, and floats are frozen by their exact value so 0.0
+    and -0.0 are told apart.
+
+    Raises TypeError if the value cannot be frozen.
+    """
+    value_type = type(value)
+    if value_type in _JSON_SCALAR_TYPES:
+        return (value_type, value)
+    if value_type is float:
+        return (value_type, value.hex())
+    if value_type is dict or value_type is ReadOnlyDict:
+        return (
+            value_type,
+            tuple((key, _freeze_attribute(item)) for key, item in value.items()),
+        )
+    if value_type is list or value_type is tuple:
+        return (value_type, tuple(_freeze_attribute(item) for item in value))
+    raise TypeError(f"Cannot freeze {value_type}")
+
+
+def _freeze_attributes(attributes: Mapping[str, Any]) -> tuple[Any, ...]:
+    """Return a hashable form of the attributes of a state."""
+    return tuple((name, _freeze_attribute(value)) for name, value in attributes.items())
+
+
+def _copy_attribute(value: Any) -> Any:
+    """Return a copy of the dicts and lists of a frozen attribute value."""
+    value_type = type(value)
+    if value_type is dict or value_type is ReadOnlyDict:
+        return value_type({key: _copy_attribute(item) for key, item in value.items()})
+    if value_type is list or value_type is tuple:
+        return value_type(_copy_attribute(item) for item in value)
+    return value
+
+
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
 
@@ -1780,7 +2256,10 @@ class State:
         # State only creates and expects a ReadOnlyDict so
         # there is no need to check for subclassing with
         # isinstance here so we can use the faster type check.
-        if type(attributes) is not ReadOnlyDict:
+        if (
+            type(attributes) is not ReadOnlyDict
+            and type(attributes) is not _InternedAttributes
+        ):
             self.attributes = ReadOnlyDict(attributes or {})
         else:
             self.attributes = attributes
@@ -1881,6 +2360,9 @@ class State:
     @cached_property
     def as_dict_json(self) -> bytes:
         """Return a JSON string of the State."""
+        if type(attributes := self.attributes) is _InternedAttributes:
+            # The JSON of shared attributes is only serialized once
+            return json_bytes({**self._as_dict, "attributes": attributes.json_fragment})
         return json_bytes(self._as_dict)
 
     @cached_property
@@ -1924,7 +2406,13 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_bytes({self.entity_id: self.as_compressed_state})[1:-1]
+        compressed_state: Mapping[str, Any] = self.as_compressed_state
+        if type(attributes := self.attributes) is _InternedAttributes:
+            compressed_state = {
+                **compressed_state,
+                COMPRESSED_STATE_ATTRIBUTES: attributes.json_fragment,
+            }
+        return json_bytes({self.entity_id: compressed_state})[1:-1]
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -2032,10 +2520,65 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+def _async_serialize_states(
+    states: dict[str, State], entity_ids: Iterable[str]
+) -> tuple[dict[str, bytes], set[str]]:
+    """Return the JSON of the states of entity_ids and the unserializable ones.
+
+    Entity ids which are not in states are skipped.
+    """
+    serialized: dict[str, bytes] = {}
+    unserializable: set[str] = set()
+    for entity_id in entity_ids:
+        if (state := states.get(entity_id)) is None:
+            continue
+        try:
+            serialized[entity_id] = state.as_dict_json
+        except (ValueError, TypeError):
+            unserializable.add(entity_id)
+    return serialized, unserializable
+
+
+@dataclass(slots=True, frozen=True)
+class StateSnapshot:
+    """The JSON of all states at a sequence of the state machine.
+
+    The JSON is the cached State.as_dict_json, taking a snapshot
+    only serializes the states which were not serialized before.
+    The snapshot never changes and can be read from any thread.
+    """
+
+    sequence: int
+    states: Mapping[str, bytes]
+    unserializable: frozenset[str]
+
+
+@dataclass(slots=True, frozen=True)
+class StateChanges:
+    """The JSON of the states which changed after a sequence of the state machine."""
+
+    sequence: int
+    changed: Mapping[str, bytes]
+    removed: tuple[str, ...]
+    unserializable: frozenset[str]
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_interned_attributes",
+        "_sequence",
+        "_changed",
+        "_removed_count",
+        "_oldest_sequence",
+        "_snapshot",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2046,6 +2589,17 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._interned_attributes: weakref.WeakValueDictionary[
+            int, _InternedAttributes
+        ] = weakref.WeakValueDictionary()
+        # The sequence is incremented on every state change and removal
+        self._sequence = 0
+        # entity_id -> sequence of its last change, ordered by sequence
+        self._changed: dict[str, int] = {}
+        self._removed_count = 0
+        # The oldest sequence async_changes_since can answer for
+        self._oldest_sequence = 0
+        self._snapshot: StateSnapshot | None = None
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2157,6 +2711,10 @@ class StateMachine:
         if old_state is None:
             return False
 
+        self._async_track_change(entity_id)
+        self._removed_count += 1
+        if self._removed_count > MAX_REMOVED_ENTITIES:
+            self._async_prune_removed()
         old_state.expire()
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
@@ -2326,6 +2884,8 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        else:
+            attributes = self._async_intern_attributes(attributes)
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2343,7 +2903,11 @@ class StateMachine:
         )
         if old_state is not None:
             old_state.expire()
+        elif entity_id in self._changed:
+            # A removed entity which is added again
+            self._removed_count -= 1
         self._states[entity_id] = state
+        self._async_track_change(entity_id)
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
@@ -2356,6 +2920,139 @@ class StateMachine:
             time_fired=timestamp,
         )
 
+    @property
+    def sequence(self) -> int:
+        """Return the sequence of the last state change."""
+        return self._sequence
+
+    @callback
+    def async_snapshot(self) -> StateSnapshot:
+        """Return the JSON of all states at the current sequence.
+
+        The snapshot is refreshed on the first call after the states
+        changed, by copying the previous snapshot and replacing the
+        JSON of the states which changed since.
+
+        This method must be run in the event loop.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.sequence == self._sequence:
+            return snapshot
+        if snapshot is None or snapshot.sequence < self._oldest_sequence:
+            states, unserializable = _async_serialize_states(
+                self._states_data, self._states_data
+            )
+        else:
+            states = dict(snapshot.states)
+            unserializable = set(snapshot.unserializable)
+            changed = self._async_changed_since(snapshot.sequence)
+            changed_states, changed_unserializable = _async_serialize_states(
+                self._states_data, changed
+            )
+            for entity_id in changed:
+                # Replacing the JSON of a state keeps the order of the states
+                if (json := changed_states.get(entity_id)) is None:
+                    states.pop(entity_id, None)
+                else:
+                    states[entity_id] = json
+            unserializable.difference_update(changed)
+            unserializable.update(changed_unserializable)
+        self._snapshot = snapshot = StateSnapshot(
+            self._sequence, states, frozenset(unserializable)
+        )
+        return snapshot
+
+    @callback
+    def async_changes_since(self, sequence: int) -> StateChanges | None:
+        """Return the JSON of the states which changed after sequence.
+
+        Returns None if the sequence is too old to know which entities
+        were removed since, the caller should take a snapshot instead.
+
+        This method must be run in the event loop.
+        """
+        if sequence < self._oldest_sequence or sequence > self._sequence:
+            return None
+        entity_ids = self._async_changed_since(sequence)
+        changed, unserializable = _async_serialize_states(self._states_data, entity_ids)
+        return StateChanges(
+            self._sequence,
+            changed,
+            tuple(
+                entity_id
+                for entity_id in entity_ids
+                if entity_id not in self._states_data
+            ),
+            frozenset(unserializable),
+        )
+
+    @callback
+    def _async_changed_since(self, sequence: int) -> list[str]:
+        """Return the entity ids which changed after sequence in order of change."""
+        entity_ids: list[str] = []
+        for entity_id, changed_sequence in reversed(self._changed.items()):
+            if changed_sequence <= sequence:
+                break
+            entity_ids.append(entity_id)
+        entity_ids.reverse()
+        return entity_ids
+
+    @callback
+    def _async_track_change(self, entity_id: str) -> None:
+        """Move entity_id to the end of the changes with a new sequence."""
+        self._sequence += 1
+        changed = self._changed
+        changed.pop(entity_id, None)
+        changed[entity_id] = self._sequence
+
+    @callback
+    def _async_prune_removed(self) -> None:
+        """Forget the oldest half of the removed entities."""
+        changed = self._changed
+        states_data = self._states_data
+        to_prune = self._removed_count // 2
+        for entity_id, changed_sequence in list(changed.items()):
+            if not to_prune:
+                break
+            if entity_id in states_data:
+                continue
+            del changed[entity_id]
+            self._oldest_sequence = changed_sequence
+            self._removed_count -= 1
+            to_prune -= 1
+
+    @callback
+    def _async_intern_attributes(
+        self, attributes: Mapping[str, Any] | None
+    ) -> Mapping[str, Any] | None:
+        """Return the shared attributes which are identical to attributes.
+
+        The shared attributes are looked up by the hash of their hashable
+        form, which is not kept to not spend more memory on the key than
+        is saved by sharing. Attributes with values which cannot be frozen
+        and attributes with a colliding hash are not shared. The dicts and
+        lists of the shared attributes are copied, so they do not change
+        with the dicts and lists of the attributes they were created from.
+        """
+        if attributes is None:
+            attributes = {}
+        elif type(attributes) is _InternedAttributes:
+            return attributes
+        try:
+            frozen = _freeze_attributes(attributes)
+        except TypeError:
+            return attributes
+        key = hash(frozen)
+        if (interned := self._interned_attributes.get(key)) is None:
+            interned = _InternedAttributes(
+                {name: _copy_attribute(value) for name, value in attributes.items()}
+            )
+            self._interned_attributes[key] = interned
+            return interned
+        if _freeze_attributes(interned) == frozen:
+            return interned
+        return attributes
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
@@ -85,6 +85,22 @@ CAPABILITIES_UPDATE_LIMIT = 100
 
 CONTEXT_RECENT_TIME_SECONDS = 5  # Time that a context is considered recent
 
+# The entity registry option with the window in milliseconds in which
+# the state writes of an entity are coalesced into a single state change
+COALESCE_OPTIONS_DOMAIN = "homeassistant"
+COALESCE_WINDOW_OPTION = "coalesce_window"
+# Longer windows would hold back the state of an entity for too long
+MAX_COALESCE_WINDOW = 60000
+
+COALESCE_OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(COALESCE_WINDOW_OPTION): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=MAX_COALESCE_WINDOW)
+        ),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
 
 @callback
 def async_setup(hass: HomeAssistant) -> None:
@@ -521,6 +537,11 @@ class Entity(
     __capabilities_updated_at_reported: bool = False
     __remove_future: asyncio.Future[None] | None = None
 
+    # Coalescing of state writes
+    __coalesced_write: asyncio.TimerHandle | None = None
+    __coalesced_write_time: float | None = None
+    __last_state_write: float = 0
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
@@ -1125,6 +1146,19 @@ class Entity(
                 )
             return
 
+        coalesced_write_time: float | None = None
+        if (
+            entry
+            and (options := entry.options.get(COALESCE_OPTIONS_DOMAIN))
+            and (window := options.get(COALESCE_WINDOW_OPTION))
+            # The options can be set without the schema, ignore invalid windows
+            and type(window) in (int, float)
+            and 0 < window <= MAX_COALESCE_WINDOW
+        ):
+            if self.__async_coalesce_write(window / 1000):
+                return
+            coalesced_write_time = self.__coalesced_write_time
+
         state_calculate_start = timer()
         state, attr, capabilities, original_device_class, supported_features = (
             self.__async_calculate_state()
@@ -1213,7 +1247,7 @@ class Entity(
                 self.force_update,
                 self._context,
                 self._state_info,
-                time_now,
+                time_now if coalesced_write_time is None else coalesced_write_time,
             )
         except InvalidStateError:
             _LOGGER.exception(
@@ -1223,6 +1257,50 @@ class Entity(
                 entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
             )
 
+    @callback
+    def __async_coalesce_write(self, window: float) -> bool:
+        """Return if the state write is coalesced into a later write.
+
+        The first write after a quiet period is written right away. Writes
+        within the window after it are collapsed into a single write of the
+        latest state when the window ends.
+        """
+        now = timer()
+        if self.__coalesced_write is not None:
+            self.__coalesced_write_time = now
+            return True
+        if (
+            self.__coalesced_write_time is None
+            and now - self.__last_state_write < window
+        ):
+            self.__coalesced_write_time = now
+            self.__coalesced_write = self.hass.loop.call_later(
+                self.__last_state_write + window - now,
+                self.__async_write_coalesced_state,
+            )
+            return True
+        self.__last_state_write = now
+        return False
+
+    @callback
+    def __async_write_coalesced_state(self) -> None:
+        """Write the latest state at the end of the coalescing window.
+
+        The state is written with the time of the last coalesced write
+        to keep last_updated and last_reported accurate.
+        """
+        self.__coalesced_write = None
+        self._async_write_ha_state()
+        self.__coalesced_write_time = None
+
+    @callback
+    def __async_cancel_coalesced_write(self) -> None:
+        """Cancel the pending coalesced state write."""
+        if self.__coalesced_write is not None:
+            self.__coalesced_write.cancel()
+            self.__coalesced_write = None
+        self.__coalesced_write_time = None
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -1396,6 +1474,7 @@ class Entity(
         self._platform_state = EntityPlatformState.REMOVED
 
         self._call_on_remove_callbacks()
+        self.__async_cancel_coalesced_write()
 
         await self.async_internal_will_remove_from_hass()
         await self.async_will_remove_from_hass()
@@ -75,13 +75,19 @@ def get_current_frame(depth: int = 0) -> FrameType:
     return sys._getframe(depth + 1)  # noqa: SLF001
 
 
-def get_integration_frame(exclude_integrations: set | None = None) -> IntegrationFrame:
-    """Return the frame, integration and integration path of the current stack frame."""
+def get_integration_frame(
+    exclude_integrations: set | None = None, *, frame: FrameType | None = None
+) -> IntegrationFrame:
+    """Return the frame, integration and integration path of the current stack frame.
+
+    If frame is passed, its stack is searched instead of the current stack.
+    """
     found_frame = None
     if not exclude_integrations:
         exclude_integrations = set()
 
-    frame: FrameType | None = get_current_frame()
+    if frame is None:
+        frame = get_current_frame()
     while frame is not None:
         filename = frame.f_code.co_filename
 
@@ -0,0 +1,121 @@
+"""Pre-warm the modules imported while Home Assistant starts.
+
+After Home Assistant has started, the source files of the modules which
+were imported are stored. On the next start a background job goes over
+them in the order they were imported: stale or missing bytecode is
+compiled, and the bytecode of the other modules is read so it is in the
+page cache of the operating system. Imports on the critical path of the
+start then do not have to compile or wait for slow storage.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import importlib.util
+import logging
+import os
+import py_compile
+import sys
+import threading
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.loader import async_get_import_times
+
+from .storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = "core.import_prewarm"
+STORAGE_VERSION = 1
+
+# How many of the slowest integration imports are logged after start
+SLOWEST_IMPORTS = 10
+
+
+def _imported_source_files() -> list[str]:
+    """Return the source files of the imported modules in import order."""
+    return [
+        origin
+        for module in list(sys.modules.values())
+        if (spec := getattr(module, "__spec__", None)) is not None
+        and spec.has_location
+        and isinstance(origin := spec.origin, str)
+        and origin.endswith(".py")
+    ]
+
+
+def _prewarm(files: Iterable[str], stop_event: threading.Event) -> dict[str, int]:
+    """Compile stale bytecode and read the bytecode of the other files."""
+    stats = {"compiled": 0, "read": 0, "missing": 0}
+    for source in files:
+        if stop_event.is_set():
+            break
+        try:
+            cached = importlib.util.cache_from_source(source)
+            source_mtime = os.stat(source).st_mtime
+        except (NotImplementedError, ValueError, OSError):
+            stats["missing"] += 1
+            continue
+        try:
+            cached_mtime = os.stat(cached).st_mtime
+        except OSError:
+            cached_mtime = None
+        if cached_mtime is None or cached_mtime < source_mtime:
+            try:
+                py_compile.compile(source, cfile=cached, doraise=True)
+            except (py_compile.PyCompileError, OSError):
+                stats["missing"] += 1
+            else:
+                stats["compiled"] += 1
+            continue
+        try:
+            with open(cached, "rb") as file:
+                file.read()
+        except OSError:
+            stats["missing"] += 1
+        else:
+            stats["read"] += 1
+    return stats
+
+
+async def async_setup(hass: HomeAssistant) -> None:
+    """Pre-warm the modules of the previous start and record the current one."""
+    store = Store[dict[str, Any]](hass, STORAGE_VERSION, STORAGE_KEY)
+    stop_event = threading.Event()
+
+    @callback
+    def _async_stop(_: Event) -> None:
+        stop_event.set()
+
+    async def _async_record(_: Event) -> None:
+        import_times = async_get_import_times(hass)
+        slowest = dict(
+            sorted(import_times.items(), key=lambda item: item[1], reverse=True)[
+                :SLOWEST_IMPORTS
+            ]
+        )
+        _LOGGER.info(
+            "Imported %s integrations in %.2f seconds, the slowest were: %s",
+            len(import_times),
+            sum(import_times.values()),
+            {domain: round(seconds, 3) for domain, seconds in slowest.items()},
+        )
+        files = await hass.async_add_executor_job(_imported_source_files)
+        await store.async_save({"files": files, "import_times": import_times})
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_record)
+
+    if not (data := await store.async_load()):
+        return
+    start = time.monotonic()
+    stats = await hass.async_add_executor_job(_prewarm, data["files"], stop_event)
+    _LOGGER.debug(
+        "Pre-warmed %s modules in %.2f seconds: %s",
+        sum(stats.values()),
+        time.monotonic() - start,
+        stats,
+    )
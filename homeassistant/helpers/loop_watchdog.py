@@ -0,0 +1,164 @@
+"""Watchdog which measures the lag of the event loop.
+
+The watchdog schedules a heartbeat on the event loop and measures how
+late it runs, which is how long the event loop was busy running other
+callbacks. A thread checks that the heartbeat keeps running. When it is
+overdue by more than the threshold, the thread takes the stack of the
+event loop thread to find the integration running the slow callback.
+
+The heartbeat samples the event loop instead of timing every callback,
+which would slow down all of them. A callback blocks the heartbeat for
+its duration minus up to one heartbeat interval, so the interval is kept
+below the threshold: every callback which runs longer than the threshold
+plus the interval is found, shorter ones above the threshold may be
+missed and the reported duration is a lower bound.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+import sys
+import threading
+import time
+from types import FrameType
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.histogram import LatencyHistogram
+
+from .frame import MissingIntegrationFrame, get_integration_frame
+
+DEFAULT_THRESHOLD = 0.1
+# Must be below the threshold, see above
+HEARTBEAT_INTERVAL = 0.05
+MAX_SLOW_CALLBACKS = 50
+
+
+@dataclass(slots=True, frozen=True)
+class SlowCallback:
+    """A callback which blocked the event loop for longer than the threshold."""
+
+    timestamp: float
+    duration: float
+    integration: str | None
+    location: str | None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict of the slow callback."""
+        return {
+            "timestamp": self.timestamp,
+            "duration": self.duration,
+            "integration": self.integration,
+            "location": self.location,
+        }
+
+
+def _attribute_frame(frame: FrameType) -> tuple[str | None, str | None]:
+    """Return the integration and the location running in the stack of frame."""
+    try:
+        integration_frame = get_integration_frame(frame=frame)
+    except MissingIntegrationFrame:
+        code = frame.f_code
+        return None, f"{code.co_filename}:{frame.f_lineno}"
+    return (
+        integration_frame.integration,
+        f"{integration_frame.relative_filename}:{integration_frame.line_number}",
+    )
+
+
+class LoopWatchdog:
+    """Measure the lag of the event loop and find the slow callbacks."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        threshold: float = DEFAULT_THRESHOLD,
+        interval: float = HEARTBEAT_INTERVAL,
+    ) -> None:
+        """Initialize the watchdog."""
+        if interval >= threshold:
+            raise ValueError("The heartbeat interval must be below the threshold")
+        self.hass = hass
+        self.threshold = threshold
+        self.interval = interval
+        self.lag = LatencyHistogram()
+        self.slow_callbacks: deque[SlowCallback] = deque(maxlen=MAX_SLOW_CALLBACKS)
+        self.slow_callback_count = 0
+        self._loop_thread_id: int | None = None
+        self._heartbeat_handle: asyncio.TimerHandle | None = None
+        # The time.monotonic() the next heartbeat is due, read by the thread
+        self._due = 0.0
+        # The due time and location of the stall the thread saw last
+        self._stall: tuple[float, str | None, str | None] | None = None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start the watchdog."""
+        self._loop_thread_id = threading.get_ident()
+        self._stop_event.clear()
+        self._schedule_heartbeat()
+        self._thread = threading.Thread(
+            target=self._watch, name="loop_watchdog", daemon=True
+        )
+        self._thread.start()
+
+    async def async_stop(self) -> None:
+        """Stop the watchdog."""
+        if self._heartbeat_handle is not None:
+            self._heartbeat_handle.cancel()
+            self._heartbeat_handle = None
+        self._stop_event.set()
+        if (thread := self._thread) is not None:
+            self._thread = None
+            await self.hass.async_add_executor_job(thread.join)
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return the lag of the event loop and the recent slow callbacks."""
+        return {
+            "lag": self.lag.as_dict(),
+            "slow_callback_count": self.slow_callback_count,
+            "slow_callbacks": [
+                slow_callback.as_dict() for slow_callback in self.slow_callbacks
+            ],
+        }
+
+    def _schedule_heartbeat(self) -> None:
+        """Schedule the next heartbeat."""
+        loop = self.hass.loop
+        self._due = time.monotonic() + self.interval
+        self._heartbeat_handle = loop.call_at(
+            loop.time() + self.interval, self._heartbeat, self._due
+        )
+
+    @callback
+    def _heartbeat(self, due: float) -> None:
+        """Measure how late the heartbeat runs."""
+        lag = max(time.monotonic() - due, 0.0)
+        self.lag.add(lag)
+        if lag > self.threshold:
+            integration: str | None = None
+            location: str | None = None
+            if (stall := self._stall) is not None and stall[0] == due:
+                _, integration, location = stall
+            self.slow_callback_count += 1
+            self.slow_callbacks.append(
+                SlowCallback(time.time() - lag, lag, integration, location)
+            )
+        self._schedule_heartbeat()
+
+    def _watch(self) -> None:
+        """Take the stack of the event loop thread when the heartbeat is overdue."""
+        while not self._stop_event.wait(self.threshold):
+            due = self._due
+            if (
+                time.monotonic() - due <= self.threshold
+                or (self._stall is not None and self._stall[0] == due)
+                or (frame := sys._current_frames().get(self._loop_thread_id)) is None  # type: ignore[arg-type] # noqa: SLF001
+            ):
+                continue
+            self._stall = (due, *_attribute_frame(frame))
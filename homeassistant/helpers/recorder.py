@@ -83,15 +83,25 @@ def session_scope(
     session: Session | None = None,
     exception_filter: Callable[[Exception], bool] | None = None,
     read_only: bool = False,
+    replica: bool = False,
 ) -> Generator[Session]:
     """Provide a transactional scope around a series of operations.
 
     read_only is used to indicate that the session is only used for reading
     data and that no commit is required. It does not prevent the session
     from writing and is not a security measure.
+
+    replica allows a new read only session to be served by a read pool of
+    the recorder. Read pools may lag behind the database, so it should only
+    be set for queries which do not need to see what was just written.
     """
     if session is None and hass is not None:
-        session = get_instance(hass).get_session()
+        instance = get_instance(hass)
+        session = (
+            instance.get_read_session()
+            if read_only and replica
+            else instance.get_session()
+        )
 
     if session is None:
         raise RuntimeError("Session required")
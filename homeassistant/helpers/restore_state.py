@@ -18,7 +18,6 @@ from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
 from .singleton import singleton
 from .storage import Store
 
@@ -32,6 +31,11 @@ STORAGE_VERSION = 1
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long the last seen time of an unchanged entity is kept when dumping,
+# the dump when stopping always writes the current time so the expiration
+# is only shortened by up to this after an unclean shutdown
+STATE_LAST_SEEN_REFRESH = timedelta(days=1)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -135,10 +139,13 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, journal=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        self._dumped: dict[
+            str, tuple[State, dict[str, Any] | None, dict[str, Any]]
+        ] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -214,16 +221,51 @@ class RestoreStateData:
 
         return stored_states
 
+    @callback
+    def _async_get_stored_state_dicts(self) -> list[dict[str, Any]]:
+        """Get the dicts of the states which should be stored.
+
+        The dict of the last dump is reused for entities whose state and
+        extra data did not change since, until their last seen time is due
+        for a refresh. The journal of the store then only has to append the
+        entities which changed.
+        """
+        refresh_before = dt_util.utcnow() - STATE_LAST_SEEN_REFRESH
+        dumped = self._dumped
+        self._dumped = {}
+        stored_state_dicts: list[dict[str, Any]] = []
+        for stored_state in self.async_get_stored_states():
+            state = stored_state.state
+            extra_data = (
+                stored_state.extra_data.as_dict() if stored_state.extra_data else None
+            )
+            if (
+                (previous := dumped.get(state.entity_id)) is not None
+                and previous[0] is state
+                # Extra data which is the same object may have been mutated
+                and (
+                    previous[1] is None
+                    if extra_data is None
+                    else previous[1] is not extra_data and previous[1] == extra_data
+                )
+                and previous[2]["last_seen"] >= refresh_before
+            ):
+                stored_state_dict = previous[2]
+            else:
+                stored_state_dict = {
+                    "state": state.json_fragment,
+                    "extra_data": extra_data,
+                    "last_seen": stored_state.last_seen,
+                }
+            self._dumped[state.entity_id] = (state, extra_data, stored_state_dict)
+            stored_state_dicts.append(stored_state_dict)
+        return stored_state_dicts
+
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(self._async_get_stored_state_dicts())
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
@@ -251,6 +293,8 @@ class RestoreStateData:
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
+            # Write the current last seen time of all entities
+            self._dumped = {}
             await self.async_dump_states()
 
         # Dump states when stopping hass
@@ -0,0 +1,188 @@
+"""Trace the startup of Home Assistant.
+
+The tracer records spans for the work done while Home Assistant starts,
+like importing integrations, setting them up, waiting for dependencies
+and loading storage. The spans can be exported in the Chrome trace event
+format, which can be opened in https://ui.perfetto.dev or chrome://tracing
+to see what gates the start.
+
+Spans are only recorded until Home Assistant has started.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import os
+import threading
+import time
+from typing import Any
+import weakref
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+DATA_STARTUP_TRACER: HassKey[StartupTracer] = HassKey("startup_tracer")
+
+# Guard against runaway recording if start never finishes
+MAX_SPANS = 100000
+
+
+@dataclass(slots=True, frozen=True)
+class Span:
+    """A span of work done while starting."""
+
+    name: str
+    category: str
+    start: float
+    end: float
+    track: int
+    args: dict[str, Any] | None
+
+
+class StartupTracer:
+    """Record the spans of the startup.
+
+    Spans of the event loop are put on a track per asyncio task and
+    spans of other threads on a track per thread, so the spans of a
+    track are always nested.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tracer."""
+        self.hass = hass
+        self.started = time.monotonic()
+        self.finished: float | None = None
+        self.spans: list[Span] = []
+        self._task_tracks: weakref.WeakKeyDictionary[asyncio.Task[Any], int] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._thread_tracks: dict[int, int] = {}
+        self._track_names: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        """Return if the tracer records spans."""
+        return self.finished is None and len(self.spans) < MAX_SPANS
+
+    @callback
+    def async_finish(self, _event: Event | None = None) -> None:
+        """Stop recording spans."""
+        if self.finished is None:
+            self.finished = time.monotonic()
+
+    def add_span(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Add a span of the current task or thread.
+
+        This method is thread-safe.
+        """
+        self.spans.append(Span(name, category, start, end, self._track(), args))
+
+    def _track(self) -> int:
+        """Return the track of the current task or thread."""
+        task: asyncio.Task[Any] | None = None
+        if threading.get_ident() == self.hass.loop_thread_id:
+            task = asyncio.current_task()
+        with self._lock:
+            if task is not None:
+                if (track := self._task_tracks.get(task)) is None:
+                    track = self._task_tracks[task] = len(self._track_names) + 1
+                    self._track_names[track] = task.get_name()
+                return track
+            thread = threading.current_thread()
+            if (track := self._thread_tracks.get(thread.ident or 0)) is None:
+                track = self._thread_tracks[thread.ident or 0] = (
+                    len(self._track_names) + 1
+                )
+                self._track_names[track] = thread.name
+            return track
+
+    def as_chrome_trace(self) -> dict[str, Any]:
+        """Return the spans in the Chrome trace event format."""
+        pid = os.getpid()
+        started = self.started
+        events: list[dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": "Home Assistant startup"},
+            },
+            *(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": track,
+                    "args": {"name": name},
+                }
+                for track, name in self._track_names.items()
+            ),
+        ]
+        for span in self.spans:
+            event: dict[str, Any] = {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": round((span.start - started) * 1_000_000),
+                "dur": round((span.end - span.start) * 1_000_000),
+                "pid": pid,
+                "tid": span.track,
+            }
+            if span.args:
+                event["args"] = span.args
+            events.append(event)
+        if self.finished is not None:
+            events.append(
+                {
+                    "name": "started",
+                    "ph": "i",
+                    "s": "g",
+                    "ts": round((self.finished - started) * 1_000_000),
+                    "pid": pid,
+                    "tid": 0,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Start tracing the startup."""
+    tracer = hass.data[DATA_STARTUP_TRACER] = StartupTracer(hass)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, tracer.async_finish)
+
+
+@callback
+def async_get_tracer(hass: HomeAssistant) -> StartupTracer | None:
+    """Return the startup tracer."""
+    return hass.data.get(DATA_STARTUP_TRACER)
+
+
+@contextmanager
+def trace_span(
+    hass: HomeAssistant, name: str, category: str, **args: Any
+) -> Generator[None]:
+    """Record the code run inside the context manager as a span of the startup.
+
+    This function is thread-safe.
+    """
+    if (tracer := hass.data.get(DATA_STARTUP_TRACER)) is None or not tracer.active:
+        yield
+        return
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        tracer.add_span(name, category, start, time.monotonic(), args or None)
@@ -13,6 +13,7 @@ import logging
 import os
 from pathlib import Path
 from typing import Any
+import zlib
 
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
@@ -35,6 +36,8 @@ from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
 
 from . import json as json_helper
+from .json import json_bytes, json_fragment
+from .startup_trace import trace_span
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
@@ -48,6 +51,11 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into the main file once it grows
+# beyond this share of the size of the main file
+JOURNAL_COMPACT_RATIO = 0.25
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -165,6 +173,11 @@ class _StoreManager:
             _LOGGER.debug("%s: Cache hit, does not exist", key)
             return (False, None)
 
+        # The preloaded data misses the changes in the journal
+        if f"{key}{JOURNAL_SUFFIX}" in self._files:
+            _LOGGER.debug("%s: Cache miss, has journal", key)
+            return None
+
         # If the key is in the preload cache, return it
         if data := self._data_preload.pop(key, None):
             _LOGGER.debug("%s: Cache hit data", key)
@@ -226,6 +239,229 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+# Values of these types are replaced instead of changed in place, so a value
+# which is the same object as on the last write did not change
+_IMMUTABLE_JOURNAL_TYPES = frozenset({json_fragment, str, int, float, bool, type(None)})
+_MUTABLE = object()
+
+
+def _track_journal_value(
+    value: Any, old: tuple[Any, int] | None
+) -> tuple[tuple[Any, int], bytes | None]:
+    """Return the tracked state of a value and its serialization if it changed.
+
+    Immutable values which are the same object as on the last write are not
+    serialized again. The other values are compared by the hash of their
+    serialization.
+    """
+    immutable = type(value) in _IMMUTABLE_JOURNAL_TYPES
+    if immutable and old is not None and old[0] is value:
+        return old, None
+    serialized = json_bytes(value)
+    tracked = (value if immutable else _MUTABLE, hash(serialized))
+    if old is not None and old[1] == tracked[1]:
+        return tracked, None
+    return tracked, serialized
+
+
+def _apply_journal_list(items: list[Any], change: dict[str, Any]) -> None:
+    """Apply the change of a list from a journal record."""
+    del items[change["length"] :]
+    for index, item in change["items"].items():
+        if (position := int(index)) < len(items):
+            items[position] = item
+        else:
+            items.append(item)
+
+
+class _StoreJournal:
+    """Append-only journal of the changes to the data of a store.
+
+    The main file of the store keeps its format. Changes are appended as
+    records to a sidecar journal, which starts with the size and checksum
+    of the main file it applies to. Top-level lists are diffed by position,
+    so updating an item of a large list only appends that item. Immutable
+    items such as the storage fragments of registry entries are compared by
+    identity, so unchanged items are not serialized again. The journal
+    is compacted into the main file once it grows too large, on the first
+    write after loading and on the final write when Home Assistant stops.
+    """
+
+    def __init__(self, path: str, private: bool, fsync: bool) -> None:
+        """Initialize the journal."""
+        self.path = f"{path}{JOURNAL_SUFFIX}"
+        self.compact_requested = False
+        self._private = private
+        self._fsync = fsync
+        self._base: list[int] | None = None
+        self._size = 0
+        self._version: tuple[int, int, bool] | None = None
+        self._values: dict[str, tuple[Any, int]] = {}
+        self._lists: dict[str | None, list[tuple[Any, int]]] = {}
+
+    def load(self, path: str, main: bytes, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the journal to the data loaded from the bytes of the main file."""
+        try:
+            with open(self.path, "rb") as file:
+                lines = file.read().split(b"\n")
+        except FileNotFoundError:
+            return data
+        try:
+            base = json_util.json_loads_object(lines[0])["base"]
+        except (ValueError, KeyError):
+            base = None
+        if base != [len(main), zlib.crc32(main)]:
+            _LOGGER.warning(
+                "Ignoring journal %s as it does not match %s", self.path, path
+            )
+            with suppress(FileNotFoundError):
+                os.unlink(self.path)
+            return data
+
+        stored = data["data"]
+        for line in lines[1:]:
+            if not line:
+                continue
+            try:
+                record = json_util.json_loads_object(line)
+            except ValueError:
+                # The last record is incomplete when writing it was interrupted
+                _LOGGER.warning("Ignoring incomplete record in journal %s", self.path)
+                break
+            if "root" in record:
+                _apply_journal_list(stored, record["root"])
+            for key, value in record.get("values", {}).items():
+                stored[key] = value
+            for key, change in record.get("lists", {}).items():
+                if not isinstance(items := stored.get(key), list):
+                    items = stored[key] = []
+                _apply_journal_list(items, change)
+            for key in record.get("removed", ()):
+                stored.pop(key, None)
+        return data
+
+    def append(self, data: dict[str, Any]) -> bool:
+        """Append the changes of the data to the journal.
+
+        Returns False if the data needs to be written to the main file instead.
+        """
+        stored = data["data"]
+        if (
+            self.compact_requested
+            or self._base is None
+            or self._version
+            != (data["version"], data["minor_version"], isinstance(stored, list))
+        ):
+            return False
+        try:
+            record, values, lists = self._diff(stored)
+        except TypeError:
+            # Let writing the main file report the unserializable data
+            return False
+        if not record:
+            self._values = values
+            self._lists = lists
+            return True
+
+        line = json_bytes(record) + b"\n"
+        if not self._size:
+            line = json_bytes({"base": self._base}) + b"\n" + line
+        if self._size + len(line) > self._base[0] * JOURNAL_COMPACT_RATIO:
+            return False
+        try:
+            fd = os.open(
+                self.path,
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                0o600 if self._private else 0o644,
+            )
+            with open(fd, "wb") as file:
+                file.write(line)
+                if self._fsync:
+                    file.flush()
+                    os.fsync(file.fileno())
+        except OSError as err:
+            # The journal may end in an incomplete record now
+            self._base = None
+            _LOGGER.exception("Saving file failed: %s", self.path)
+            raise WriteError(err) from err
+        self._size += len(line)
+        self._values = values
+        self._lists = lists
+        return True
+
+    def _diff(
+        self, stored: Mapping[str, Any] | Sequence[Any]
+    ) -> tuple[
+        dict[str, Any],
+        dict[str, tuple[Any, int]],
+        dict[str | None, list[tuple[Any, int]]],
+    ]:
+        """Return the journal record of the changes and the new tracked state.
+
+        The items of a list which is the data itself are keyed by None.
+        """
+        record: dict[str, Any] = {}
+        values: dict[str, tuple[Any, int]] = {}
+        lists: dict[str | None, list[tuple[Any, int]]] = {}
+        sections = [(None, stored)] if isinstance(stored, list) else stored.items()
+        for key, value in sections:
+            if not isinstance(value, list):
+                values[key], serialized = _track_journal_value(
+                    value, self._values.get(key)
+                )
+                if serialized is not None:
+                    record.setdefault("values", {})[key] = json_fragment(serialized)
+                continue
+            old_items = self._lists.get(key, [])
+            tracked_items = lists[key] = []
+            changed_items: dict[str, json_fragment] = {}
+            for index, item in enumerate(value):
+                tracked, serialized = _track_journal_value(
+                    item, old_items[index] if index < len(old_items) else None
+                )
+                tracked_items.append(tracked)
+                if serialized is not None:
+                    changed_items[str(index)] = json_fragment(serialized)
+            if changed_items or len(value) != len(old_items):
+                change = {"length": len(value), "items": changed_items}
+                if key is None:
+                    record["root"] = change
+                else:
+                    record.setdefault("lists", {})[key] = change
+        if removed := [
+            key
+            for key in (*self._values, *self._lists)
+            if key is not None and key not in values and key not in lists
+        ]:
+            record["removed"] = removed
+        return record, values, lists
+
+    def reset(self, path: str, data: dict[str, Any]) -> None:
+        """Start a new journal for the main file which was just written."""
+        self.compact_requested = False
+        self._base = None
+        self._size = 0
+        with suppress(FileNotFoundError):
+            os.unlink(self.path)
+        stored = data["data"]
+        self._values = {}
+        self._lists = {}
+        try:
+            with open(path, "rb") as file:
+                main = file.read()
+            _, values, lists = self._diff(stored)
+        except (OSError, TypeError):
+            return
+        self._base = [len(main), zlib.crc32(main)]
+        self._version = (
+            data["version"],
+            data["minor_version"],
+            isinstance(stored, list),
+        )
+        self._values = values
+        self._lists = lists
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -241,8 +477,14 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        With journal enabled, changes are appended to a journal next to the
+        storage file instead of rewriting it. The journal is always serialized
+        with the default encoder, so it can't be combined with a custom encoder.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,6 +500,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = (
+            _StoreJournal(self.path, private, atomic_writes) if journal else None
+        )
 
     @cached_property
     def path(self):
@@ -305,8 +550,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         """Load the data and ensure the task is removed."""
         if STORAGE_SEMAPHORE not in self.hass.data:
             self.hass.data[STORAGE_SEMAPHORE] = asyncio.Semaphore(MAX_LOAD_CONCURRENTLY)
-        async with self.hass.data[STORAGE_SEMAPHORE]:
-            return await self._async_load_data()
+        with trace_span(self.hass, f"load storage {self.key}", "storage"):
+            async with self.hass.data[STORAGE_SEMAPHORE]:
+                return await self._async_load_data()
 
     async def _async_load_data(self):
         """Load the data."""
@@ -327,9 +573,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
                 return None
         else:
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                data = await self.hass.async_add_executor_job(self._load_data)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -420,6 +664,25 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         return stored
 
+    def _load_data(self) -> json_util.JsonValueType:
+        """Load the data from the file and apply the journal."""
+        if self._journal is None:
+            return json_util.load_json(self.path)
+        # Read the main file once, the journal is checked against its bytes
+        try:
+            with open(self.path, "rb") as file:
+                main = file.read()
+            data = json_util.json_loads(main)
+        except FileNotFoundError:
+            _LOGGER.debug("JSON file not found: %s", self.path)
+            return {}
+        except (*json_util.JSON_DECODE_EXCEPTIONS, OSError) as err:
+            _LOGGER.exception("Could not load JSON content: %s", self.path)
+            raise HomeAssistantError(f"Error while loading {self.path}: {err}") from err
+        if data:
+            data = self._journal.load(self.path, main, data)
+        return data
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
         self._data = {
@@ -517,6 +780,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if self._journal is not None:
+            self._journal.compact_requested = True
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -551,6 +816,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal is not None and self._journal.append(data):
+            _LOGGER.debug("Appended data for %s to %s", self.key, self._journal.path)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -559,6 +828,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
         )
+        if self._journal is not None:
+            self._journal.reset(path, data)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -572,3 +843,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal is not None:
+            self._journal.compact_requested = True
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self._journal.path)
@@ -9,6 +9,7 @@ import collections.abc
 from collections.abc import Callable, Generator, Iterable
 from contextlib import AbstractContextManager
 from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
 from functools import cache, cached_property, lru_cache, partial, wraps
 import json
@@ -24,7 +25,6 @@ import sys
 from types import CodeType, TracebackType
 from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
@@ -150,6 +150,11 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
+# The compiled code of templates is shared between all environments of the
+# same kind so identical template strings are only compiled once, even when
+# the Template objects are thrown away and created again on reload
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
 
@@ -162,6 +167,65 @@ ORJSON_PASSTHROUGH_OPTIONS = (
 )
 
 
+class _CompiledTemplateCache:
+    """Bounded LRU cache of compiled template code."""
+
+    __slots__ = ("_lru", "evictions", "hits", "misses")
+
+    def __init__(self, size: int) -> None:
+        """Initialize the cache."""
+        self._lru: LRU[tuple[str, bool, bool, bool], CodeType] = LRU(
+            size, callback=self._evicted
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _evicted(self, key: tuple[str, bool, bool, bool], code: CodeType) -> None:
+        """Count an evicted template."""
+        self.evictions += 1
+
+    def get(self, key: tuple[str, bool, bool, bool]) -> CodeType | None:
+        """Return the compiled code of a template."""
+        if (code := self._lru.get(key)) is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return code
+
+    def set(self, key: tuple[str, bool, bool, bool], code: CodeType) -> None:
+        """Store the compiled code of a template."""
+        self._lru[key] = code
+
+    def clear(self) -> None:
+        """Remove all compiled code and reset the statistics."""
+        self._lru.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return the statistics of the cache."""
+        return {
+            "size": len(self._lru),
+            "max_size": self._lru.get_size(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+COMPILED_TEMPLATE_CACHE = _CompiledTemplateCache(COMPILED_TEMPLATE_CACHE_SIZE)
+
+
+def compiled_template_cache_stats() -> dict[str, int]:
+    """Return the statistics of the compiled template cache."""
+    return COMPILED_TEMPLATE_CACHE.stats()
+
+
+def clear_compiled_template_cache() -> None:
+    """Remove all compiled template code and reset the statistics."""
+    COMPILED_TEMPLATE_CACHE.clear()
+
+
 def _template_state_no_collect(hass: HomeAssistant, state: State) -> TemplateState:
     """Return a TemplateState for a state without collecting."""
     if template_state := CACHED_TEMPLATE_NO_COLLECT_LRU.get(state):
@@ -368,6 +432,147 @@ def _cached_parse_result(render_result: str) -> Any:
     return render_result
 
 
+# Globals, filters and tests reading the state of the entity id they are passed
+_STATE_FUNCTIONS = frozenset(
+    {"has_value", "is_state", "is_state_attr", "state_attr", "state_translated"}
+)
+# Globals and filters reading states which are only known when rendering
+_DYNAMIC_STATE_FUNCTIONS = frozenset({"closest", "distance", "expand"})
+_STATE_NAMES = _STATE_FUNCTIONS | _DYNAMIC_STATE_FUNCTIONS | {"states"}
+
+
+@dataclass(slots=True, frozen=True)
+class TemplateDependencies:
+    """The states a template reads, known without rendering it."""
+
+    entities: frozenset[str]
+    domains: frozenset[str]
+
+
+class _UnresolvableDependencies(Exception):
+    """The states a template reads can only be known by rendering it."""
+
+
+def _literal_string(node: jinja2.nodes.Node | None) -> str:
+    """Return the value of a literal string node."""
+    if isinstance(node, jinja2.nodes.Const) and isinstance(node.value, str):
+        return node.value
+    raise _UnresolvableDependencies
+
+
+def _states_key(node: jinja2.nodes.Node) -> str | None:
+    """Return the key of an attribute or item access with a literal key."""
+    if isinstance(node, jinja2.nodes.Getattr):
+        return node.attr
+    if isinstance(node, jinja2.nodes.Getitem):
+        try:
+            return _literal_string(node.arg)
+        except _UnresolvableDependencies:
+            return None
+    return None
+
+
+def _is_states(node: jinja2.nodes.Node) -> bool:
+    """Return if the node is the states global."""
+    return isinstance(node, jinja2.nodes.Name) and node.name == "states"
+
+
+def _collect_dependencies(
+    node: jinja2.nodes.Node, entities: set[str], domains: set[str]
+) -> None:
+    """Collect the states read by a node of a template."""
+    if isinstance(
+        node,
+        (
+            jinja2.nodes.Extends,
+            jinja2.nodes.FromImport,
+            jinja2.nodes.Import,
+            jinja2.nodes.Include,
+        ),
+    ):
+        # Imported templates are not analyzed
+        raise _UnresolvableDependencies
+    if isinstance(node, jinja2.nodes.Name):
+        # Any other use of the states, like iterating or passing them
+        # to a filter, reads states which are only known when rendering
+        if node.name in _STATE_NAMES:
+            raise _UnresolvableDependencies
+        return
+    if isinstance(node, jinja2.nodes.Const):
+        # Tests and filters can be passed by name to select, map and friends
+        if node.value in _STATE_NAMES:
+            raise _UnresolvableDependencies
+        return
+
+    children: list[jinja2.nodes.Node | None]
+    if (
+        isinstance(node, (jinja2.nodes.Getattr, jinja2.nodes.Getitem))
+        and (key := _states_key(node)) is not None
+    ):
+        inner = node.node
+        if _is_states(inner):
+            # states.light or states["light.kitchen"]
+            if "." in key:
+                entities.add(key.lower())
+            else:
+                domains.add(key)
+            return
+        if (
+            isinstance(inner, (jinja2.nodes.Getattr, jinja2.nodes.Getitem))
+            and _is_states(inner.node)
+            and (domain := _states_key(inner)) is not None
+            and "." not in domain
+        ):
+            # states.light.kitchen
+            entities.add(f"{domain}.{key}".lower())
+            return
+    elif (
+        isinstance(node, jinja2.nodes.Call)
+        and isinstance(node.node, jinja2.nodes.Name)
+        and node.node.name in _STATE_FUNCTIONS | {"states"}
+    ):
+        # states("light.kitchen") or is_state("light.kitchen", "on")
+        entities.add(_literal_string(node.args[0] if node.args else None).lower())
+        children = [*node.args[1:], *node.kwargs, node.dyn_args, node.dyn_kwargs]
+        for child in children:
+            if child is not None:
+                _collect_dependencies(child, entities, domains)
+        return
+    elif (
+        isinstance(node, (jinja2.nodes.Filter, jinja2.nodes.Test))
+        and node.name in _STATE_NAMES
+    ):
+        # "light.kitchen" | state_attr("brightness") or "light.kitchen" is is_state("on")
+        if node.name in _DYNAMIC_STATE_FUNCTIONS:
+            raise _UnresolvableDependencies
+        entities.add(_literal_string(node.node).lower())
+        children = [*node.args, *node.kwargs, node.dyn_args, node.dyn_kwargs]
+        for child in children:
+            if child is not None:
+                _collect_dependencies(child, entities, domains)
+        return
+
+    for child in node.iter_child_nodes():
+        _collect_dependencies(child, entities, domains)
+
+
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def analyze_template_dependencies(template: str) -> TemplateDependencies | None:
+    """Return the states a template reads by analyzing its source.
+
+    Returns None if the states the template reads can only be known
+    by rendering it, for example when it iterates all states or passes
+    an entity id from a variable to states().
+    """
+    entities: set[str] = set()
+    domains: set[str] = set()
+    try:
+        _collect_dependencies(_NO_HASS_ENV.parse(template), entities, domains)
+    except (_UnresolvableDependencies, jinja2.TemplateSyntaxError):
+        return None
+    return TemplateDependencies(frozenset(entities), frozenset(domains))
+
+
 class RenderInfo:
     """Holds information about a template render."""
 
@@ -459,16 +664,25 @@ class RenderInfo:
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
-    def _freeze(self) -> None:
+    def _freeze(self, dependencies: TemplateDependencies | None = None) -> None:
+        if dependencies is not None:
+            # The render failed before it read all the states, the states read
+            # by all branches of the template are listened to instead
+            self.entities = self.entities | dependencies.entities
+            self.domains = self.domains | dependencies.domains
+            self.domains_lifecycle = self.domains_lifecycle | dependencies.domains
+
         self._freeze_sets()
 
+        unknown_dependencies = self.exception is not None and dependencies is None
+
         if self.rate_limit is None:
-            if self.all_states or self.exception:
+            if self.all_states or unknown_dependencies:
                 self.rate_limit = ALL_STATES_RATE_LIMIT
             elif self.domains or self.domains_lifecycle:
                 self.rate_limit = DOMAIN_STATES_RATE_LIMIT
 
-        if self.exception:
+        if unknown_dependencies:
             return
 
         if not self.all_states_lifecycle:
@@ -565,10 +779,6 @@ class Template:
         if self.is_static or self._compiled_code is not None:
             return
 
-        if compiled := self._env.template_cache.get(self.template):
-            self._compiled_code = compiled
-            return
-
         with _template_context_manager as cm:
             cm.set_template(self.template, "compiling")
             try:
@@ -753,7 +963,16 @@ class Template:
         finally:
             _render_info.reset(token)
 
-        render_info._freeze()  # noqa: SLF001
+        # The states read by the render are listened to. If it failed, the
+        # states its source reads are used in place of all states, unless
+        # the template failed to compile or reads states only known when
+        # rendering
+        dependencies = (
+            analyze_template_dependencies(self.template)
+            if render_info.exception is not None and self._compiled_code is not None
+            else None
+        )
+        render_info._freeze(dependencies)  # noqa: SLF001
         return render_info
 
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
@@ -2846,9 +3065,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | None
-        ] = weakref.WeakValueDictionary()
+        # Environments of the same kind compile templates to the same code
+        self._compiled_cache_kind = (hass is not None, bool(limited), bool(strict))
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3201,8 +3419,13 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
-        self.template_cache[source] = compiled
+        if not isinstance(source, str):
+            return super().compile(source)
+
+        cache_key = (source, *self._compiled_cache_kind)
+        if (compiled := COMPILED_TEMPLATE_CACHE.get(cache_key)) is None:
+            compiled = super().compile(source)
+            COMPILED_TEMPLATE_CACHE.set(cache_key, compiled)
         return compiled
 
 
@@ -29,6 +29,7 @@ from homeassistant.util.dt import utcnow
 
 from . import entity, event
 from .debounce import Debouncer
+from .startup_trace import trace_span
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
@@ -277,12 +278,15 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         fails. Additionally logging is handled by config entry setup
         to ensure that multiple retries do not cause log spam.
         """
-        if await self.__wrap_async_setup():
-            await self._async_refresh(
-                log_failures=False, raise_on_auth_failed=True, raise_on_entry_error=True
-            )
-            if self.last_update_success:
-                return
+        with trace_span(self.hass, f"first refresh {self.name}", "first_refresh"):
+            if await self.__wrap_async_setup():
+                await self._async_refresh(
+                    log_failures=False,
+                    raise_on_auth_failed=True,
+                    raise_on_entry_error=True,
+                )
+                if self.last_update_success:
+                    return
         ex = ConfigEntryNotReady()
         ex.__cause__ = self.last_exception
         raise ex
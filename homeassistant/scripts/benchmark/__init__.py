@@ -6,8 +6,11 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+import gc
 import logging
+import tempfile
 from timeit import default_timer as timer
+import tracemalloc
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -308,3 +311,101 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def recorder_state_changed_events(hass):
+    """Record 100k state changes of 1000 entities through the recorder thread."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.recorder import Recorder
+    from homeassistant.helpers import recorder as recorder_helper
+
+    events_to_fire = 10**5
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.set_state(core.CoreState.running)
+        recorder_helper.async_initialize_recorder(hass)
+        instance = hass.data[recorder_helper.DATA_INSTANCE] = Recorder(
+            hass,
+            auto_purge=False,
+            auto_repack=False,
+            keep_days=10,
+            commit_interval=1,
+            uri=f"sqlite:///{tmpdir}/benchmark.db",
+            db_max_retries=10,
+            db_retry_wait=3,
+            entity_filter=None,
+            exclude_event_types=set(),
+        )
+        instance.async_initialize()
+        instance.async_register()
+        instance.start()
+        assert await instance.async_db_ready
+        await instance.async_block_till_done()
+
+        start = timer()
+
+        for idx in range(events_to_fire):
+            hass.states.async_set(
+                f"sensor.power_{idx % 1000}",
+                str(idx),
+                {"unit_of_measurement": "W", "friendly_name": "Power"},
+            )
+        await instance.async_block_till_done()
+
+        runtime = timer() - start
+        print(f"Recorded {events_to_fire / runtime:.0f} events/sec")
+
+        await hass.async_stop()
+        return runtime
+
+
+@benchmark
+async def state_machine_memory(hass):
+    """Measure the memory of the states of 8000 entities."""
+    entities = 8000
+
+    def _attributes(idx):
+        """Return the attributes of an entity, half of them have a unique name."""
+        attributes = {
+            "state_class": "measurement",
+            "unit_of_measurement": ("W", "kWh", "°C", "%")[idx % 4],
+            "device_class": ("power", "energy", "temperature", "humidity")[idx % 4],
+            "options": ["low", "medium", "high"],
+        }
+        if idx % 2:
+            attributes["friendly_name"] = f"Sensor {idx}"
+        return attributes
+
+    def _traced_memory(create):
+        """Return the memory held by the objects create returns."""
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        held = create()
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        del held
+        return used
+
+    class UnsharedStateMachine(core.StateMachine):
+        """State machine which does not share the attributes of the states."""
+
+        def _async_intern_attributes(self, attributes):
+            return attributes
+
+    def _set_states(state_machine_class):
+        states = state_machine_class(hass.bus, hass.loop)
+        for idx in range(entities):
+            states.async_set(f"sensor.sensor_{idx}", str(idx), _attributes(idx))
+        return states
+
+    # Fill the caches of the entity ids before measuring
+    _set_states(UnsharedStateMachine)
+    start = timer()
+    shared = _traced_memory(lambda: _set_states(core.StateMachine))
+    runtime = timer() - start
+    unshared = _traced_memory(lambda: _set_states(UnsharedStateMachine))
+    print(f"States with shared attributes: {shared / 1024:.0f} KiB")
+    print(f"States with their own attributes: {unshared / 1024:.0f} KiB")
+    return runtime
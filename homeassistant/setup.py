@@ -31,6 +31,7 @@ from .core import (
 from .exceptions import DependencyError, HomeAssistantError
 from .helpers import issue_registry as ir, singleton, translation
 from .helpers.issue_registry import IssueSeverity, async_create_issue
+from .helpers.startup_trace import trace_span
 from .helpers.typing import ConfigType
 from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
@@ -233,10 +234,17 @@ async def _async_process_dependencies(
             after_dependencies_tasks.keys(),
         )
 
-    async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(
-            *dependencies_tasks.values(), *after_dependencies_tasks.values()
-        )
+    with trace_span(
+        hass,
+        f"wait dependencies {integration.domain}",
+        "dependencies",
+        dependencies=list(dependencies_tasks),
+        after_dependencies=list(after_dependencies_tasks),
+    ):
+        async with hass.timeout.async_freeze(integration.domain):
+            results = await asyncio.gather(
+                *dependencies_tasks.values(), *after_dependencies_tasks.values()
+            )
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -706,11 +714,12 @@ def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator
         return
 
     started = time.monotonic()
+    integration, group = running
     try:
-        yield
+        with trace_span(hass, f"{phase} {integration}", "wait", group=group):
+            yield
     finally:
         time_taken = time.monotonic() - started
-        integration, group = running
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
         _LOGGER.debug(
@@ -768,7 +777,8 @@ def async_start_setup(
     setup_started[current] = started
 
     try:
-        yield
+        with trace_span(hass, f"{phase} {integration}", "setup", group=group):
+            yield
     finally:
         time_taken = time.monotonic() - started
         del setup_started[current]
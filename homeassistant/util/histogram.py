@@ -0,0 +1,62 @@
+"""Histogram of durations with logarithmic buckets."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any
+
+# The buckets grow by a factor of 2**(1/4) from 1µs to about 16s
+# which keeps the error of the percentiles below 19%
+_BUCKETS_PER_DOUBLING = 4
+_BUCKET_BOUNDS = tuple(
+    2 ** (exponent / _BUCKETS_PER_DOUBLING) / 1_000_000
+    for exponent in range(24 * _BUCKETS_PER_DOUBLING + 1)
+)
+
+
+class LatencyHistogram:
+    """Count durations in logarithmic buckets.
+
+    Adding a duration is a bisect and an increment, which is
+    cheap enough to do for every call of a hot code path.
+    """
+
+    __slots__ = ("count", "counts", "max", "total")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float) -> None:
+        """Add a duration in seconds."""
+        self.counts[bisect_left(_BUCKET_BOUNDS, duration)] += 1
+        self.count += 1
+        self.total += duration
+        self.max = max(duration, self.max)
+
+    def percentile(self, percent: float) -> float:
+        """Return the upper bound of the bucket of the percentile in seconds."""
+        if not self.count:
+            return 0.0
+        rank = self.count * percent / 100
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                if index == len(_BUCKET_BOUNDS):
+                    return self.max
+                return min(_BUCKET_BOUNDS[index], self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the summary of the histogram as a dict."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+        }
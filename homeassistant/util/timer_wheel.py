@@ -0,0 +1,247 @@
+"""Timer wheel which shares event loop wakeups between many timers.
+
+Each timer scheduled with loop.call_at is an entry in the heap of the
+event loop, and cancelled timers stay in the heap until they are due or
+the heap is compacted. With thousands of timers which are rescheduled
+all the time this churns the heap of the event loop.
+
+The timer wheel keeps its timers in slots of one second and only keeps
+one timer of the event loop scheduled, at the end of the first slot, so
+all timers of a slot run in the same wakeup. A slot ends at a whole
+second and holds the timers of the second before it. Timers run up to
+one second after their deadline, but never before it. The event loop timer is only
+rescheduled when a timer is added to an earlier slot. Cancelling a timer
+only removes it from its slot.
+"""
+
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, TimerHandle
+from collections.abc import Callable
+from heapq import heappop, heappush
+import math
+import time
+from typing import Any
+from weakref import WeakKeyDictionary
+
+_MONOTONIC_RESOLUTION = time.get_clock_info("monotonic").resolution
+
+_TIMER_WHEELS: WeakKeyDictionary[AbstractEventLoop, TimerWheel] = WeakKeyDictionary()
+
+
+class WheelTimer:
+    """A timer scheduled on a timer wheel.
+
+    The interface matches asyncio.TimerHandle so code which inspects
+    the timers of the event loop can treat both the same way.
+    """
+
+    __slots__ = ("_args", "_callback", "_cancelled", "_wheel", "_when")
+
+    def __init__(
+        self,
+        when: float,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+        wheel: TimerWheel,
+    ) -> None:
+        """Initialize the timer."""
+        self._when = when
+        self._callback = callback
+        self._args = args
+        self._wheel = wheel
+        self._cancelled = False
+
+    def __repr__(self) -> str:
+        """Return the representation of the timer."""
+        state = " cancelled" if self._cancelled else ""
+        return f"<WheelTimer{state} when={self._when} {self._callback!r}{self._args!r}>"
+
+    def when(self) -> float:
+        """Return the loop time the timer is scheduled for."""
+        return self._when
+
+    def cancelled(self) -> bool:
+        """Return if the timer was cancelled."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        if not self._cancelled:
+            self._cancelled = True
+            self._wheel._remove(self)  # noqa: SLF001
+
+
+class TimerWheel:
+    """Schedule timers in slots of one second with one event loop timer.
+
+    This class is not thread-safe and must only be used from the
+    event loop.
+    """
+
+    __slots__ = (
+        "_handle",
+        "_handle_when",
+        "_loop",
+        "_now_values",
+        "_slot_heap",
+        "_slots",
+    )
+
+    def __init__(self, loop: AbstractEventLoop) -> None:
+        """Initialize the timer wheel."""
+        self._loop = loop
+        self._slots: dict[int, dict[WheelTimer, None]] = {}
+        # The seconds the slots end at, a second is in the heap
+        # as long as it is a key of _slots
+        self._slot_heap: list[int] = []
+        self._handle: TimerHandle | None = None
+        self._handle_when = 0.0
+        self._now_values: dict[Callable[[], Any], Any] | None = None
+
+    def call_at(
+        self, when: float, callback: Callable[..., Any], *args: Any
+    ) -> WheelTimer:
+        """Schedule callback to be called at loop time when."""
+        timer = WheelTimer(when, callback, args, self)
+        second = math.ceil(when)
+        if (slot := self._slots.get(second)) is None:
+            self._slots[second] = slot = {}
+            heappush(self._slot_heap, second)
+        slot[timer] = None
+        if self._handle is None or second < self._handle_when:
+            self._arm(second)
+        return timer
+
+    def call_later(
+        self, delay: float, callback: Callable[..., Any], *args: Any
+    ) -> WheelTimer:
+        """Schedule callback to be called after delay seconds."""
+        return self.call_at(self._loop.time() + delay, callback, *args)
+
+    def shared_now[_T](self, clock: Callable[[], _T]) -> _T:
+        """Return the time of clock shared by the timers of a slot in a wakeup.
+
+        The clock is read again for the timers of each slot, so the time
+        a timer sees is at most as old as the callbacks of the timers of
+        its slot which ran before it. Outside of a wakeup the clock is
+        called every time.
+        """
+        if (values := self._now_values) is None:
+            return clock()
+        if clock not in values:
+            values[clock] = clock()
+        return values[clock]  # type: ignore[no-any-return]
+
+    def timers(self) -> list[WheelTimer]:
+        """Return the pending timers ordered by their deadline."""
+        return sorted(
+            (timer for slot in self._slots.values() for timer in slot),
+            key=WheelTimer.when,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Return the statistics of the pending timers."""
+        per_slot = [len(slot) for slot in self._slots.values() if slot]
+        return {
+            "pending": sum(per_slot),
+            "slots": len(per_slot),
+            "max_per_slot": max(per_slot, default=0),
+            "next_wakeup": self._handle_when if self._handle is not None else None,
+        }
+
+    def run_due(self, now: float) -> None:
+        """Run the timers which are due at loop time now.
+
+        Timers scheduled by the callbacks run in a later wakeup.
+        """
+        due: list[WheelTimer] = []
+        slots = self._slots
+        slot_heap = self._slot_heap
+        # A slot has timers which are due once the second before it started
+        while slot_heap and slot_heap[0] - 1 < now:
+            slot = slots[slot_heap[0]]
+            for timer in [timer for timer in slot if timer._when <= now]:  # noqa: SLF001
+                del slot[timer]
+                due.append(timer)
+            if slot:
+                # The other timers of the slot are not due yet
+                break
+            del slots[heappop(slot_heap)]
+        self._arm_next()
+
+        due.sort(key=WheelTimer.when)
+        slot_second: int | None = None
+        try:
+            for timer in due:
+                if timer._cancelled:  # noqa: SLF001
+                    continue
+                timer._cancelled = True  # noqa: SLF001
+                if (second := math.ceil(timer._when)) != slot_second:  # noqa: SLF001
+                    slot_second = second
+                    self._now_values = {}
+                try:
+                    timer._callback(*timer._args)  # noqa: SLF001
+                except Exception as ex:  # noqa: BLE001
+                    self._loop.call_exception_handler(
+                        {
+                            "message": (
+                                f"Exception in callback {timer._callback!r}"  # noqa: SLF001
+                                f"{timer._args!r}"  # noqa: SLF001
+                            ),
+                            "exception": ex,
+                            "handle": timer,
+                        }
+                    )
+        finally:
+            self._now_values = None
+
+    def _wakeup(self) -> None:
+        """Run the due timers when the event loop timer fires."""
+        self._handle = None
+        self.run_due(self._loop.time() + _MONOTONIC_RESOLUTION)
+
+    def _remove(self, timer: WheelTimer) -> None:
+        """Remove a cancelled timer from its slot.
+
+        The event loop timer is not rescheduled, if it was scheduled
+        for the cancelled timer the wheel wakes up without running it.
+        """
+        if (slot := self._slots.get(math.ceil(timer._when))) is not None:  # noqa: SLF001
+            slot.pop(timer, None)
+
+    def _arm_next(self) -> None:
+        """Schedule the event loop timer for the first pending slot.
+
+        The event loop timer is kept if it is already scheduled for it.
+        """
+        slots = self._slots
+        slot_heap = self._slot_heap
+        while slot_heap:
+            if slots[second := slot_heap[0]]:
+                if self._handle is None or self._handle_when != second:
+                    self._arm(second)
+                return
+            del slots[heappop(slot_heap)]
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _arm(self, when: float) -> None:
+        """Schedule the event loop timer at loop time when."""
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = self._loop.call_at(when, self._wakeup)
+        self._handle_when = when
+
+
+def get_timer_wheel(loop: AbstractEventLoop) -> TimerWheel:
+    """Return the timer wheel of the event loop."""
+    if (wheel := _TIMER_WHEELS.get(loop)) is None:
+        _TIMER_WHEELS[loop] = wheel = TimerWheel(loop)
+    return wheel
+
+
+def is_timer_wheel_handle(handle: TimerHandle) -> bool:
+    """Return if the event loop timer handle wakes up a timer wheel."""
+    return isinstance(getattr(handle._callback, "__self__", None), TimerWheel)  # type: ignore[attr-defined] # noqa: SLF001
@@ -21,6 +21,7 @@ from functools import lru_cache
 from io import StringIO
 import json
 import logging
+import math
 import os
 import pathlib
 import time
@@ -106,6 +107,7 @@ from homeassistant.util.json import (
     json_loads_object,
 )
 from homeassistant.util.signal_type import SignalType
+from homeassistant.util.timer_wheel import get_timer_wheel, is_timer_wheel_handle
 import homeassistant.util.ulid as ulid_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 import homeassistant.util.yaml.loader as yaml_loader
@@ -495,7 +497,7 @@ def _async_fire_time_changed(
     for task in list(get_scheduled_timer_handles(hass.loop)):
         if not isinstance(task, asyncio.TimerHandle):
             continue
-        if task.cancelled():
+        if task.cancelled() or is_timer_wheel_handle(task):
             continue
 
         mock_seconds_into_future = timestamp - time.time()
@@ -515,6 +517,24 @@ def _async_fire_time_changed(
                 task._run()
                 task.cancel()
 
+    # The timers of the timer wheel share one event loop timer
+    mock_seconds_into_future = timestamp - time.time()
+    with (
+        patch(
+            "homeassistant.helpers.event.time_tracker_utcnow",
+            return_value=utc_datetime,
+        ),
+        patch(
+            "homeassistant.helpers.event.time_tracker_timestamp",
+            return_value=timestamp,
+        ),
+    ):
+        get_timer_wheel(hass.loop).run_due(
+            math.inf
+            if fire_all
+            else hass.loop.time() + _MONOTONIC_RESOLUTION + mock_seconds_into_future
+        )
+
 
 fire_time_changed = threadsafe_callback_factory(async_fire_time_changed)
 
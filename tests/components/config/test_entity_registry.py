@@ -1,6 +1,7 @@
 """Test entity_registry API."""
 
 from datetime import datetime
+from typing import Any
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
@@ -1059,6 +1060,53 @@ async def test_update_entity_no_changes(
     assert state.name == "name of entity"
 
 
+@pytest.mark.parametrize(
+    ("window", "success", "options"),
+    [
+        (500, True, {"coalesce_window": 500.0}),
+        (0, True, {"coalesce_window": 0.0}),
+        (-1, False, {}),
+        (60001, False, {}),
+        ("fast", False, {}),
+    ],
+)
+async def test_update_entity_coalesce_window(
+    hass: HomeAssistant,
+    client: MockHAClientWebSocket,
+    window: Any,
+    success: bool,
+    options: dict[str, Any],
+) -> None:
+    """Test the coalesce window option is validated."""
+    mock_registry(
+        hass,
+        {
+            "test_domain.world": RegistryEntry(
+                entity_id="test_domain.world",
+                unique_id="1234",
+                platform="test_platform",
+            )
+        },
+    )
+
+    await client.send_json_auto_id(
+        {
+            "type": "config/entity_registry/update",
+            "entity_id": "test_domain.world",
+            "name": "new-name",
+            "options_domain": "homeassistant",
+            "options": {"coalesce_window": window},
+        }
+    )
+    msg = await client.receive_json()
+
+    assert msg["success"] is success
+    entry = er.async_get(hass).async_get("test_domain.world")
+    assert entry.options.get("homeassistant", {}) == options
+    # Nothing is updated if the window is invalid
+    assert entry.name == ("new-name" if success else None)
+
+
 async def test_get_nonexisting_entity(client: MockHAClientWebSocket) -> None:
     """Test get entry with nonexisting entity."""
     await client.send_json_auto_id(
@@ -232,6 +232,86 @@ async def test_history_during_period_impossible_conditions(
     assert response["result"] == {}
 
 
+async def test_history_during_period_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period streams the history in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("1", "2", "3"):
+        hass.states.async_set("sensor.one", state, attributes={"any": "attr"})
+        hass.states.async_set("sensor.two", state, attributes={"any": "attr"})
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    request = {
+        "type": "history/history_during_period",
+        "start_time": now.isoformat(),
+        "entity_ids": ["sensor.two", "sensor.one"],
+        "significant_changes_only": False,
+    }
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+    assert len(expected["sensor.one"]) == 3
+    assert len(expected["sensor.two"]) == 3
+
+    async def _receive_chunks() -> list[dict]:
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] is None
+        chunks = []
+        while True:
+            response = await client.receive_json()
+            assert response["type"] == "event"
+            chunks.append(response["event"])
+            if response["event"]["done"]:
+                return chunks
+
+    with patch(
+        "homeassistant.components.history.websocket_api.MAX_HISTORY_CHUNKS_PER_REQUEST",
+        2,
+    ):
+        await client.send_json_auto_id({**request, "chunk_size": 2})
+        chunks = await _receive_chunks()
+        assert len(chunks) == 2
+        assert chunks[0]["cursor"] is not None
+        cursor = chunks[1]["cursor"]
+        assert cursor is not None
+
+        # A state recorded for an entity sorted before the cursor
+        # does not shift where the history continues
+        hass.states.async_set("sensor.one", "4", attributes={"any": "attr"})
+        await async_wait_recording_done(hass)
+
+        await client.send_json_auto_id({**request, "chunk_size": 2, "cursor": cursor})
+        chunks.extend(await _receive_chunks())
+
+    assert [chunk["cursor"] is None for chunk in chunks] == [False, False, True]
+    assert all(
+        sum(len(states) for states in chunk["states"].values()) == 2 for chunk in chunks
+    )
+    streamed: dict[str, list[dict]] = {}
+    for chunk in chunks:
+        for entity_id, states in chunk["states"].items():
+            streamed.setdefault(entity_id, []).extend(states)
+    assert streamed == expected
+
+    # Nothing can be found in the future
+    future = dt_util.utcnow() + timedelta(hours=10)
+    await client.send_json_auto_id(
+        {**request, "start_time": future.isoformat(), "chunk_size": 2}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"] == {"states": {}, "cursor": None, "done": True}
+
+
 @pytest.mark.parametrize(
     "time_zone", ["UTC", "Europe/Berlin", "America/Chicago", "US/Hawaii"]
 )
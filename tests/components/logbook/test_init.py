@@ -1855,6 +1855,48 @@ async def test_icon_and_state(
     assert response_json[2]["state"] == STATE_OFF
 
 
+@pytest.mark.parametrize("recorder_config", [{"split_volatile_attributes": True}])
+@pytest.mark.usefixtures("recorder_mock")
+async def test_icon_and_unit_with_volatile_attributes(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the icon and unit are read when volatile attributes are stored apart."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+
+    await async_recorder_block_till_done(hass)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+
+    # The icon and the unit change on every update
+    for level in range(6):
+        hass.states.async_set(
+            "light.kitchen",
+            STATE_ON if level % 2 else STATE_OFF,
+            {"brightness": level, "icon": f"mdi:icon-{level}"},
+        )
+        hass.states.async_set(
+            "sensor.power",
+            str(level),
+            {ATTR_UNIT_OF_MEASUREMENT: "kW" if level % 2 else "W"},
+        )
+
+    await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    response_json = await _async_fetch_logbook(client)
+
+    assert response_json[0]["domain"] == "homeassistant"
+    # The sensor has a unit in every state so it is continuous
+    assert [(entry["entity_id"], entry["icon"]) for entry in response_json[1:]] == [
+        ("light.kitchen", f"mdi:icon-{level}") for level in range(1, 6)
+    ]
+
+
 @pytest.mark.usefixtures("recorder_mock")
 async def test_fire_logbook_entries(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
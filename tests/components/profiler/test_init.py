@@ -18,6 +18,8 @@ from homeassistant.components.profiler import (
     CONF_ENABLED,
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
+    SERVICE_DUMP_STARTUP_TRACE,
+    SERVICE_EVENT_BUS_LISTENER_STATS,
     SERVICE_LOG_CURRENT_TASKS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_LOG_THREAD_FRAMES,
@@ -34,7 +36,10 @@ from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import startup_trace
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import load_json
+from homeassistant.util.timer_wheel import get_timer_wheel
 
 from tests.common import MockConfigEntry, async_fire_time_changed
 
@@ -101,6 +106,91 @@ async def test_memory_usage(hass: HomeAssistant, tmp_path: Path) -> None:
     await hass.async_block_till_done()
 
 
+async def test_event_bus_listener_stats(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test the event bus listener stats are written to a file."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_EVENT_BUS_LISTENER_STATS)
+
+    last_filename = None
+
+    def _mock_path(filename: str) -> str:
+        nonlocal last_filename
+        last_filename = str(tmp_path / filename)
+        return last_filename
+
+    with patch.object(hass.config, "path", _mock_path):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_EVENT_BUS_LISTENER_STATS,
+            {CONF_SECONDS: 0.000001},
+            blocking=True,
+        )
+
+    assert os.path.exists(last_filename)
+    assert isinstance(load_json(last_filename), list)
+    assert hass.bus.profiler is None
+
+    # Profiling which was already enabled stays enabled
+    profiler = hass.bus.async_enable_profiling()
+    with patch.object(hass.config, "path", _mock_path):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_EVENT_BUS_LISTENER_STATS,
+            {CONF_SECONDS: 0.000001},
+            blocking=True,
+        )
+    assert hass.bus.profiler is profiler
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_dump_startup_trace(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test the startup trace is written to a file."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_DUMP_STARTUP_TRACE)
+
+    with pytest.raises(HomeAssistantError, match="The startup was not traced"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_DUMP_STARTUP_TRACE, {}, blocking=True
+        )
+
+    startup_trace.async_setup(hass)
+    with startup_trace.trace_span(hass, "setup hue", "setup"):
+        pass
+
+    last_filename = None
+
+    def _mock_path(filename: str) -> str:
+        nonlocal last_filename
+        last_filename = str(tmp_path / filename)
+        return last_filename
+
+    with patch.object(hass.config, "path", _mock_path):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_DUMP_STARTUP_TRACE, {}, blocking=True
+        )
+
+    assert os.path.exists(last_filename)
+    trace = load_json(last_filename)
+    assert [event["name"] for event in trace["traceEvents"] if event["ph"] == "X"] == [
+        "setup hue"
+    ]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_object_growth_logging(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -258,12 +348,16 @@ async def test_log_scheduled(
     assert hass.services.has_service(DOMAIN, SERVICE_LOG_EVENT_LOOP_SCHEDULED)
 
     hass.loop.call_later(0.1, lambda: None)
+    timer = get_timer_wheel(hass.loop).call_later(60, lambda: None)
 
     await hass.services.async_call(
         DOMAIN, SERVICE_LOG_EVENT_LOOP_SCHEDULED, {}, blocking=True
     )
 
     assert "Scheduled" in caplog.text
+    assert "Timer wheel: {'pending': " in caplog.text
+    assert f"Scheduled: {timer!r}" in caplog.text
+    timer.cancel()
     caplog.clear()
 
     assert await hass.config_entries.async_unload(entry.entry_id)
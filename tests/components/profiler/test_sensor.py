@@ -0,0 +1,43 @@
+"""Test the Profiler sensors."""
+
+from homeassistant.components.profiler.const import DOMAIN, LOOP_WATCHDOG
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_component import async_update_entity
+from homeassistant.helpers.loop_watchdog import SlowCallback
+
+from tests.common import MockConfigEntry
+
+
+async def test_sensors(hass: HomeAssistant, entity_registry: er.EntityRegistry) -> None:
+    """Test the sensors of the event loop watchdog."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = "sensor.profiler_slow_callbacks"
+    assert hass.states.get(entity_id).state == "0"
+    assert hass.states.get("sensor.profiler_last_slow_callback").state == "unknown"
+    assert entity_registry.async_get(entity_id).entity_category == "diagnostic"
+
+    watchdog = hass.data[DOMAIN][LOOP_WATCHDOG]
+    watchdog.lag.add(0.25)
+    watchdog.slow_callback_count += 1
+    watchdog.slow_callbacks.append(
+        SlowCallback(0.0, 0.25, "hue", "homeassistant/components/hue/light.py:2")
+    )
+    for update_entity_id in (
+        entity_id,
+        "sensor.profiler_last_slow_callback",
+        "sensor.profiler_event_loop_lag_max",
+    ):
+        await async_update_entity(hass, update_entity_id)
+
+    assert hass.states.get(entity_id).state == "1"
+    assert hass.states.get("sensor.profiler_last_slow_callback").state == "hue"
+    assert float(hass.states.get("sensor.profiler_event_loop_lag_max").state) == 250
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert DOMAIN not in hass.data
@@ -0,0 +1,37 @@
+"""Test the Profiler system health."""
+
+from homeassistant.components.profiler.const import DOMAIN, LOOP_WATCHDOG
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.loop_watchdog import SlowCallback
+from homeassistant.helpers.template import COMPILED_TEMPLATE_CACHE_SIZE
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockConfigEntry, get_system_health_info
+
+
+async def test_system_health(hass: HomeAssistant) -> None:
+    """Test the Profiler system health."""
+    assert await async_setup_component(hass, "system_health", {})
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    watchdog = hass.data[DOMAIN][LOOP_WATCHDOG]
+    watchdog.lag.add(0.25)
+    watchdog.slow_callback_count += 2
+    watchdog.slow_callbacks.append(
+        SlowCallback(0.0, 0.25, "hue", "homeassistant/components/hue/light.py:2")
+    )
+    watchdog.slow_callbacks.append(SlowCallback(0.0, 0.15, None, "/usr/lib/x.py:10"))
+
+    info = await get_system_health_info(hass, DOMAIN)
+    assert info["event_loop_lag_max"] == "250.0 ms"
+    assert info["slow_callbacks"] == 2
+    assert info["recent_slow_callbacks"] == "/usr/lib/x.py:10 (150 ms), hue (250 ms)"
+    assert info["compiled_template_cache"] == (
+        f"0/{COMPILED_TEMPLATE_CACHE_SIZE} templates," " 0 hits, 0 misses, 0 evictions"
+    )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
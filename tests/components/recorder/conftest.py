@@ -44,16 +44,22 @@ def skip_by_db_engine(request: pytest.FixtureRequest, recorder_db_url: str) -> N
 @pytest.fixture
 def recorder_dialect_name(hass: HomeAssistant, db_engine: str) -> Generator[None]:
     """Patch the recorder dialect."""
-    if instance := hass.data.get(recorder.DATA_INSTANCE):
-        instance.__dict__.pop("dialect_name", None)
-        with patch.object(instance, "_dialect_name", db_engine):
-            yield
+    # The catalog of the database is only queried for partitioned tables
+    # on PostgreSQL, the tables of the test database are never partitioned
+    with patch(
+        "homeassistant.components.recorder.core.partitions.get_partitioned_tables",
+        return_value=set(),
+    ):
+        if instance := hass.data.get(recorder.DATA_INSTANCE):
             instance.__dict__.pop("dialect_name", None)
-    else:
-        with patch(
-            "homeassistant.components.recorder.Recorder.dialect_name", db_engine
-        ):
-            yield
+            with patch.object(instance, "_dialect_name", db_engine):
+                yield
+                instance.__dict__.pop("dialect_name", None)
+        else:
+            with patch(
+                "homeassistant.components.recorder.Recorder.dialect_name", db_engine
+            ):
+                yield
 
 
 @dataclass(slots=True)
@@ -398,6 +398,9 @@ class States(Base):  # type: ignore[misc,valid-type]
     metadata_id = Column(
         Integer, ForeignKey("states_meta.metadata_id"), index=True
     )  # *** Not originally in v32, only added for recorder to startup ok
+    volatile_attrs = Column(
+        Text
+    )  # *** Not originally in v32, only added for recorder to startup ok
     states_meta_rel = relationship("StatesMeta")
     old_state = relationship("States", remote_side=[state_id])
     state_attributes = relationship("StateAttributes")
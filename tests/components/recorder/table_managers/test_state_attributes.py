@@ -0,0 +1,116 @@
+"""Test state attributes table manager."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from sqlalchemy import func, select
+
+from homeassistant.components.recorder import Recorder, history
+from homeassistant.components.recorder.db_schema import StateAttributes, States
+from homeassistant.components.recorder.models import VOLATILE_ATTRS_SEPARATOR
+from homeassistant.components.recorder.models.state_attributes import (
+    decode_attributes_from_source,
+)
+from homeassistant.components.recorder.table_managers.state_attributes import (
+    _AttributeChanges,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from ..common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+@pytest.fixture
+def recorder_config() -> dict[str, Any] | None:
+    """Store the volatile attributes apart."""
+    return {"split_volatile_attributes": True}
+
+
+def test_attribute_changes() -> None:
+    """Test attributes become volatile after changing in consecutive updates."""
+    changes = _AttributeChanges({"name": "Phone", "last_seen": 1, "battery": 90})
+    assert changes.update({"name": "Phone", "last_seen": 2, "battery": 90}) == set()
+    assert changes.update({"name": "Phone", "last_seen": 3, "battery": 89}) == set()
+    # The battery level did not change in every update
+    assert changes.update({"name": "Phone", "last_seen": 4, "battery": 89}) == {
+        "last_seen"
+    }
+    # Volatile attributes stay volatile
+    assert changes.update({"name": "Phone", "last_seen": 4, "battery": 88}) == {
+        "last_seen"
+    }
+
+
+def test_decode_attributes_with_volatile_attributes() -> None:
+    """Test the volatile attributes are merged into the shared attributes."""
+    cache: dict[str, dict[str, Any]] = {}
+    source = f'{{"name":"Phone"}}{VOLATILE_ATTRS_SEPARATOR}{{"last_seen":4}}'
+    assert decode_attributes_from_source(source, cache) == {
+        "name": "Phone",
+        "last_seen": 4,
+    }
+    # Only the shared attributes are cached
+    assert list(cache) == ['{"name":"Phone"}']
+
+
+async def test_volatile_attributes_are_stored_with_the_state(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the shared attributes are deduplicated when an attribute changes."""
+    start = dt_util.utcnow()
+    for last_seen in range(6):
+        hass.states.async_set(
+            "device_tracker.phone",
+            "home",
+            {"friendly_name": "Phone", "last_seen": last_seen},
+        )
+    await async_wait_recording_done(hass)
+
+    def _fetch() -> tuple[list[str | None], int, list[dict[str, Any]]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            volatile_attrs = list(
+                session.execute(
+                    select(States.volatile_attrs).order_by(States.state_id)
+                ).scalars()
+            )
+            attributes_count = session.execute(
+                select(func.count(StateAttributes.attributes_id))
+            ).scalar_one()
+        states = history.get_significant_states(
+            hass,
+            start,
+            entity_ids=["device_tracker.phone"],
+            significant_changes_only=False,
+        )["device_tracker.phone"]
+        return volatile_attrs, attributes_count, [dict(s.attributes) for s in states]
+
+    (
+        volatile_attrs,
+        attributes_count,
+        attributes,
+    ) = await recorder_mock.async_add_executor_job(_fetch)
+    assert volatile_attrs == [
+        None,
+        None,
+        None,
+        '{"last_seen":3}',
+        '{"last_seen":4}',
+        '{"last_seen":5}',
+    ]
+    # The attributes of the first four states and the shared attributes
+    assert attributes_count == 4
+    assert attributes == [
+        {"friendly_name": "Phone", "last_seen": last_seen} for last_seen in range(6)
+    ]
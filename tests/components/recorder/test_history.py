@@ -637,6 +637,88 @@ async def test_get_significant_states_are_ordered(
     assert list(hist.keys()) == entity_ids
 
 
+async def test_iter_significant_states_chunks(
+    hass: HomeAssistant,
+) -> None:
+    """Test the significant states can be fetched in chunks."""
+    zero, four, _states = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    entity_ids = ["media_player.test", "thermostat.test", "script.can_cancel_this_one"]
+    hist = history.get_significant_states(
+        hass, zero, four, entity_ids, compressed_state_format=True
+    )
+    rows = sum(len(states) for states in hist.values())
+
+    chunks = list(
+        history.iter_significant_states_chunks(
+            hass, zero, four, entity_ids, compressed_state_format=True, chunk_size=2
+        )
+    )
+    assert rows > 2
+    assert len(chunks) == (rows + 1) // 2
+    merged: dict[str, list] = {}
+    for _, chunk in chunks:
+        assert sum(len(states) for states in chunk.values()) <= 2
+        for entity_id, states in chunk.items():
+            merged.setdefault(entity_id, []).extend(states)
+    assert merged == hist
+
+    # Continue after the first chunk
+    cursor, first_chunk = chunks[0]
+    remaining = list(
+        history.iter_significant_states_chunks(
+            hass,
+            zero,
+            four,
+            entity_ids,
+            compressed_state_format=True,
+            chunk_size=rows,
+            cursor=cursor,
+        )
+    )
+    assert [cursor for cursor, _ in remaining] == [chunks[-1][0]]
+    for entity_id, states in first_chunk.items():
+        remaining[0][1].setdefault(entity_id, [])[:0] = states
+    assert remaining[0][1] == hist
+
+    assert not list(
+        history.iter_significant_states_chunks(hass, zero, four, ["demo.id"])
+    )
+
+
+async def test_iter_significant_states_chunks_equal_timestamps(
+    hass: HomeAssistant,
+) -> None:
+    """Test resuming between states with the same last_updated skips none."""
+    start = dt_util.utcnow()
+    point = start + timedelta(seconds=1)
+    with freeze_time(point):
+        for state in ("0", "1", "2", "3"):
+            hass.states.async_set("sensor.test", state)
+    await async_wait_recording_done(hass)
+
+    states: list[str] = []
+    cursor = None
+    while True:
+        chunks = history.iter_significant_states_chunks(
+            hass,
+            start,
+            point + timedelta(seconds=1),
+            ["sensor.test"],
+            chunk_size=1,
+            cursor=cursor,
+        )
+        chunk = next(chunks, None)
+        chunks.close()
+        if chunk is None:
+            break
+        cursor, chunk_states = chunk
+        assert cursor[1] == point.timestamp()
+        states.extend(state.state for state in chunk_states["sensor.test"])
+    assert states == ["0", "1", "2", "3"]
+
+
 async def test_get_significant_states_only(
     hass: HomeAssistant,
 ) -> None:
@@ -0,0 +1,266 @@
+"""The tests for the recorder history cache."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import Recorder, history
+from homeassistant.components.recorder.history.cache import TRIM_THRESHOLD, HistoryCache
+from homeassistant.components.recorder.util import get_instance, session_scope
+from homeassistant.core import HomeAssistant, State
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+@pytest.fixture
+def recorder_config() -> dict[str, Any] | None:
+    """Enable the history cache."""
+    return {"history_cache_size": 1}
+
+
+@pytest.fixture(autouse=True)
+def setup_recorder(recorder_mock: Recorder) -> recorder.Recorder:
+    """Set up recorder."""
+
+
+def _get_significant_states(hass: HomeAssistant, **kwargs: Any) -> dict[str, Any]:
+    """Get significant states with a new session."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return history.get_significant_states_with_session(hass, session, **kwargs)
+
+
+def _as_dicts(states: dict[str, list[Any]]) -> dict[str, list[dict[str, Any]]]:
+    """Convert any State objects in the result to dicts."""
+    return {
+        entity_id: [
+            state.as_dict() if isinstance(state, State) else state
+            for state in entity_states
+        ]
+        for entity_id, entity_states in states.items()
+    }
+
+
+async def _async_record_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Record states for a few entities at different points in time."""
+    for idx in range(5):
+        hass.states.async_set("sensor.power", str(idx), {"unit": "W"})
+        freezer.tick(timedelta(seconds=1))
+        hass.states.async_set("sensor.power", str(idx), {"unit": "W", "idx": idx})
+        hass.states.async_set("light.kitchen", "on" if idx % 2 else "off")
+        hass.states.async_set("climate.living", "heat", {"temperature": idx})
+        freezer.tick(timedelta(minutes=10))
+    await async_wait_recording_done(hass)
+
+
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+@pytest.mark.parametrize("no_attributes", [True, False])
+@pytest.mark.parametrize("compressed_state_format", [True, False])
+@pytest.mark.parametrize(
+    "entity_ids",
+    [["sensor.power"], ["sensor.power", "light.kitchen", "climate.living"]],
+)
+async def test_history_cache_matches_database(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    minimal_response: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+    entity_ids: list[str],
+) -> None:
+    """Test the history cache returns the same results as the database."""
+    start = dt_util.utcnow()
+    await _async_record_states(hass, freezer)
+    instance = get_instance(hass)
+    history_cache = instance.history_cache
+    assert history_cache is not None
+
+    kwargs = {
+        "start_time": start + timedelta(minutes=15),
+        "end_time": start + timedelta(minutes=35),
+        "entity_ids": entity_ids,
+        "minimal_response": minimal_response,
+        "significant_changes_only": significant_changes_only,
+        "no_attributes": no_attributes,
+        "compressed_state_format": compressed_state_format,
+    }
+    cached = await instance.async_add_executor_job(
+        lambda: _get_significant_states(hass, **kwargs)
+    )
+    assert history_cache.stats.hits == 1
+    assert history_cache.stats.misses == 0
+
+    instance.history_cache = None
+    from_database = await instance.async_add_executor_job(
+        lambda: _get_significant_states(hass, **kwargs)
+    )
+    instance.history_cache = history_cache
+
+    assert cached
+    assert _as_dicts(cached) == _as_dicts(from_database)
+
+
+async def test_history_cache_chunk_cursors_match_database(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test chunks from the history cache resume like the ones from the database."""
+    start = dt_util.utcnow()
+    await _async_record_states(hass, freezer)
+    # States with the same last_updated are split over chunks
+    for state in ("a", "b", "c"):
+        hass.states.async_set("sensor.power", state)
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+    history_cache = instance.history_cache
+    assert history_cache is not None
+
+    def _cursors(cursor: tuple[int, float, int] | None = None) -> list[Any]:
+        return [
+            chunk_cursor
+            for chunk_cursor, _ in history.iter_significant_states_chunks(
+                hass,
+                start + timedelta(minutes=15),
+                None,
+                ["sensor.power", "light.kitchen"],
+                chunk_size=2,
+                cursor=cursor,
+            )
+        ]
+
+    cached = await instance.async_add_executor_job(_cursors)
+    resumed = await instance.async_add_executor_job(_cursors, cached[1])
+    assert history_cache.stats.hits == 2
+
+    instance.history_cache = None
+    from_database = await instance.async_add_executor_job(_cursors)
+    instance.history_cache = history_cache
+
+    assert len(cached) > 3
+    assert cached == from_database
+    assert resumed == cached[2:]
+
+
+async def test_history_cache_miss_before_first_cached_state(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test windows starting before the cached timeline fall back to the database."""
+    start = dt_util.utcnow()
+    await _async_record_states(hass, freezer)
+    instance = get_instance(hass)
+    history_cache = instance.history_cache
+    assert history_cache is not None
+
+    states = await instance.async_add_executor_job(
+        lambda: _get_significant_states(
+            hass,
+            start_time=start - timedelta(minutes=1),
+            entity_ids=["sensor.power", "sensor.unknown"],
+        )
+    )
+    assert len(states["sensor.power"]) == 5
+    assert history_cache.stats.hits == 0
+    assert history_cache.stats.misses == 1
+
+
+async def test_history_cache_invalidated_by_purge(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test purging the database invalidates cached entities."""
+    await _async_record_states(hass, freezer)
+    instance = get_instance(hass)
+    history_cache = instance.history_cache
+    assert history_cache is not None
+    assert len(history_cache) == 3
+
+    await hass.services.async_call(
+        recorder.DOMAIN,
+        "purge_entities",
+        {"entity_id": "sensor.power", "keep_days": 0},
+        blocking=True,
+    )
+    await async_wait_recording_done(hass)
+    assert len(history_cache) == 2
+
+    await hass.services.async_call(
+        recorder.DOMAIN, "purge", {"keep_days": 0}, blocking=True
+    )
+    await async_wait_recording_done(hass)
+    assert len(history_cache) == 0
+
+
+async def test_history_cache_filled_after_commit(hass: HomeAssistant) -> None:
+    """Test states of a failed commit are not added to the history cache."""
+    instance = get_instance(hass)
+    history_cache = instance.history_cache
+    assert history_cache is not None
+
+    cached_before_commit: list[int] = []
+
+    def _fail_commit() -> None:
+        cached_before_commit.append(len(history_cache))
+        raise SQLAlchemyError
+
+    with patch.object(instance, "_commit_event_session", side_effect=_fail_commit):
+        hass.states.async_set("sensor.power", "1")
+        await async_wait_recording_done(hass)
+    assert cached_before_commit
+    assert not any(cached_before_commit)
+    assert len(history_cache) == 0
+
+    hass.states.async_set("sensor.power", "2")
+    await async_wait_recording_done(hass)
+    assert len(history_cache) == 1
+
+
+def test_history_cache_evicts_least_recently_queried() -> None:
+    """Test the least recently queried entities are evicted first."""
+    history_cache = HistoryCache(4096)
+    for state_id, entity_id in enumerate(("sensor.one", "sensor.two", "sensor.three")):
+        history_cache.add(entity_id, state_id, "1", 1.0, None, "{}")
+    assert len(history_cache) == 3
+
+    assert history_cache.get_significant_states_rows(
+        {"sensor.one": 1}, 2.0, None, True, True, True, None
+    ) == [(1, "1", 0, 0)]
+
+    while history_cache.stats.evictions == 0:
+        history_cache.add("sensor.four", 3, "1", 1.0, None, "{}" * 100)
+
+    assert history_cache.size <= history_cache.max_size
+    assert "sensor.one" in history_cache._timelines
+    assert "sensor.two" not in history_cache._timelines
+
+
+def test_history_cache_trims_old_rows() -> None:
+    """Test rows older than the cached window are trimmed."""
+    history_cache = HistoryCache(10 * 1024**2)
+    for idx in range(TRIM_THRESHOLD * 4):
+        history_cache.add("sensor.one", idx, str(idx), idx * 3600.0, None, "{}")
+    timeline = history_cache._timelines["sensor.one"]
+    assert len(timeline.states) < TRIM_THRESHOLD * 2
+    assert len(timeline.attributes) == 1
+
+    # Time going backwards drops the timeline
+    history_cache.add("sensor.one", TRIM_THRESHOLD * 4, "old", 0.0, None, "{}")
+    assert len(history_cache) == 0
+    assert history_cache.size == 0
@@ -385,6 +385,56 @@ async def test_saving_state_with_intermixed_time_changes(
         assert db_states[0].event_id is None
 
 
+@pytest.mark.parametrize("bulk_insert", [True, False])
+async def test_saving_states_links_old_state_id(
+    hass: HomeAssistant, setup_recorder: None, bulk_insert: bool
+) -> None:
+    """Test old_state_id is linked within and across commits."""
+    instance = get_instance(hass)
+    instance._bulk_insert = bulk_insert
+    for idx in range(3):
+        hass.states.async_set("test.one", str(idx), {"idx": idx})
+        hass.states.async_set("test.two", str(idx))
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "3", {"idx": 3})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = (
+            session.query(States, StatesMeta.entity_id, StateAttributes.shared_attrs)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .order_by(States.state_id)
+            .all()
+        )
+        states_by_entity_id: dict[str, list[tuple[States, str | None]]] = {}
+        for db_state, entity_id, shared_attrs in db_states:
+            states_by_entity_id.setdefault(entity_id, []).append(
+                (db_state, shared_attrs)
+            )
+
+        assert [state.state for state, _ in states_by_entity_id["test.one"]] == [
+            "0",
+            "1",
+            "2",
+            "3",
+        ]
+        assert [attrs for _, attrs in states_by_entity_id["test.one"]] == [
+            '{"idx":0}',
+            '{"idx":1}',
+            '{"idx":2}',
+            '{"idx":3}',
+        ]
+        for entity_states in states_by_entity_id.values():
+            assert entity_states[0][0].old_state_id is None
+            for (old_state, _), (state, _) in zip(
+                entity_states, entity_states[1:], strict=False
+            ):
+                assert state.old_state_id == old_state.state_id
+
+
 async def test_saving_state_with_exception(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -396,11 +446,11 @@ async def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        instance = get_instance(hass)
+        if instance._pending_bulk_states or any(
+            isinstance(obj, States) for obj in instance.event_session
+        ):
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
@@ -0,0 +1,127 @@
+"""The tests for the recorder table partitions."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.partitions import (
+    Partition,
+    create_partitions,
+    get_partitions,
+    partition_name,
+    partition_start,
+)
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from tests.typing import RecorderInstanceGenerator
+
+OCT_19 = datetime(2024, 10, 19, tzinfo=dt_util.UTC).timestamp()
+OCT_20 = datetime(2024, 10, 20, tzinfo=dt_util.UTC).timestamp()
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+@pytest.fixture
+def recorder_config() -> dict[str, Any] | None:
+    """Enable partitioning."""
+    return {"db_partitioning": True}
+
+
+def _mock_session(partition_rows: list[tuple[str, str]]) -> MagicMock:
+    """Return a session which has partitions with the given bounds."""
+    session = MagicMock()
+    session.execute.return_value.all.return_value = partition_rows
+    return session
+
+
+def _executed_sql(session: MagicMock) -> list[str]:
+    """Return the SQL executed by the session."""
+    return [str(call.args[0]) for call in session.execute.call_args_list]
+
+
+def test_partition_name_and_start() -> None:
+    """Test the partitions are named after the UTC day they start."""
+    start = partition_start(OCT_19 + 3600 * 23.5)
+    assert start == datetime(2024, 10, 19, tzinfo=dt_util.UTC)
+    assert partition_name("states", start) == "states_p20241019"
+
+
+def test_get_partitions() -> None:
+    """Test the partitions are sorted by their upper bound."""
+    session = _mock_session(
+        [
+            ("states_default", "DEFAULT"),
+            ("states_p20241019", f"FOR VALUES FROM ('{OCT_19}') TO ('{OCT_20}')"),
+            ("states_legacy", f"FOR VALUES FROM (MINVALUE) TO ('{OCT_19}')"),
+        ]
+    )
+    assert get_partitions(session, "states") == [
+        Partition("states_legacy", OCT_19),
+        Partition("states_p20241019", OCT_20),
+        Partition("states_default", None),
+    ]
+
+
+def test_create_partitions() -> None:
+    """Test the missing partitions are created and attached."""
+    session = _mock_session(
+        [
+            ("states_default", "DEFAULT"),
+            ("states_legacy", f"FOR VALUES FROM (MINVALUE) TO ('{OCT_19}')"),
+        ]
+    )
+    create_partitions(session, "states", datetime(2024, 10, 18, 12, tzinfo=dt_util.UTC))
+    executed = _executed_sql(session)
+    assert [sql for sql in executed if sql.startswith("CREATE TABLE")] == [
+        f"CREATE TABLE states_p202410{day} (LIKE states INCLUDING DEFAULTS)"
+        for day in (19, 20, 21)
+    ]
+    attach = executed.index(
+        f"ALTER TABLE states ATTACH PARTITION states_p20241019"
+        f" FOR VALUES FROM ({OCT_19!r}) TO ({OCT_20!r})"
+    )
+    # The check constraint matching the bound avoids a scan of the partition
+    assert executed[attach - 2] == (
+        "ALTER TABLE states_p20241019 ADD CONSTRAINT states_p20241019_bound"
+        f" CHECK (last_updated_ts IS NOT NULL AND last_updated_ts >= {OCT_19!r}"
+        f" AND last_updated_ts < {OCT_20!r})"
+    )
+    assert executed[attach + 1] == (
+        "ALTER TABLE states_p20241019 DROP CONSTRAINT states_p20241019_bound"
+    )
+    # Rows which ended up in the default partition are moved
+    assert any(
+        sql.startswith("WITH moved AS (DELETE FROM states_default") for sql in executed
+    )
+
+
+def test_create_partitions_nothing_missing() -> None:
+    """Test nothing is created if the upcoming partitions exist."""
+    session = _mock_session(
+        [("states_p20241019", f"FOR VALUES FROM ('{OCT_19}') TO ('{OCT_20}')")]
+    )
+    create_partitions(session, "states", datetime(2024, 10, 16, tzinfo=dt_util.UTC))
+    assert len(session.execute.call_args_list) == 1
+
+
+async def test_partitioning_needs_postgresql(
+    caplog: pytest.LogCaptureFixture, hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the tables are not partitioned on other databases."""
+    assert recorder_mock.db_partitioning
+    assert recorder_mock.partitioned_tables == set()
+    assert any(
+        "only supported with PostgreSQL" in record.message
+        for record in caplog.get_records("setup")
+    )
@@ -1,13 +1,20 @@
 """Test pool."""
 
+from pathlib import Path
 import threading
+import time
+from unittest.mock import ANY
 
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from homeassistant.components.recorder.const import DB_WORKER_PREFIX
-from homeassistant.components.recorder.pool import RecorderPool
+from homeassistant.components.recorder.pool import (
+    MeteredQueuePool,
+    PoolMetrics,
+    RecorderPool,
+)
 
 
 async def test_recorder_pool_called_from_event_loop() -> None:
@@ -78,3 +85,43 @@ def test_recorder_pool(caplog: pytest.LogCaptureFixture) -> None:
     new_thread.join()
     assert "accesses the database without the database executor" not in caplog.text
     assert connections[6] != connections[7]
+
+
+def test_metered_queue_pool(tmp_path: Path) -> None:
+    """Test MeteredQueuePool keeps track of checkouts."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        poolclass=MeteredQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        connect_args={"check_same_thread": False},
+    )
+    pool = engine.pool
+    assert isinstance(pool, MeteredQueuePool)
+    get_session = sessionmaker(bind=engine)
+
+    session = get_session()
+    session.connection()
+    assert pool.metrics == PoolMetrics(checkouts=1, wait_time=ANY, max_wait_time=ANY)
+
+    def _wait_for_connection() -> None:
+        other_session = get_session()
+        other_session.connection()
+        other_session.close()
+
+    new_thread = threading.Thread(target=_wait_for_connection)
+    new_thread.start()
+    while not pool.metrics.waiting:
+        time.sleep(0.01)
+    session.close()
+    new_thread.join()
+
+    metrics = pool.metrics
+    assert metrics.waiting == 0
+    assert metrics.checkouts == 2
+    assert metrics.max_wait_time > 0
+    assert metrics.wait_time >= metrics.max_wait_time
+
+    recreated = pool.recreate()
+    assert recreated.metrics is metrics
+    engine.dispose()
@@ -4,16 +4,22 @@ from collections.abc import Generator
 from datetime import datetime, timedelta
 import json
 import sqlite3
-from unittest.mock import patch
+from typing import Any
+from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
 import pytest
+from sqlalchemy import select
 from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 from voluptuous.error import MultipleInvalid
 
 from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, Recorder
-from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.const import (
+    PURGE_PROGRESS_STORAGE_KEY,
+    PURGE_PROGRESS_STORAGE_VERSION,
+    SupportedDialect,
+)
 from homeassistant.components.recorder.db_schema import (
     Events,
     EventTypes,
@@ -25,8 +31,13 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
-from homeassistant.components.recorder.queries import select_event_type_ids
+from homeassistant.components.recorder.partitions import Partition
+from homeassistant.components.recorder.purge import PurgeProgress, purge_old_data
+from homeassistant.components.recorder.queries import (
+    delete_states_rows,
+    disconnect_states_rows,
+    select_event_type_ids,
+)
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
     SERVICE_PURGE_ENTITIES,
@@ -45,6 +56,7 @@ from .common import (
     convert_pending_states_to_meta,
 )
 
+from tests.common import async_test_home_assistant
 from tests.typing import RecorderInstanceGenerator
 
 TEST_EVENT_TYPES = (
@@ -110,6 +122,173 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
             assert state_attributes.count() == 1
 
 
+async def test_purge_time_budget(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test the purge stops starting new batches once its time budget is spent."""
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    progress = PurgeProgress(purge_before, repack=False, apply_filter=False)
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 12),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 12),
+    ):
+        finished = purge_old_data(
+            recorder_mock, purge_before, False, progress=progress, time_budget=0
+        )
+        assert not finished
+        assert progress.states_purged == 12
+        # The remaining rows are estimated from the range of the ids up to
+        # the newest expired state, which also holds 22 newer states
+        assert progress.states_remaining == 58
+
+        with session_scope(hass=hass) as session:
+            assert session.query(States).count() == 60
+
+        calls = 1
+        while not purge_old_data(
+            recorder_mock, purge_before, False, progress=progress, time_budget=0
+        ):
+            calls += 1
+
+    assert calls == 4
+    assert progress.states_purged == 48
+    assert progress.states_remaining == 0
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 24
+
+
+async def test_purge_drops_expired_partitions(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test expired partitions are dropped before the rows are purged."""
+    await _add_test_states(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    legacy_end_ts = (purge_before - timedelta(days=4)).timestamp()
+    partitions = [
+        Partition("states_legacy", legacy_end_ts),
+        Partition("states_p20240101", purge_before.timestamp() + 3600),
+        Partition("states_default", None),
+    ]
+
+    def _get_distinct_ids(session: Session, name: str, column: str) -> set[int]:
+        assert (name, column) == ("states_legacy", "attributes_id")
+        return set(
+            session.execute(
+                select(States.attributes_id).where(
+                    States.last_updated_ts < legacy_end_ts
+                )
+            ).scalars()
+        )
+
+    def _drop_partition(session: Session, table: str, name: str) -> None:
+        state_ids = set(
+            session.execute(
+                select(States.state_id).where(States.last_updated_ts < legacy_end_ts)
+            ).scalars()
+        )
+        session.execute(disconnect_states_rows(state_ids))
+        session.execute(delete_states_rows(state_ids))
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 6
+        assert session.query(StateAttributes).count() == 3
+
+    with (
+        patch.object(recorder_mock, "partitioned_tables", {"states"}),
+        patch(
+            "homeassistant.components.recorder.purge.partitions.get_partitions",
+            return_value=partitions,
+        ),
+        patch(
+            "homeassistant.components.recorder.purge.partitions.get_distinct_ids",
+            side_effect=_get_distinct_ids,
+        ),
+        patch(
+            "homeassistant.components.recorder.purge.partitions.drop_partition",
+            side_effect=_drop_partition,
+        ) as drop_partition_mock,
+    ):
+        assert purge_old_data(recorder_mock, purge_before, False)
+
+    drop_partition_mock.assert_called_once_with(ANY, "states", "states_legacy")
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        assert states.count() == 2
+        assert all(state.state.startswith("dontpurgeme") for state in states)
+        # The attributes only used by the dropped partition are purged as well
+        assert session.query(StateAttributes).count() == 1
+    assert recorder_mock.states_manager.committed_state_ids()
+
+
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_purge_resumed_after_restart(
+    async_test_recorder: RecorderInstanceGenerator, hass_storage: dict[str, Any]
+) -> None:
+    """Test a purge which did not finish before shutdown is resumed."""
+    async with (
+        async_test_home_assistant() as hass,
+        async_test_recorder(hass),
+    ):
+        await hass.async_start()
+        await _add_test_states(hass)
+        await hass.async_stop()
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    progress = PurgeProgress(purge_before, False, False, 1, 0, 3, 0)
+    hass_storage[PURGE_PROGRESS_STORAGE_KEY] = {
+        "version": PURGE_PROGRESS_STORAGE_VERSION,
+        "data": progress.as_dict(),
+    }
+
+    async with (
+        async_test_home_assistant() as hass,
+        async_test_recorder(hass) as instance,
+    ):
+        await hass.async_start()
+        await async_wait_purge_done(hass)
+        await hass.async_block_till_done()
+
+        assert instance.purge_progress is not None
+        assert instance.purge_progress.done
+        assert instance.purge_progress.states_purged == 5
+        assert PURGE_PROGRESS_STORAGE_KEY not in hass_storage
+
+        def _count_states() -> int:
+            with session_scope(hass=hass, read_only=True) as session:
+                return session.query(States).count()
+
+        assert await instance.async_add_executor_job(_count_states) == 2
+
+        await hass.async_stop()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        [],
+        {"purge_before": "2024-01-01T00:00:00+00:00", "repack": False},
+        {
+            "purge_before": "2024-01-01T00:00:00+00:00",
+            "repack": False,
+            "apply_filter": False,
+            "states_purged": "many",
+            "events_purged": 0,
+            "states_remaining": None,
+            "events_remaining": None,
+            "done": False,
+        },
+        {"purge_before": "not a date"},
+    ],
+)
+def test_purge_progress_from_invalid_dict(data: Any) -> None:
+    """Test an invalid purge progress is ignored."""
+    assert PurgeProgress.from_dict(data) is None
+
+
 async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old states."""
     await _add_test_states(hass)
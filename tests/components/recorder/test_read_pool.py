@@ -0,0 +1,138 @@
+"""The tests for the recorder read pools."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from homeassistant.components.recorder import Recorder, history
+from homeassistant.components.recorder.read_pool import sqlite_read_only_url
+from homeassistant.components.recorder.tasks import RecorderTask
+from homeassistant.components.recorder.util import get_instance, session_scope
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator, WebSocketGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+@pytest.fixture
+def persistent_database() -> bool:
+    """Use a database file which can be opened by the read pool."""
+    return True
+
+
+@pytest.fixture
+def recorder_config() -> dict[str, Any] | None:
+    """Enable the read pool."""
+    return {"db_read_pool_size": 2}
+
+
+def test_sqlite_read_only_url() -> None:
+    """Test the URL used to open SQLite databases read only."""
+    assert (
+        sqlite_read_only_url("sqlite:////config/home-assistant_v2.db")
+        == "sqlite:///file:/config/home-assistant_v2.db?mode=ro&uri=true"
+    )
+
+
+async def test_read_pool(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test read only sessions are served by the read pool."""
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+
+    instance = get_instance(hass)
+    assert len(instance.read_pools) == 1
+    read_pool = instance.read_pools[0]
+
+    def _get_states_and_write() -> dict[str, Any]:
+        states = history.get_significant_states(hass, start, entity_ids=["sensor.test"])
+        with (
+            pytest.raises(OperationalError, match="readonly"),
+            session_scope(hass=hass, read_only=True, replica=True) as session,
+        ):
+            session.execute(text("DELETE FROM states"))
+        return states
+
+    states = await instance.async_add_executor_job(_get_states_and_write)
+    assert len(states["sensor.test"]) == 1
+    assert read_pool.metrics.checkouts == 2
+    assert read_pool.metrics.waiting == 0
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id({"type": "recorder/read_pools"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == [
+        {
+            "name": read_pool.name,
+            "size": 2,
+            "checked_out": 0,
+            "waiting": 0,
+            "checkouts": 2,
+            "wait_time": read_pool.metrics.wait_time,
+            "max_wait_time": read_pool.metrics.max_wait_time,
+        }
+    ]
+
+
+async def test_read_pool_is_opt_in(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test read only sessions only use the read pool if asked to."""
+
+    def _get_binds() -> list[Any]:
+        binds = []
+        for replica in (False, True):
+            with session_scope(hass=hass, read_only=True, replica=replica) as session:
+                binds.append(session.get_bind())
+        return binds
+
+    assert await recorder_mock.async_add_executor_job(_get_binds) == [
+        recorder_mock.engine,
+        recorder_mock.read_pools[0].engine,
+    ]
+
+
+@dataclass(slots=True)
+class _GetReadSessionTask(RecorderTask):
+    """Get a read only session in the recorder thread."""
+
+    binds: list[Any]
+
+    def run(self, instance: Recorder) -> None:
+        """Get the session."""
+        session = instance.get_read_session()
+        self.binds.append(session.get_bind())
+        session.close()
+
+
+async def test_recorder_thread_reads_from_its_own_connection(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the recorder thread does not use the read pool."""
+    binds: list[Any] = []
+    recorder_mock.queue_task(_GetReadSessionTask(binds))
+    await async_wait_recording_done(hass)
+    assert binds == [recorder_mock.engine]
+
+    session = await recorder_mock.async_add_executor_job(recorder_mock.get_read_session)
+    assert session.get_bind() is recorder_mock.read_pools[0].engine
+    session.close()
@@ -0,0 +1,262 @@
+"""The tests for the recorder spool."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from homeassistant.components.recorder import Recorder, core, history
+from homeassistant.components.recorder.spool import (
+    EventSpool,
+    decode_event,
+    encode_event,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, HomeAssistant, State
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+CONTEXT = Context(id="01J9ZTDV1W0V5TEZH4H5GB2Q6K", user_id="b" * 32)
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+@pytest.fixture
+def recorder_config() -> dict[str, Any] | None:
+    """Enable the spool."""
+    return {"db_spool": True}
+
+
+@pytest.fixture(autouse=True)
+def spool_path(tmp_path: Path) -> Generator[Path]:
+    """Write the spool to a temporary directory."""
+    path = tmp_path / "recorder.spool"
+    with patch("homeassistant.components.recorder.DEFAULT_SPOOL_FILE", str(path)):
+        yield path
+
+
+def _state_changed_event(entity_id: str, state: str, old_state: State | None) -> Event:
+    """Return a state changed event."""
+    now = dt_util.utcnow()
+    new_state = State(
+        entity_id,
+        state,
+        {"unit_of_measurement": "W", "restored": True},
+        last_changed=now,
+        last_updated=now,
+        context=CONTEXT,
+    )
+    return Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": entity_id, "old_state": old_state, "new_state": new_state},
+        EventOrigin.local,
+        now.timestamp(),
+        CONTEXT,
+    )
+
+
+def test_encode_decode_event() -> None:
+    """Test events survive a round trip through the spool encoding."""
+    event = Event(
+        "test_event", {"answer": 42}, EventOrigin.remote, 1700000000.5, CONTEXT
+    )
+    decoded = decode_event(encode_event(event, None))
+    assert decoded.event_type == "test_event"
+    assert decoded.data == {"answer": 42}
+    assert decoded.origin is EventOrigin.remote
+    assert decoded.time_fired_timestamp == 1700000000.5
+    assert decoded.context.as_dict() == CONTEXT.as_dict()
+
+
+def test_encode_decode_state_changed_event() -> None:
+    """Test state changed events keep the fields the recorder writes."""
+    old_state = State("sensor.power", "1")
+    event = _state_changed_event("sensor.power", "2", old_state)
+    new_state = event.data["new_state"]
+    decoded = decode_event(encode_event(event, None))
+    decoded_state = decoded.data["new_state"]
+    assert decoded_state.state == "2"
+    # Attributes which are not recorded are not spooled
+    assert decoded_state.attributes == {"unit_of_measurement": "W"}
+    assert decoded_state.last_updated_timestamp == new_state.last_updated_timestamp
+    assert decoded_state.last_changed == new_state.last_changed
+    assert decoded_state.context.id == CONTEXT.id
+    assert (
+        decoded.data["old_state"].last_reported_timestamp
+        == old_state.last_reported_timestamp
+    )
+
+    removed = decode_event(
+        encode_event(
+            Event(
+                EVENT_STATE_CHANGED,
+                {"entity_id": "sensor.power", "old_state": None, "new_state": None},
+            ),
+            None,
+        )
+    )
+    assert removed.data == {
+        "entity_id": "sensor.power",
+        "old_state": None,
+        "new_state": None,
+    }
+
+
+def test_encode_not_serializable_event() -> None:
+    """Test events which cannot be recorded are not spooled."""
+    assert encode_event(Event("test_event", {"object": object()}), None) is None
+
+
+def test_spool_replay_batches(tmp_path: Path) -> None:
+    """Test the replay progress survives reopening the spool."""
+    path = tmp_path / "spool"
+    spool = EventSpool(path, lambda: None)
+    spool.open()
+    assert not spool.pending
+    for number in range(5):
+        spool.append(Event("test_event", {"number": number}))
+    spool.flush()
+
+    events, offset = spool.read_batch(3)
+    assert [event.data["number"] for event in events] == [0, 1, 2]
+    spool.mark_replayed(offset)
+    spool.close()
+
+    spool = EventSpool(path, lambda: None)
+    spool.open()
+    assert spool.pending
+    events, offset = spool.read_batch(3)
+    assert [event.data["number"] for event in events] == [3, 4]
+    spool.mark_replayed(offset)
+    assert not spool.pending
+    spool.close()
+    assert path.stat().st_size == 8
+
+
+def test_spool_truncated_record(tmp_path: Path) -> None:
+    """Test a record which was not completely written is discarded."""
+    path = tmp_path / "spool"
+    spool = EventSpool(path, lambda: None)
+    spool.open()
+    spool.append(Event("test_event", {"number": 1}))
+    spool.append(Event("test_event", {"number": 2}))
+    spool.close()
+    with path.open("r+b") as file:
+        file.truncate(path.stat().st_size - 3)
+
+    spool.open()
+    events, offset = spool.read_batch(10)
+    assert [event.data["number"] for event in events] == [1]
+    spool.mark_replayed(offset)
+    assert not spool.pending
+    spool.close()
+
+
+async def test_spool_and_replay(
+    hass: HomeAssistant, recorder_mock: Recorder, spool_path: Path
+) -> None:
+    """Test events are spooled when the backlog is too large and replayed later."""
+    start = dt_util.utcnow()
+    with patch.object(core, "SPOOL_QUEUE_BACKLOG", 0):
+        recorder_mock._async_check_spool()
+    assert recorder_mock._spooling
+
+    for state in ("1", "2", "3"):
+        hass.states.async_set("sensor.power", state)
+    await async_wait_recording_done(hass)
+    assert spool_path.stat().st_size > 8
+
+    def _get_states() -> list[State]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return history.get_significant_states_with_session(
+                hass, session, start, entity_ids=["sensor.power"]
+            ).get("sensor.power", [])
+
+    assert await recorder_mock.async_add_executor_job(_get_states) == []
+
+    # The database is still unreachable
+    with patch.object(
+        recorder_mock,
+        "_send_keep_alive",
+        side_effect=OperationalError("SELECT 1", {}, Exception()),
+    ):
+        recorder_mock._async_check_spool()
+        await async_wait_recording_done(hass)
+    assert recorder_mock._spooling
+
+    recorder_mock._async_check_spool()
+    await async_wait_recording_done(hass)
+    assert not recorder_mock._spooling
+    assert spool_path.stat().st_size == 8
+    states = await recorder_mock.async_add_executor_job(_get_states)
+    assert [state.state for state in states] == ["1", "2", "3"]
+
+    # New events are written to the database again
+    hass.states.async_set("sensor.power", "4")
+    await async_wait_recording_done(hass)
+    states = await recorder_mock.async_add_executor_job(_get_states)
+    assert [state.state for state in states] == ["1", "2", "3", "4"]
+
+
+async def test_spool_database_outage(
+    hass: HomeAssistant, recorder_mock: Recorder, spool_path: Path
+) -> None:
+    """Test events are spooled when the database goes away and replayed later."""
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.power", "1")
+    await async_wait_recording_done(hass)
+    recorder_mock.statistics_accumulator.track([hass.states.get("sensor.power")])
+    assert len(recorder_mock.statistics_accumulator) == 1
+
+    with (
+        patch.object(recorder_mock, "db_retry_wait", 0),
+        patch.object(
+            recorder_mock,
+            "_commit_event_session",
+            side_effect=OperationalError("COMMIT", {}, Exception()),
+        ) as commit_mock,
+    ):
+        hass.states.async_set("sensor.power", "2")
+        await async_wait_recording_done(hass)
+        assert recorder_mock._spooling
+        commits = commit_mock.call_count
+        hass.states.async_set("sensor.power", "3")
+        await async_wait_recording_done(hass)
+    # The events are spooled without trying the database
+    assert commit_mock.call_count == commits
+    assert spool_path.stat().st_size > 8
+    # The accumulator does not track states while they are spooled
+    recorder_mock.statistics_accumulator.track([hass.states.get("sensor.power")])
+    assert len(recorder_mock.statistics_accumulator) == 0
+
+    def _get_states() -> list[State]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return history.get_significant_states_with_session(
+                hass, session, start, entity_ids=["sensor.power"]
+            ).get("sensor.power", [])
+
+    states = await recorder_mock.async_add_executor_job(_get_states)
+    assert [state.state for state in states] == ["1"]
+
+    recorder_mock._async_check_spool()
+    await async_wait_recording_done(hass)
+    assert not recorder_mock._spooling
+    assert spool_path.stat().st_size == 8
+    states = await recorder_mock.async_add_executor_job(_get_states)
+    assert [state.state for state in states] == ["1", "2", "3"]
+    recorder_mock.statistics_accumulator.track([hass.states.get("sensor.power")])
+    assert len(recorder_mock.statistics_accumulator) == 1
@@ -9,7 +9,11 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -1844,6 +1848,76 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
+async def test_statistics_rollups(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone,
+) -> None:
+    """Test daily and monthly statistics are read from the rollup tables."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    assert instance.statistics_rollups_ready
+
+    zero = dt_util.utcnow()
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-09-30 20:00:00"))
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "mean": hour * 2,
+            "min": hour,
+            "max": hour * 3,
+            "state": hour,
+            "sum": hour * 10,
+        }
+        for hour in range(30)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatisticsDaily).count() == 3
+        assert session.query(StatisticsMonthly).count() == 2
+
+    for period in ("day", "month"):
+        from_rollups = statistics_during_period(
+            hass, zero, period=period, statistic_ids={"test:total_energy_import"}
+        )
+        instance.statistics_rollups_ready = False
+        from_hourly = statistics_during_period(
+            hass, zero, period=period, statistic_ids={"test:total_energy_import"}
+        )
+        instance.statistics_rollups_ready = True
+        assert from_rollups == from_hourly
+
+    # Rollups made for another time zone are rebuilt
+    await hass.config.async_set_time_zone(
+        "Pacific/Auckland" if timezone == "UTC" else "UTC"
+    )
+    from_hourly = statistics_during_period(
+        hass, zero, period="day", statistic_ids={"test:total_energy_import"}
+    )
+    assert not instance.statistics_rollups_ready
+    # Statistics are rolled up one month at a time
+    for _ in range(3):
+        await async_wait_recording_done(hass)
+    assert instance.statistics_rollups_ready
+    from_rollups = statistics_during_period(
+        hass, zero, period="day", statistic_ids={"test:total_energy_import"}
+    )
+    assert from_rollups == from_hourly
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
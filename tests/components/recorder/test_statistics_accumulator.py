@@ -0,0 +1,91 @@
+"""The tests for the recorder statistics accumulator."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from homeassistant.components.recorder.statistics_accumulator import (
+    AccumulatedStatistics,
+    StatisticsAccumulator,
+)
+from homeassistant.core import State
+import homeassistant.util.dt as dt_util
+
+START = datetime(2024, 1, 1, 12, 0, tzinfo=dt_util.UTC).timestamp()
+ATTRIBUTES = {"unit_of_measurement": "W"}
+
+
+def _state(state: str, timestamp: float, attributes: dict | None = None) -> State:
+    """Return a state updated at timestamp."""
+    return State(
+        "sensor.power",
+        state,
+        ATTRIBUTES if attributes is None else attributes,
+        last_updated=dt_util.utc_from_timestamp(timestamp),
+    )
+
+
+def _add(accumulator: StatisticsAccumulator, state: str, timestamp: float) -> None:
+    """Add a state to the accumulator."""
+    accumulator.add(_state(state, timestamp), "sensor.power", timestamp)
+
+
+def test_accumulator_requires_known_start_state() -> None:
+    """Test periods are only covered once the state at their start is known."""
+    accumulator = StatisticsAccumulator()
+    _add(accumulator, "10", START + 10)
+    assert len(accumulator) == 0
+
+    accumulator.track([_state("10", START + 10)])
+    _add(accumulator, "20", START + 20)
+    assert accumulator.flush("sensor.power", START, START + 300) is None
+
+    _add(accumulator, "30", START + 360)
+    assert accumulator.flush("sensor.power", START + 300, START + 600) == (
+        AccumulatedStatistics("W", 20.0, 30.0, (20 * 60 + 30 * 240) / 300)
+    )
+    # Periods without state changes have the state at their start
+    assert accumulator.flush(
+        "sensor.power", START + 600, START + 900
+    ) == AccumulatedStatistics("W", 30.0, 30.0, 30.0)
+    # Periods can only be flushed in order
+    assert accumulator.flush("sensor.power", START + 300, START + 600) is None
+
+
+def test_accumulator_non_numeric_states() -> None:
+    """Test non numeric states are skipped like when compiling from the database."""
+    accumulator = StatisticsAccumulator()
+    accumulator.track([_state("unavailable", START)])
+    _add(accumulator, "10", START + 360)
+    _add(accumulator, "unknown", START + 420)
+    _add(accumulator, "20", START + 480)
+    _add(accumulator, "unavailable", START + 540)
+
+    stats = accumulator.flush("sensor.power", START + 300, START + 600)
+    assert stats is not None
+    assert stats.min == 10.0
+    assert stats.max == 20.0
+    # The mean starts at the first numeric state
+    assert stats.mean == pytest.approx((10 * 120 + 20 * 120) / 240)
+    # The last state before the period is not numeric
+    assert accumulator.flush("sensor.power", START + 600, START + 900) is None
+
+
+def test_accumulator_unit_change() -> None:
+    """Test a changed unit restarts accumulation."""
+    accumulator = StatisticsAccumulator()
+    accumulator.track([_state("10", START)])
+    accumulator.add(
+        _state("10000", START + 360, {"unit_of_measurement": "mW"}),
+        "sensor.power",
+        START + 360,
+    )
+    assert accumulator.flush("sensor.power", START + 300, START + 600) is None
+    assert accumulator.flush(
+        "sensor.power", START + 600, START + 900
+    ) == AccumulatedStatistics("mW", 10000.0, 10000.0, 10000.0)
+
+    accumulator.track([])
+    assert len(accumulator) == 0
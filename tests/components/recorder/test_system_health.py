@@ -38,6 +38,25 @@ async def test_recorder_system_health(
     }
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("recorder_config", [{"history_cache_size": 1}])
+async def test_recorder_system_health_history_cache(
+    recorder_mock: Recorder, hass: HomeAssistant, recorder_db_url: str
+) -> None:
+    """Test recorder system health with the history cache enabled."""
+    assert await async_setup_component(hass, "system_health", {})
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert info["history_cache_entities"] == 1
+    assert info["history_cache_size"] == round(
+        recorder_mock.history_cache.size / 1024 / 1024, 2
+    )
+    assert info["history_cache_hits"] == 0
+    assert info["history_cache_misses"] == 0
+
+
 @pytest.mark.parametrize(
     "db_engine", [SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL]
 )
@@ -1006,7 +1006,7 @@ async def test_execute_stmt_lambda_element(
         start_time_ts = dt_util.utcnow().timestamp()
         stmt = lambda_stmt(
             lambda: _get_single_entity_start_time_stmt(
-                start_time_ts, metadata_id, False, False, False
+                start_time_ts, metadata_id, False, False, False, True
             )
         )
         rows = util.execute_stmt_lambda_element(session, stmt)
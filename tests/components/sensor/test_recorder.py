@@ -31,6 +31,7 @@ from homeassistant.components.recorder.models import (
 from homeassistant.components.recorder.statistics import (
     async_import_statistics,
     get_metadata,
+    get_metadata_with_session,
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
@@ -577,6 +578,113 @@ async def test_compile_hourly_statistics_only_state_is_and_end_of_period(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_statistics_accumulated(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test statistics of measurements are accumulated while states are recorded."""
+    zero = get_start_time(dt_util.utcnow())
+    period2 = zero + timedelta(minutes=5)
+    period3 = zero + timedelta(minutes=10)
+    period4 = zero + timedelta(minutes=15)
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    freezer.move_to(zero + timedelta(minutes=1))
+    hass.states.async_set("sensor.test1", "10", POWER_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.test2", "10", POWER_SENSOR_ATTRIBUTES)
+    await async_wait_recording_done(hass)
+    # The first period is compiled from the database
+    freezer.move_to(period2 + timedelta(seconds=10))
+    do_adhoc_statistics(hass, start=zero)
+    await async_wait_recording_done(hass)
+
+    for minutes, state in ((1, STATE_UNAVAILABLE), (2, "30"), (4, "20")):
+        freezer.move_to(period2 + timedelta(minutes=minutes))
+        hass.states.async_set("sensor.test1", state, POWER_SENSOR_ATTRIBUTES)
+    # A changed unit is not accumulated
+    hass.states.async_set(
+        "sensor.test2", "10000", {**POWER_SENSOR_ATTRIBUTES, "unit_of_measurement": "W"}
+    )
+    await async_wait_recording_done(hass)
+
+    freezer.move_to(period3 + timedelta(seconds=10))
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_states:
+        do_adhoc_statistics(hass, start=period2)
+        await async_wait_recording_done(hass)
+    assert get_states.call_count == 1
+    assert get_states.call_args.kwargs["entity_ids"] == ["sensor.test2"]
+
+    stats = statistics_during_period(hass, period2, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": period2.timestamp(),
+                "end": period3.timestamp(),
+                "mean": pytest.approx((10 * 120 + 30 * 120 + 20 * 60) / 300),
+                "min": pytest.approx(10.0),
+                "max": pytest.approx(30.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ],
+        "sensor.test2": [
+            {
+                "start": period2.timestamp(),
+                "end": period3.timestamp(),
+                # Displayed in the unit of the current state
+                "mean": pytest.approx(10000.0),
+                "min": pytest.approx(10000.0),
+                "max": pytest.approx(10000.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ],
+    }
+
+    # The accumulated W are converted to the kW of compiled statistics
+    freezer.move_to(period4 + timedelta(seconds=10))
+    with (
+        patch.object(
+            history,
+            "get_full_significant_states_with_session",
+            wraps=history.get_full_significant_states_with_session,
+        ) as get_states,
+        patch(
+            "homeassistant.components.recorder.statistics.get_metadata_with_session",
+            wraps=get_metadata_with_session,
+        ) as get_metadata_mock,
+    ):
+        do_adhoc_statistics(hass, start=period3)
+        await async_wait_recording_done(hass)
+    assert get_states.call_count == 0
+    assert get_metadata_mock.call_count == 1
+    assert (
+        get_metadata(hass, statistic_ids={"sensor.test2"})["sensor.test2"][1][
+            "unit_of_measurement"
+        ]
+        == "kW"
+    )
+    stats = statistics_during_period(hass, period3, period="5minute")
+    assert stats["sensor.test2"] == [
+        {
+            "start": period3.timestamp(),
+            "end": period4.timestamp(),
+            "mean": pytest.approx(10000.0),
+            "min": pytest.approx(10000.0),
+            "max": pytest.approx(10000.0),
+            "last_reset": None,
+            "state": None,
+            "sum": None,
+        }
+    ]
+
+
 @pytest.mark.parametrize(
     ("device_class", "state_unit", "display_unit", "statistics_unit", "unit_class"),
     [
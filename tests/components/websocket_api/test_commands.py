@@ -2563,6 +2563,49 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_event_bus_listener_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test enabling profiling of the event bus and fetching the stats."""
+    await websocket_client.send_json({"id": 5, "type": "event_bus/listener_stats"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "event_bus/set_profiling", "enabled": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    hass.bus.async_fire("test_event")
+
+    await websocket_client.send_json({"id": 7, "type": "event_bus/listener_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["started"] == hass.bus.profiler.started
+    assert isinstance(msg["result"]["listeners"], list)
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "event_bus/set_profiling", "enabled": False}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert hass.bus.profiler is None
+
+
+async def test_event_bus_profiling_requires_admin(
+    websocket_client: MockHAClientWebSocket, hass_admin_user: MockUser
+) -> None:
+    """Test profiling the event bus requires an admin."""
+    hass_admin_user.groups = []
+    await websocket_client.send_json(
+        {"id": 5, "type": "event_bus/set_profiling", "enabled": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
@@ -84,12 +84,14 @@ from homeassistant.helpers import (
     recorder as recorder_helper,
 )
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.template import clear_compiled_template_cache
 from homeassistant.helpers.translation import _TranslationsCacheData
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util, location
 from homeassistant.util.async_ import create_eager_task, get_scheduled_timer_handles
 from homeassistant.util.json import json_loads
+from homeassistant.util.timer_wheel import get_timer_wheel, is_timer_wheel_handle
 
 from .ignore_uncaught_exceptions import IGNORE_UNCAUGHT_EXCEPTIONS
 from .syrupy import HomeAssistantSnapshotExtension
@@ -376,8 +378,11 @@ def verify_cleanup(
     if tasks:
         event_loop.run_until_complete(asyncio.wait(tasks))
 
-    for handle in get_scheduled_timer_handles(event_loop):
-        if not handle.cancelled():
+    for handle in (
+        *get_scheduled_timer_handles(event_loop),
+        *get_timer_wheel(event_loop).timers(),
+    ):
+        if not handle.cancelled() and not is_timer_wheel_handle(handle):
             with long_repr_strings():
                 if expected_lingering_timers:
                     _LOGGER.warning("Lingering timer after test %r", handle)
@@ -418,6 +423,13 @@ def reset_hass_threading_local_object() -> Generator[None]:
     ha._hass.__dict__.clear()
 
 
+@pytest.fixture(autouse=True)
+def reset_compiled_template_cache() -> Generator[None]:
+    """Reset the process wide compiled template cache for every test case."""
+    yield
+    clear_compiled_template_cache()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def bcrypt_cost() -> Generator[None]:
     """Run with reduced rounds during tests, to speed up uses."""
@@ -1509,6 +1521,7 @@ async def async_test_recorder(
         session: Session | None = None,
         exception_filter: Callable[[Exception], bool] | None = None,
         read_only: bool = False,
+        replica: bool = False,
     ) -> Generator[Session]:
         """Wrap session_scope to bark if we create nested sessions."""
         if thread_session.has_session:
@@ -1523,6 +1536,7 @@ async def async_test_recorder(
                 session=session,
                 exception_filter=exception_filter,
                 read_only=read_only,
+                replica=replica,
             ) as ses:
                 yield ses
         finally:
@@ -1,7 +1,7 @@
 """Test the entity helper."""
 
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Generator, Iterable
 import dataclasses
 from datetime import timedelta
 from enum import IntFlag
@@ -21,6 +21,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     EntityCategory,
@@ -37,6 +38,7 @@ from homeassistant.helpers import device_registry as dr, entity, entity_registry
 from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
+from homeassistant.util import dt as dt_util
 
 from tests.common import (
     MockConfigEntry,
@@ -44,6 +46,8 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_capture_events,
+    async_fire_time_changed,
     mock_integration,
     mock_registry,
 )
@@ -2652,3 +2656,134 @@ async def test_async_write_ha_state_thread_safety_always(
     ):
         await hass.async_add_executor_job(ent2.async_write_ha_state)
     assert not hass.states.get(ent2.entity_id)
+
+
+@pytest.fixture
+def frozen_timer() -> Generator[None]:
+    """Make the entity timer follow the frozen time."""
+    with patch(
+        "homeassistant.helpers.entity.timer",
+        lambda: dt_util.utcnow().timestamp(),
+    ):
+        yield
+
+
+async def test_coalesced_state_writes(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    freezer: FrozenDateTimeFactory,
+    frozen_timer: None,
+) -> None:
+    """Test state writes within the coalescing window are collapsed."""
+    platform = MockEntityPlatform(hass)
+    ent = MockEntity(unique_id="qwer")
+    await platform.async_add_entities([ent])
+    entity_registry.async_update_entity_options(
+        ent.entity_id, entity.COALESCE_OPTIONS_DOMAIN, {"coalesce_window": 500}
+    )
+    await hass.async_block_till_done()
+    freezer.tick(1)
+
+    state_changed = async_capture_events(hass, EVENT_STATE_CHANGED)
+    for value in range(1, 6):
+        ent._attr_state = str(value)
+        ent.async_write_ha_state()
+        freezer.tick(0.05)
+
+    # Only the first write is written right away
+    assert [event.data["new_state"].state for event in state_changed] == ["1"]
+    last_write = dt_util.utcnow() - timedelta(seconds=0.05)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert [event.data["new_state"].state for event in state_changed] == ["1", "5"]
+    state = hass.states.get(ent.entity_id)
+    assert state.last_updated == last_write
+    assert state.last_reported == last_write
+
+    # Writes after the window are written right away again
+    freezer.tick(1)
+    ent._attr_state = "6"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).state == "6"
+
+
+@pytest.mark.parametrize("window", [-500, "500", True, 500000])
+async def test_coalesced_state_writes_invalid_window(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    freezer: FrozenDateTimeFactory,
+    frozen_timer: None,
+    window: Any,
+) -> None:
+    """Test state writes are not coalesced with an invalid window."""
+    platform = MockEntityPlatform(hass)
+    ent = MockEntity(unique_id="qwer")
+    await platform.async_add_entities([ent])
+    entity_registry.async_update_entity_options(
+        ent.entity_id, entity.COALESCE_OPTIONS_DOMAIN, {"coalesce_window": window}
+    )
+    await hass.async_block_till_done()
+    freezer.tick(1)
+
+    state_changed = async_capture_events(hass, EVENT_STATE_CHANGED)
+    for value in range(1, 4):
+        ent._attr_state = str(value)
+        ent.async_write_ha_state()
+        freezer.tick(0.05)
+
+    assert [event.data["new_state"].state for event in state_changed] == [
+        "1",
+        "2",
+        "3",
+    ]
+
+
+async def test_coalesced_state_writes_reported(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    freezer: FrozenDateTimeFactory,
+    frozen_timer: None,
+) -> None:
+    """Test coalesced writes of an unchanged state update last reported."""
+    platform = MockEntityPlatform(hass)
+    ent = MockEntity(unique_id="qwer")
+    await platform.async_add_entities([ent])
+    entity_registry.async_update_entity_options(
+        ent.entity_id, entity.COALESCE_OPTIONS_DOMAIN, {"coalesce_window": 500}
+    )
+    await hass.async_block_till_done()
+    last_changed = hass.states.get(ent.entity_id).last_changed
+
+    state_changed = async_capture_events(hass, EVENT_STATE_CHANGED)
+    for _ in range(3):
+        freezer.tick(0.1)
+        ent.async_write_ha_state()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert not state_changed
+    state = hass.states.get(ent.entity_id)
+    assert state.last_changed == last_changed
+    assert state.last_reported == dt_util.utcnow()
+
+
+async def test_coalesced_state_write_cancelled_on_remove(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the pending coalesced write is cancelled when the entity is removed."""
+    platform = MockEntityPlatform(hass)
+    ent = MockEntity(unique_id="qwer")
+    await platform.async_add_entities([ent])
+    entity_registry.async_update_entity_options(
+        ent.entity_id, entity.COALESCE_OPTIONS_DOMAIN, {"coalesce_window": 500}
+    )
+    await hass.async_block_till_done()
+
+    ent._attr_state = "1"
+    ent.async_write_ha_state()
+    await ent.async_remove(force_remove=True)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id) is None
@@ -53,6 +53,7 @@ from homeassistant.helpers.event import (
 from homeassistant.helpers.template import Template, result_as_boolean
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
+from homeassistant.util.timer_wheel import get_timer_wheel
 
 from tests.common import async_fire_time_changed, async_fire_time_changed_exact
 
@@ -552,6 +553,16 @@ async def test_async_track_state_change_event_with_empty_list(
     unsub_single()
 
 
+async def test_async_track_state_change_event_match_all(hass: HomeAssistant) -> None:
+    """Test async_track_state_change_event does not treat MATCH_ALL as a wildcard."""
+    calls = []
+    unsub = async_track_state_change_event(hass, MATCH_ALL, calls.append)
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+    assert calls == []
+    unsub()
+
+
 async def test_async_track_state_added_domain(hass: HomeAssistant) -> None:
     """Test async_track_state_added_domain."""
     single_entity_id_tracker = []
@@ -3593,7 +3604,7 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
     """Test tracking time interval name.
 
     This test is to ensure that when a name is passed to async_track_time_interval,
-    that the name can be found in the TimerHandle when stringified.
+    that the name can be found in the timer when stringified.
     """
     specific_runs = []
     unique_string = "xZ13"
@@ -3604,11 +3615,11 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
         timedelta(seconds=10),
         name=unique_string,
     )
-    scheduled = getattr(hass.loop, "_scheduled")
-    assert any(handle for handle in scheduled if unique_string in str(handle))
+    timer_wheel = get_timer_wheel(hass.loop)
+    assert any(timer for timer in timer_wheel.timers() if unique_string in str(timer))
     unsub()
 
-    assert all(handle for handle in scheduled if unique_string not in str(handle))
+    assert all(unique_string not in str(timer) for timer in timer_wheel.timers())
     await hass.async_block_till_done()
 
 
@@ -4599,7 +4610,9 @@ async def test_track_point_in_utc_time_cancel(hass: HomeAssistant) -> None:
 
     await hass.async_add_executor_job(_setup_listeners)
 
-    await asyncio.sleep(0.2)
+    # The timer wheel runs the timers at the end of their second
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=0.2))
+    await hass.async_block_till_done()
 
     assert len(times) == 1
     assert times[0].tzinfo == dt_util.UTC
@@ -4627,7 +4640,9 @@ async def test_async_track_point_in_time_cancel(hass: HomeAssistant) -> None:
 
     unsub1()
 
-    await asyncio.sleep(0.2)
+    # The timer wheel runs the timers at the end of their second
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=0.2))
+    await hass.async_block_till_done()
 
     assert len(times) == 1
     assert "US/Hawaii" in str(times[0].tzinfo)
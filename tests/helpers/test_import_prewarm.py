@@ -0,0 +1,68 @@
+"""Test pre-warming the modules imported on startup."""
+
+import importlib.util
+import os
+from pathlib import Path
+import py_compile
+import threading
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import import_prewarm
+
+
+def test_prewarm(tmp_path: Path) -> None:
+    """Test stale bytecode is compiled and fresh bytecode is read."""
+    stale = tmp_path / "stale.py"
+    stale.write_text("VALUE = 1\n")
+    fresh = tmp_path / "fresh.py"
+    fresh.write_text("VALUE = 2\n")
+    py_compile.compile(str(fresh), doraise=True)
+    stale_cache = importlib.util.cache_from_source(str(stale))
+
+    stats = import_prewarm._prewarm(
+        [str(stale), str(fresh), str(tmp_path / "gone.py")], threading.Event()
+    )
+
+    assert stats == {"compiled": 1, "read": 1, "missing": 1}
+    assert os.path.exists(stale_cache)
+
+
+def test_prewarm_stopped(tmp_path: Path) -> None:
+    """Test nothing is pre-warmed once stopped."""
+    source = tmp_path / "module.py"
+    source.write_text("VALUE = 1\n")
+    stop_event = threading.Event()
+    stop_event.set()
+
+    stats = import_prewarm._prewarm([str(source)], stop_event)
+
+    assert stats == {"compiled": 0, "read": 0, "missing": 0}
+
+
+async def test_async_setup(
+    hass: HomeAssistant, hass_storage: dict[str, Any], tmp_path: Path
+) -> None:
+    """Test the previous start is pre-warmed and the current one is recorded."""
+    source = tmp_path / "module.py"
+    source.write_text("VALUE = 1\n")
+    hass_storage[import_prewarm.STORAGE_KEY] = {
+        "version": import_prewarm.STORAGE_VERSION,
+        "data": {"files": [str(source)], "import_times": {}},
+    }
+
+    with patch.object(
+        import_prewarm, "_prewarm", wraps=import_prewarm._prewarm
+    ) as mock_prewarm:
+        await import_prewarm.async_setup(hass)
+    assert mock_prewarm.call_args[0][0] == [str(source)]
+    assert os.path.exists(importlib.util.cache_from_source(str(source)))
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    data = hass_storage[import_prewarm.STORAGE_KEY]["data"]
+    assert import_prewarm.__file__ in data["files"]
+    assert isinstance(data["import_times"], dict)
@@ -0,0 +1,83 @@
+"""Test the event loop watchdog."""
+
+import asyncio
+import time
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.loop_watchdog import LoopWatchdog
+
+
+def _integration_blocking_callback(seconds: float) -> None:
+    """Block the event loop from a frame of the hue integration."""
+    namespace: dict = {"time": time}
+    exec(  # noqa: S102
+        compile(
+            "def blocking_callback(seconds):\n    time.sleep(seconds)\n",
+            "/home/paulus/homeassistant/components/hue/light.py",
+            "exec",
+        ),
+        namespace,
+    )
+    namespace["blocking_callback"](seconds)
+
+
+async def test_watchdog_attributes_slow_callback(hass: HomeAssistant) -> None:
+    """Test the watchdog measures the lag and finds the slow callback."""
+    watchdog = LoopWatchdog(hass, threshold=0.05, interval=0.01)
+    watchdog.async_start()
+    try:
+        await asyncio.sleep(0.05)
+        hass.loop.call_soon(_integration_blocking_callback, 0.4)
+        await asyncio.sleep(0.1)
+    finally:
+        await watchdog.async_stop()
+
+    assert watchdog.lag.count > 1
+    assert watchdog.lag.max >= 0.3
+    assert watchdog.slow_callback_count >= 1
+    slow_callback = max(watchdog.slow_callbacks, key=lambda cb: cb.duration)
+    assert slow_callback.integration == "hue"
+    assert slow_callback.location == "homeassistant/components/hue/light.py:2"
+
+    stats = watchdog.async_stats()
+    assert stats["lag"]["count"] == watchdog.lag.count
+    assert stats["slow_callback_count"] == watchdog.slow_callback_count
+    assert slow_callback.as_dict() in stats["slow_callbacks"]
+
+
+async def test_watchdog_stop(hass: HomeAssistant) -> None:
+    """Test stopping the watchdog stops the heartbeat and the thread."""
+    watchdog = LoopWatchdog(hass, interval=0.01)
+    watchdog.async_start()
+    await asyncio.sleep(0.05)
+    await watchdog.async_stop()
+    count = watchdog.lag.count
+    assert count > 0
+    assert watchdog.slow_callback_count == 0
+
+    await asyncio.sleep(0.05)
+    assert watchdog.lag.count == count
+    # Stopping twice is a no-op
+    await watchdog.async_stop()
+
+
+async def test_watchdog_finds_stalls_above_threshold(hass: HomeAssistant) -> None:
+    """Test a stall longer than the threshold and the interval is always found."""
+    watchdog = LoopWatchdog(hass)
+    watchdog.async_start()
+    try:
+        await asyncio.sleep(0.01)
+        hass.loop.call_soon(time.sleep, watchdog.threshold + watchdog.interval + 0.05)
+        await asyncio.sleep(0.01)
+    finally:
+        await watchdog.async_stop()
+
+    assert watchdog.slow_callback_count == 1
+
+
+def test_watchdog_interval_below_threshold(hass: HomeAssistant) -> None:
+    """Test the heartbeat interval must be below the threshold."""
+    with pytest.raises(ValueError, match="below the threshold"):
+        LoopWatchdog(hass, threshold=0.1, interval=0.1)
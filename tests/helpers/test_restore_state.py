@@ -6,6 +6,7 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
@@ -17,6 +18,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    STATE_EXPIRATION,
+    STATE_LAST_SEEN_REFRESH,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -550,3 +553,91 @@ async def test_restore_entity_end_to_end(
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
+
+
+async def test_dump_reuses_unchanged_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the dicts of unchanged states are reused between dumps."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for object_id in ("b0", "b1"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.{object_id}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    hass.states.async_set("input_boolean.b0", "on")
+    hass.states.async_set("input_boolean.b1", "on")
+
+    data = async_get(hass)
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+        first_b0, first_b1 = mock_write_data.mock_calls[0][1][0]
+
+        freezer.tick(timedelta(minutes=15))
+        hass.states.async_set("input_boolean.b1", "off")
+        await data.async_dump_states()
+        second_b0, second_b1 = mock_write_data.mock_calls[1][1][0]
+
+        freezer.tick(STATE_LAST_SEEN_REFRESH)
+        await data.async_dump_states()
+        third_b0, third_b1 = mock_write_data.mock_calls[2][1][0]
+
+    assert second_b0 is first_b0
+    assert second_b1 is not first_b1
+    assert json_round_trip(second_b1)["state"]["state"] == "off"
+    assert second_b1["last_seen"] == first_b1["last_seen"] + timedelta(minutes=15)
+    # The last seen time is refreshed once it gets old
+    assert third_b0 is not second_b0
+    assert third_b0["last_seen"] > second_b0["last_seen"]
+    assert json_round_trip(third_b0) == {
+        **json_round_trip(second_b0),
+        "last_seen": third_b0["last_seen"].isoformat(),
+    }
+
+
+async def test_last_seen_expiration(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test states expire from the last seen time written when stopping."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b0"
+    await platform.async_add_entities([entity])
+
+    data = async_get(hass)
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        data.async_setup_dump()
+        await hass.async_block_till_done()
+        freezer.tick(STATE_LAST_SEEN_REFRESH / 2)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        # The periodic dump keeps the last seen time of the unchanged entity
+        first, periodic = (call[1][0][0] for call in mock_write_data.mock_calls)
+        assert periodic is first
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+
+    # The dump when stopping writes the current last seen time
+    stopped = json_round_trip(mock_write_data.mock_calls[-1][1][0])
+    assert stopped[0]["last_seen"] == dt_util.utcnow().isoformat()
+
+    # Emulate the next run, in which the entity no longer exists
+    await entity.async_remove()
+    hass.states.async_remove("input_boolean.b0")
+    data.last_states = {
+        item["state"]["entity_id"]: StoredState.from_dict(item) for item in stopped
+    }
+    freezer.tick(STATE_EXPIRATION)
+    assert [
+        stored_state.state.entity_id for stored_state in data.async_get_stored_states()
+    ] == ["input_boolean.b0"]
+    freezer.tick(timedelta(seconds=1))
+    assert data.async_get_stored_states() == []
@@ -0,0 +1,83 @@
+"""Test the startup tracer."""
+
+import asyncio
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import startup_trace
+
+
+async def test_trace_span_without_tracer(hass: HomeAssistant) -> None:
+    """Test spans are not recorded when the startup is not traced."""
+    with startup_trace.trace_span(hass, "setup hue", "setup"):
+        pass
+    assert startup_trace.async_get_tracer(hass) is None
+
+
+async def test_trace_startup(hass: HomeAssistant) -> None:
+    """Test spans are recorded on tracks until Home Assistant started."""
+    startup_trace.async_setup(hass)
+    tracer = startup_trace.async_get_tracer(hass)
+
+    async def _setup(domain: str) -> None:
+        with (
+            startup_trace.trace_span(hass, f"setup {domain}", "setup", group="1"),
+            startup_trace.trace_span(hass, f"import {domain}", "import"),
+        ):
+            await asyncio.sleep(0)
+
+    def _import_in_executor() -> None:
+        with startup_trace.trace_span(hass, "import sun", "import"):
+            pass
+
+    await asyncio.gather(
+        hass.async_create_task(_setup("hue"), "setup hue"),
+        hass.async_create_task(_setup("zha"), "setup zha"),
+    )
+    await hass.async_add_executor_job(_import_in_executor)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    assert not tracer.active
+    with startup_trace.trace_span(hass, "setup late", "setup"):
+        pass
+
+    spans = {span.name: span for span in tracer.spans}
+    assert len(tracer.spans) == 5
+    assert set(spans) == {
+        "import hue",
+        "import zha",
+        "setup hue",
+        "setup zha",
+        "import sun",
+    }
+    assert spans["setup hue"].track == spans["import hue"].track
+    assert spans["setup zha"].track == spans["import zha"].track
+    assert spans["setup hue"].track != spans["setup zha"].track
+    assert spans["import sun"].track not in (
+        spans["setup hue"].track,
+        spans["setup zha"].track,
+    )
+    assert spans["setup hue"].start <= spans["import hue"].start
+    assert spans["setup hue"].end >= spans["import hue"].end
+
+    trace = tracer.as_chrome_trace()
+    events = trace["traceEvents"]
+    track_names = {
+        event["tid"]: event["args"]["name"]
+        for event in events
+        if event["name"] == "thread_name"
+    }
+    assert track_names[spans["setup hue"].track] == "setup hue"
+    complete_events = [event for event in events if event["ph"] == "X"]
+    assert len(complete_events) == 5
+    setup_hue = next(event for event in complete_events if event["name"] == "setup hue")
+    assert setup_hue["cat"] == "setup"
+    assert setup_hue["ts"] >= 0
+    assert setup_hue["dur"] >= 0
+    assert setup_hue["args"] == {"group": "1"}
+    import_hue = next(
+        event for event in complete_events if event["name"] == "import hue"
+    )
+    assert "args" not in import_hue
+    assert [event["name"] for event in events if event["ph"] == "i"] == ["started"]
@@ -20,7 +20,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -1180,3 +1180,163 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journal(tmpdir: py.path.local) -> None:
+    """Test changes are appended to the journal and compacted."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+
+        def _read(path: str) -> bytes | None:
+            if not os.path.exists(path):
+                return None
+            with open(path, "rb") as file:
+                return file.read()
+
+        data = {"name": "one", "items": [{"id": i} for i in range(100)]}
+        await store.async_save(data)
+        main = await hass.async_add_executor_job(_read, store.path)
+        assert await hass.async_add_executor_job(_read, journal_path) is None
+
+        data = {
+            "name": "two",
+            "items": [*data["items"][:5], {"id": 5, "new": True}, *data["items"][6:]],
+            "added": [{"id": 100}],
+        }
+        await store.async_save(data)
+        assert await hass.async_add_executor_job(_read, store.path) == main
+        journal = await hass.async_add_executor_job(_read, journal_path)
+        records = [json.loads(line) for line in journal.splitlines()]
+        assert records[1] == {
+            "values": {"name": "two"},
+            "lists": {
+                "items": {"length": 100, "items": {"5": {"id": 5, "new": True}}},
+                "added": {"length": 1, "items": {"0": {"id": 100}}},
+            },
+        }
+
+        data = {"name": "two", "items": data["items"][:99]}
+        await store.async_save(data)
+        assert await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load() == {"name": "two", "items": data["items"]}
+
+        # Removing the first item moves all items, so the journal is compacted
+        data = {"name": "two", "items": data["items"][1:]}
+        await store.async_save(data)
+        assert await hass.async_add_executor_job(_read, journal_path) is None
+        assert json.loads(await hass.async_add_executor_job(_read, store.path)) == {
+            "version": MOCK_VERSION,
+            "minor_version": 1,
+            "key": MOCK_KEY,
+            "data": data,
+        }
+
+        # The journal is compacted on the final write
+        data = {"name": "three", "items": data["items"]}
+        await store.async_save(data)
+        assert await hass.async_add_executor_job(_read, journal_path) is not None
+        store.async_delay_save(lambda: data, 10)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert await hass.async_add_executor_job(_read, journal_path) is None
+        assert json.loads(await hass.async_add_executor_job(_read, store.path))[
+            "data"
+        ] == {"name": "three", "items": data["items"]}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_list_data(tmpdir: py.path.local) -> None:
+    """Test the journal of a store which data is a list."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        data = [{"id": i} for i in range(100)]
+        await store.async_save(data)
+        data = [*data[:98], {"id": 98, "new": True}]
+        await store.async_save(data)
+        assert await hass.async_add_executor_job(os.path.exists, journal_path)
+
+        assert (
+            await storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True).async_load()
+            == data
+        )
+
+        await store.async_remove()
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+        await hass.async_stop(force=True)
+
+
+async def test_journal_ignored(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test incomplete records and journals of other files are ignored."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        items = [{"id": i} for i in range(100)]
+        await store.async_save({"items": items})
+        await store.async_save({"items": [*items, {"id": 100}]})
+
+        def _append(path: str, data: bytes) -> None:
+            with open(path, "ab") as file:
+                file.write(data)
+
+        await hass.async_add_executor_job(_append, journal_path, b'{"values": {"x"')
+        assert await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load() == {"items": [*items, {"id": 100}]}
+        assert "Ignoring incomplete record" in caplog.text
+
+        await hass.async_add_executor_job(_append, store.path, b"\n")
+        assert await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load() == {"items": items}
+        assert "Ignoring journal" in caplog.text
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_tracks_changed_items(tmpdir: py.path.local) -> None:
+    """Test only changed items are serialized and items changed in place are found."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        fragments = [json_fragment(json_bytes({"id": i})) for i in range(100)]
+        mutable = {"id": "mutable"}
+        await store.async_save({"items": fragments, "other": [mutable]})
+
+        fragments = [
+            *fragments[:5],
+            json_fragment(b'{"id":5,"new":true}'),
+            *fragments[6:],
+        ]
+        mutable["new"] = True
+        with patch(
+            "homeassistant.helpers.storage.json_bytes", wraps=json_bytes
+        ) as mock_json_bytes:
+            await store.async_save({"items": fragments, "other": [mutable]})
+        # The changed fragment, the item changed in place,
+        # the base and the record are serialized
+        assert mock_json_bytes.call_count == 4
+
+        assert await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load() == {
+            "items": [
+                {"id": i, "new": True} if i == 5 else {"id": i} for i in range(100)
+            ],
+            "other": [{"id": "mutable", "new": True}],
+        }
+
+        await hass.async_stop(force=True)
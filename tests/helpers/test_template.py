@@ -11,6 +11,7 @@ import random
 from types import MappingProxyType
 from typing import Any
 from unittest.mock import patch
+import weakref
 
 from freezegun import freeze_time
 import orjson
@@ -4910,6 +4911,65 @@ async def test_async_render_to_info_in_conditional(hass: HomeAssistant) -> None:
     assert_result_info(info, "oink", ["sensor.xyz", "sensor.pig"], [])
 
 
+@pytest.mark.parametrize(
+    ("template_str", "entities", "domains"),
+    [
+        ("{{ states('sensor.Power') }}", {"sensor.power"}, set()),
+        ("{{ states.light.kitchen.state }}", {"light.kitchen"}, set()),
+        ("{{ states['light.kitchen'] }}", {"light.kitchen"}, set()),
+        ("{{ states.light | count }}", set(), {"light"}),
+        ("{{ 'light.a' | state_attr('brightness') }}", {"light.a"}, set()),
+        ("{{ 'light.a' is is_state('on') }}", {"light.a"}, set()),
+        (
+            "{% if is_state('light.a', 'on') %}{{ has_value('light.b') }}"
+            "{% else %}{{ is_state_attr('light.c', 'mode', 1) }}{% endif %}",
+            {"light.a", "light.b", "light.c"},
+            set(),
+        ),
+        ("{{ now() }}", set(), set()),
+    ],
+)
+def test_analyze_template_dependencies(
+    template_str: str, entities: set[str], domains: set[str]
+) -> None:
+    """Test the states a template reads are found without rendering."""
+    assert template.analyze_template_dependencies(
+        template_str
+    ) == template.TemplateDependencies(frozenset(entities), frozenset(domains))
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states | count }}",
+        "{{ states(entity_id) }}",
+        "{% set domain = 'light' %}{{ states[domain].kitchen }}",
+        "{{ ['light.a'] | select('is_state', 'on') | list }}",
+        "{{ expand('group.lights') }}",
+        "{% import 'macros.jinja' as macros %}{{ macros.power() }}",
+        "{{ states('sensor.power' }}",
+    ],
+)
+def test_analyze_template_dependencies_unresolvable(template_str: str) -> None:
+    """Test templates which need to be rendered to know the states they read."""
+    assert template.analyze_template_dependencies(template_str) is None
+
+
+async def test_async_render_to_info_error_with_dependencies(
+    hass: HomeAssistant,
+) -> None:
+    """Test a failed render listens to the states the template reads."""
+    hass.states.async_set("sensor.power", "unavailable")
+    info = template.Template(
+        "{{ states('sensor.power') | float + states('sensor.energy') | float }}", hass
+    ).async_render_to_info()
+    assert info.exception is not None
+    assert info.entities == {"sensor.power", "sensor.energy"}
+    assert info.filter("sensor.energy")
+    assert not info.filter("sensor.other")
+    assert info.rate_limit is None
+
+
 def test_jinja_namespace(hass: HomeAssistant) -> None:
     """Test Jinja's namespace command can be used."""
     test_template = template.Template(
@@ -5148,7 +5208,7 @@ def test_iif(hass: HomeAssistant) -> None:
 
 
 async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
+    """Test the compiled code is released when the cache is cleared."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
@@ -5156,18 +5216,54 @@ async def test_cache_garbage_collection() -> None:
         (template_string),
     )
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    code = weakref.ref(tpl._compiled_code)
 
     tpl2 = template.Template(
         (template_string),
     )
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert tpl2._compiled_code is code()
 
     del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
     del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+    # The compiled code is still held by the compiled template cache
+    assert code() is not None
+    template.clear_compiled_template_cache()
+    assert code() is None
+
+
+async def test_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Test compiled templates are shared until they are evicted."""
+    template_string = "{{ states('sensor.compiled_cache') }}"
+    tpl = template.Template(template_string, hass)
+    tpl.ensure_valid()
+    code = tpl._compiled_code
+    del tpl
+
+    # The code outlives the template it was compiled for
+    tpl = template.Template(template_string, hass)
+    tpl.ensure_valid()
+    assert tpl._compiled_code is code
+    assert template.compiled_template_cache_stats() == {
+        "size": 1,
+        "max_size": template.COMPILED_TEMPLATE_CACHE_SIZE,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+    }
+
+    with patch.object(
+        template, "COMPILED_TEMPLATE_CACHE", template._CompiledTemplateCache(1)
+    ):
+        template.Template("{{ 1 }}", hass).ensure_valid()
+        template.Template("{{ 2 }}", hass).ensure_valid()
+        assert template.compiled_template_cache_stats() == {
+            "size": 1,
+            "max_size": 1,
+            "hits": 0,
+            "misses": 2,
+            "evictions": 1,
+        }
 
 
 def test_is_template_string() -> None:
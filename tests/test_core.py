@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import array
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 import functools
 import gc
 import logging
@@ -64,6 +65,7 @@ from homeassistant.helpers.json import json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -1564,6 +1566,150 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_shares_identical_attributes(hass: HomeAssistant) -> None:
+    """Test states with structurally identical attributes share one dict."""
+    attrs = {"unit_of_measurement": "W", "options": ["a", "b"], "nested": {"x": 1}}
+
+    hass.states.async_set("sensor.one", "1", dict(attrs))
+    hass.states.async_set("sensor.two", "2", dict(attrs))
+    hass.states.async_set("sensor.three", "3", {**attrs, "nested": {"x": True}})
+    hass.states.async_set("sensor.four", "4", {"not_hashable": {1, 2}})
+    hass.states.async_set("sensor.five", "5")
+    hass.states.async_set("sensor.six", "6", {})
+
+    one = hass.states.get("sensor.one")
+    two = hass.states.get("sensor.two")
+    three = hass.states.get("sensor.three")
+    assert one.attributes is two.attributes
+    assert isinstance(one.attributes, ReadOnlyDict)
+    # Values which compare equal but serialize differently are not shared
+    assert three.attributes == one.attributes
+    assert three.attributes is not one.attributes
+    assert hass.states.get("sensor.four").attributes == {"not_hashable": {1, 2}}
+    assert (
+        hass.states.get("sensor.five").attributes
+        is hass.states.get("sensor.six").attributes
+    )
+
+    # The JSON of the shared attributes is spliced into the JSON of the states
+    assert json_loads(two.as_dict_json) == {
+        **json_loads(json_dumps(two.as_dict())),
+        "attributes": {
+            "unit_of_measurement": "W",
+            "options": ["a", "b"],
+            "nested": {"x": 1},
+        },
+    }
+    assert json_loads(b"{" + three.as_compressed_state_json + b"}") == {
+        "sensor.three": {
+            "s": "3",
+            "a": {
+                "unit_of_measurement": "W",
+                "options": ["a", "b"],
+                "nested": {"x": True},
+            },
+            "c": three.context.id,
+            "lc": three.last_changed_timestamp,
+        }
+    }
+
+
+async def test_statemachine_snapshot(hass: HomeAssistant) -> None:
+    """Test the snapshot of the JSON of the states."""
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "off")
+    snapshot = hass.states.async_snapshot()
+    assert snapshot.sequence == hass.states.sequence == 2
+    assert list(snapshot.states) == ["light.one", "light.two"]
+    assert snapshot.states["light.one"] is hass.states.get("light.one").as_dict_json
+    assert hass.states.async_snapshot() is snapshot
+
+    # Reporting an unchanged state does not change the sequence
+    hass.states.async_set("light.one", "on")
+    assert hass.states.async_snapshot() is snapshot
+
+    hass.states.async_set("light.one", "off")
+    hass.states.async_remove("light.two")
+    hass.states.async_set("light.three", "on")
+    hass.states.async_set("light.four", "on", {"bad": object()})
+    new_snapshot = hass.states.async_snapshot()
+    assert new_snapshot.sequence == 6
+    assert list(new_snapshot.states) == ["light.one", "light.three"]
+    assert new_snapshot.states["light.one"] is hass.states.get("light.one").as_dict_json
+    assert new_snapshot.unserializable == {"light.four"}
+    # The previous snapshot is unchanged
+    assert list(snapshot.states) == ["light.one", "light.two"]
+
+    changes = hass.states.async_changes_since(snapshot.sequence)
+    assert changes.sequence == 6
+    assert list(changes.changed) == ["light.one", "light.three"]
+    assert changes.removed == ("light.two",)
+    assert changes.unserializable == {"light.four"}
+
+    changes = hass.states.async_changes_since(hass.states.sequence)
+    assert changes.changed == {}
+    assert changes.removed == ()
+    assert hass.states.async_changes_since(hass.states.sequence + 1) is None
+
+
+async def test_statemachine_changes_since_pruned(hass: HomeAssistant) -> None:
+    """Test changes since a sequence older than the pruned removals."""
+    hass.states.async_set("light.kept", "on")
+    with patch.object(ha, "MAX_REMOVED_ENTITIES", 4):
+        snapshot = hass.states.async_snapshot()
+        for index in range(5):
+            hass.states.async_set(f"light.removed_{index}", "on")
+            hass.states.async_remove(f"light.removed_{index}")
+
+    assert hass.states.async_changes_since(snapshot.sequence) is None
+    changes = hass.states.async_changes_since(hass.states.sequence - 3)
+    assert changes.removed == ("light.removed_3", "light.removed_4")
+
+    new_snapshot = hass.states.async_snapshot()
+    assert list(new_snapshot.states) == ["light.kept"]
+
+
+async def test_statemachine_shares_only_json_attributes(hass: HomeAssistant) -> None:
+    """Test attributes which compare equal but serialize differently are not shared."""
+    utc = datetime(2024, 1, 1, 12, tzinfo=dt_util.UTC)
+    local = utc.astimezone(timezone(timedelta(hours=2)))
+    assert utc == local
+
+    hass.states.async_set("sensor.utc", "1", {"time": utc})
+    hass.states.async_set("sensor.local", "1", {"time": local})
+    hass.states.async_set("sensor.decimal", "1", {"value": Decimal("1.0")})
+    hass.states.async_set("sensor.decimals", "1", {"value": Decimal("1.00")})
+    hass.states.async_set("sensor.zero", "1", {"value": 0.0})
+    hass.states.async_set("sensor.negative_zero", "1", {"value": -0.0})
+
+    for first, second in (
+        ("sensor.utc", "sensor.local"),
+        ("sensor.decimal", "sensor.decimals"),
+        ("sensor.zero", "sensor.negative_zero"),
+    ):
+        first_state = hass.states.get(first)
+        second_state = hass.states.get(second)
+        assert first_state.attributes == second_state.attributes
+        assert first_state.attributes is not second_state.attributes
+    assert json_loads(hass.states.get("sensor.local").as_dict_json)["attributes"] == {
+        "time": "2024-01-01T14:00:00+02:00"
+    }
+
+
+async def test_statemachine_shared_attributes_are_copied(hass: HomeAssistant) -> None:
+    """Test the shared attributes do not change with the attributes they came from."""
+    nested = {"x": 1}
+    options = ["a"]
+    hass.states.async_set("sensor.one", "1", {"nested": nested, "options": options})
+    hass.states.async_set("sensor.two", "2", {"nested": {"x": 1}, "options": ["a"]})
+    nested["x"] = 2
+    options.append("b")
+
+    two = hass.states.get("sensor.two")
+    assert two.attributes is hass.states.get("sensor.one").attributes
+    assert two.attributes == {"nested": {"x": 1}, "options": ["a"]}
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -3576,3 +3722,287 @@ async def test_async_set_updates_last_reported(hass: HomeAssistant) -> None:
         assert state.last_reported_timestamp != last_reported_timestamp
         last_reported = state.last_reported
         last_reported_timestamp = state.last_reported_timestamp
+
+
+async def test_eventbus_profiling(hass: HomeAssistant) -> None:
+    """Test the listeners are measured while profiling is enabled."""
+    calls = []
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def mock_filter(event_data: dict[str, Any]) -> bool:
+        """Mock filter."""
+        return not event_data["filtered"]
+
+    hass.bus.async_listen("test_event", listener, event_filter=mock_filter)
+    assert hass.bus.profiler is None
+    hass.bus.async_fire("test_event", {"filtered": False})
+
+    profiler = hass.bus.async_enable_profiling()
+    assert hass.bus.async_enable_profiling() is profiler
+    hass.bus.async_fire("test_event", {"filtered": False})
+    hass.bus.async_fire("test_event", {"filtered": True})
+    hass.bus.async_fire("test_event", {"filtered": False})
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+    stats = {
+        listener_stats["listener"]: listener_stats
+        for listener_stats in profiler.async_stats()
+    }
+    listener_stats = stats["tests.test_core.test_eventbus_profiling.<locals>.listener"]
+    assert listener_stats["integration"] == "tests"
+    assert listener_stats["calls"] == 2
+    assert listener_stats["filter_calls"] == 3
+    assert listener_stats["filter_rejections"] == 1
+    assert listener_stats["filter_rejection_rate"] == pytest.approx(1 / 3)
+    assert listener_stats["duration_total"] > 0
+    assert (
+        0
+        < listener_stats["duration_p50"]
+        <= listener_stats["duration_p99"]
+        <= listener_stats["duration_max"]
+    )
+
+    assert hass.bus.async_disable_profiling() is profiler
+    assert hass.bus.profiler is None
+    hass.bus.async_fire("test_event", {"filtered": False})
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+    assert stats[listener_stats["listener"]]["calls"] == 2
+
+
+async def test_eventbus_profiling_keyed_dispatch_soon(hass: HomeAssistant) -> None:
+    """Test the keyed listeners dispatched in the next loop iteration are measured."""
+    calls: list[ha.Event] = []
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        """Mock listener."""
+        calls.append(event)
+
+    hass.bus.async_listen_keyed(
+        "test_event", ha.entity_id_event_key, "light.bowl", listener, dispatch_soon=True
+    )
+    profiler = hass.bus.async_enable_profiling()
+    hass.bus.async_fire("test_event", {"entity_id": "light.bowl"})
+    hass.bus.async_fire("test_event", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    stats = {
+        listener_stats["listener"]: listener_stats
+        for listener_stats in profiler.async_stats()
+    }
+    listener_stats = stats[
+        "tests.test_core.test_eventbus_profiling_keyed_dispatch_soon.<locals>.listener"
+    ]
+    assert listener_stats["calls"] == 1
+    assert listener_stats["duration_total"] > 0
+
+
+async def test_eventbus_profiling_listener_names(hass: HomeAssistant) -> None:
+    """Test the listeners are named after the function they call."""
+
+    async def _async_listener(event: ha.Event, extra: str) -> None:
+        """Mock coroutine listener."""
+
+    hass.bus.async_listen_once(
+        "test_event", functools.partial(_async_listener, extra="extra")
+    )
+    profiler = hass.bus.async_enable_profiling()
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert [stats["listener"] for stats in profiler.async_stats()] == [
+        "tests.test_core.test_eventbus_profiling_listener_names.<locals>._async_listener"
+    ]
+
+
+@pytest.mark.parametrize(
+    ("module", "integration"),
+    [
+        ("homeassistant.components.recorder.core", "recorder"),
+        ("homeassistant.components.zha", "zha"),
+        ("custom_components.hacs.base", "hacs"),
+        ("homeassistant.helpers.event", "homeassistant"),
+        ("", ""),
+    ],
+)
+def test_eventbus_profiling_listener_integration(module: str, integration: str) -> None:
+    """Test the listeners are attributed to the integration of their module."""
+    assert ha._listener_integration(module) == integration
+
+
+async def test_eventbus_listen_keyed(hass: HomeAssistant) -> None:
+    """Test listening for events by key."""
+    calls: list[tuple[str, str]] = []
+
+    @ha.callback
+    def listener(name: str, event: ha.Event) -> None:
+        """Mock listener."""
+        calls.append((name, event.data["entity_id"]))
+
+    unsub_bowl = hass.bus.async_listen_keyed(
+        "test_event",
+        ha.entity_id_event_key,
+        "light.bowl",
+        functools.partial(listener, "bowl"),
+    )
+    unsub_many = hass.bus.async_listen_keyed(
+        "test_event",
+        ha.entity_id_event_key,
+        ["light.bowl", "light.top"],
+        functools.partial(listener, "many"),
+    )
+    unsub_all = hass.bus.async_listen_keyed(
+        "test_event",
+        ha.entity_id_event_key,
+        MATCH_ALL,
+        functools.partial(listener, "all"),
+    )
+    # All listeners sharing a key getter count as one listener
+    assert hass.bus.async_listeners()["test_event"] == 1
+
+    hass.bus.async_fire("test_event", {"entity_id": "light.bowl"})
+    hass.bus.async_fire("test_event", {"entity_id": "light.top"})
+    hass.bus.async_fire("test_event", {"entity_id": "light.other"})
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    # MATCH_ALL is not a wildcard for keys
+    assert calls == [
+        ("bowl", "light.bowl"),
+        ("many", "light.bowl"),
+        ("many", "light.top"),
+    ]
+
+    calls.clear()
+    unsub_bowl()
+    unsub_all()
+    hass.bus.async_fire("test_event", {"entity_id": "light.bowl"})
+    await hass.async_block_till_done()
+    assert calls == [("many", "light.bowl")]
+
+    unsub_many()
+    assert "test_event" not in hass.bus.async_listeners()
+
+    hass.bus.async_listen_keyed(
+        "test_event",
+        ha.entity_id_event_key,
+        MATCH_ALL,
+        functools.partial(listener, "all"),
+        match_all=True,
+    )
+    hass.bus.async_fire("test_event", {"entity_id": "light.bowl"})
+    await hass.async_block_till_done()
+    assert calls == [("many", "light.bowl"), ("all", "light.bowl")]
+
+
+async def test_eventbus_listen_keyed_key_getter(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test events are not dispatched if the key getter returns no key."""
+    calls = []
+
+    @ha.callback
+    def added_domain(event_data: dict[str, Any]) -> str | None:
+        """Return the domain of added entities."""
+        if event_data["old_state"] is not None:
+            return None
+        return event_data["new_state"].domain
+
+    hass.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED, added_domain, "light", calls.append
+    )
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.bowl", "off")
+    hass.states.async_set("switch.bowl", "on")
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in calls] == ["light.bowl"]
+
+    hass.bus.async_listen_keyed(
+        "test_event", ha.entity_id_event_key, "light.bowl", calls.append
+    )
+    hass.bus.async_fire("test_event", {"device_id": "abc"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    @ha.callback
+    def broken_key(event_data: dict[str, Any]) -> str:
+        """Raise for all events."""
+        raise ValueError
+
+    hass.bus.async_listen_keyed("test_event", broken_key, "key", calls.append)
+    hass.bus.async_fire("test_event", {"entity_id": "light.bowl"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert "Error in event filter" in caplog.text
+
+    with pytest.raises(HomeAssistantError, match="is not a callback"):
+        hass.bus.async_listen_keyed(
+            "test_event", lambda event_data: "key", "key", calls.append
+        )
+
+
+async def test_eventbus_listen_keyed_order(hass: HomeAssistant) -> None:
+    """Test keyed listeners run in registration order with the other listeners."""
+    calls: list[str] = []
+
+    hass.bus.async_listen_keyed(
+        "test_event",
+        ha.entity_id_event_key,
+        "light.bowl",
+        ha.callback(lambda event: calls.append("keyed")),
+    )
+    hass.bus.async_listen(
+        "test_event", ha.callback(lambda event: calls.append("plain"))
+    )
+    hass.bus.async_listen_keyed(
+        "test_event",
+        ha.entity_id_event_key,
+        "light.bowl",
+        ha.callback(lambda event: calls.append("keyed 2")),
+    )
+    hass.bus.async_fire("test_event", {"entity_id": "light.bowl"})
+    await hass.async_block_till_done()
+    assert calls == ["keyed", "keyed 2", "plain"]
+
+
+async def test_eventbus_listen_keyed_dispatch_soon(hass: HomeAssistant) -> None:
+    """Test listeners added before a deferred dispatch receive the event."""
+    calls: list[str] = []
+
+    @ha.callback
+    def late_listener(event: ha.Event) -> None:
+        """Mock listener added after the event was fired."""
+        calls.append("late")
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        """Mock listener."""
+        calls.append("first")
+
+    hass.bus.async_listen_keyed(
+        "test_event", ha.entity_id_event_key, "light.bowl", listener, dispatch_soon=True
+    )
+    # Immediate and deferred listeners are indexed separately
+    hass.bus.async_listen_keyed(
+        "test_event",
+        ha.entity_id_event_key,
+        "light.bowl",
+        ha.callback(lambda event: calls.append("immediate")),
+    )
+    hass.bus.async_fire("test_event", {"entity_id": "light.bowl"})
+    assert calls == ["immediate"]
+    hass.bus.async_listen_keyed(
+        "test_event",
+        ha.entity_id_event_key,
+        "light.bowl",
+        late_listener,
+        dispatch_soon=True,
+    )
+    await hass.async_block_till_done()
+    assert calls[1:] == ["first", "late"]
@@ -14,6 +14,7 @@ import pytest
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
@@ -1999,3 +2000,135 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+def _simulate_restart(hass: HomeAssistant) -> None:
+    """Forget the integrations resolved so far."""
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+    hass.data.pop(loader.DATA_INTEGRATION_SNAPSHOT, None)
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_integration_snapshot(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the manifests of integrations are loaded from the snapshot."""
+    with patch.object(loader, "INTEGRATION_SNAPSHOT_ENABLED", True):
+        hue_integration = await loader.async_get_integration(hass, "hue")
+        custom_integration = await loader.async_get_integration(hass, "test")
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        data = hass_storage[loader.INTEGRATION_SNAPSHOT_STORAGE_KEY]["data"]
+        assert data["builtin"]["hue"]["manifest"] == hue_integration.manifest
+        assert "test" in data["custom"]
+
+        _simulate_restart(hass)
+        with patch.object(
+            loader, "_resolve_integrations_from_root"
+        ) as mock_resolve_integrations:
+            new_hue_integration = await loader.async_get_integration(hass, "hue")
+            new_custom_integration = await loader.async_get_integration(hass, "test")
+
+    mock_resolve_integrations.assert_not_called()
+    assert new_hue_integration is not hue_integration
+    assert new_hue_integration.manifest == hue_integration.manifest
+    assert new_hue_integration.file_path == hue_integration.file_path
+    assert new_hue_integration.has_translations == hue_integration.has_translations
+    assert new_hue_integration.platforms_exists(["light", "not_exists"]) == ["light"]
+    assert new_custom_integration.manifest == custom_integration.manifest
+    assert not new_custom_integration.is_built_in
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_integration_snapshot_invalidated(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the snapshot is not used when the fingerprints changed."""
+    with patch.object(loader, "INTEGRATION_SNAPSHOT_ENABLED", True):
+        await loader.async_get_integration(hass, "hue")
+        await loader.async_get_integration(hass, "test")
+        snapshot = hass.data[loader.DATA_INTEGRATION_SNAPSHOT]
+        data = json_loads(json_dumps(snapshot._data_to_save()))
+
+    data["builtin_fingerprint"]["version"] = "2000.1.0"
+    data["builtin"]["hue"]["manifest"]["name"] = "Stale"
+    data["custom_fingerprint"] = {}
+    data["custom"]["test"]["manifest"]["name"] = "Stale"
+    hass_storage[loader.INTEGRATION_SNAPSHOT_STORAGE_KEY] = {
+        "version": loader.INTEGRATION_SNAPSHOT_STORAGE_VERSION,
+        "minor_version": 1,
+        "key": loader.INTEGRATION_SNAPSHOT_STORAGE_KEY,
+        "data": data,
+    }
+
+    _simulate_restart(hass)
+    with patch.object(loader, "INTEGRATION_SNAPSHOT_ENABLED", True):
+        hue_integration = await loader.async_get_integration(hass, "hue")
+        custom_integration = await loader.async_get_integration(hass, "test")
+
+    assert hue_integration.name == "Philips Hue"
+    assert custom_integration.name != "Stale"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [],
+        {"builtin_fingerprint": None},
+        {"builtin_fingerprint": None, "custom_fingerprint": {}},
+        {"builtin_fingerprint": None, "custom_fingerprint": {}, "custom": []},
+        {
+            "builtin_fingerprint": None,
+            "custom_fingerprint": {},
+            "custom": {"test": {"path": "/test", "manifest": {}, "files": None}},
+        },
+        {
+            "builtin_fingerprint": None,
+            "custom_fingerprint": {},
+            "custom": {
+                "test": {"path": 1, "manifest": {"domain": "test"}, "files": None}
+            },
+        },
+    ],
+)
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_integration_snapshot_malformed(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    caplog: pytest.LogCaptureFixture,
+    data: Any,
+) -> None:
+    """Test a malformed snapshot is discarded."""
+    hass_storage[loader.INTEGRATION_SNAPSHOT_STORAGE_KEY] = {
+        "version": loader.INTEGRATION_SNAPSHOT_STORAGE_VERSION,
+        "minor_version": 1,
+        "key": loader.INTEGRATION_SNAPSHOT_STORAGE_KEY,
+        "data": data,
+    }
+
+    _simulate_restart(hass)
+    with patch.object(loader, "INTEGRATION_SNAPSHOT_ENABLED", True):
+        hue_integration = await loader.async_get_integration(hass, "hue")
+        custom_integration = await loader.async_get_integration(hass, "test")
+
+    assert "Discarding the malformed integration snapshot" in caplog.text
+    assert hue_integration.name == "Philips Hue"
+    assert custom_integration.domain == "test"
+    assert not custom_integration.is_built_in
+
+
+async def test_async_get_import_times(hass: HomeAssistant) -> None:
+    """Test the import times are summed per integration."""
+    integration = await loader.async_get_integration(hass, "hue")
+    await integration.async_get_component()
+    await integration.async_get_platform("light")
+
+    import_times = loader.async_get_import_times(hass)
+    assert import_times["hue"] >= 0
+    assert sum(
+        seconds
+        for domain, seconds in hass.data[loader.DATA_IMPORT_TIMES]
+        if domain == "hue"
+    ) == pytest.approx(import_times["hue"])
@@ -0,0 +1,42 @@
+"""Test the latency histogram."""
+
+import pytest
+
+from homeassistant.util.histogram import LatencyHistogram
+
+
+def test_empty_histogram() -> None:
+    """Test the summary of an empty histogram."""
+    assert LatencyHistogram().as_dict() == {
+        "count": 0,
+        "total": 0.0,
+        "max": 0.0,
+        "p50": 0.0,
+        "p99": 0.0,
+    }
+
+
+def test_percentiles() -> None:
+    """Test the percentiles are within a bucket of the durations."""
+    histogram = LatencyHistogram()
+    for _ in range(98):
+        histogram.add(0.001)
+    histogram.add(0.1)
+    histogram.add(0.2)
+    summary = histogram.as_dict()
+    assert summary["count"] == 100
+    assert summary["total"] == pytest.approx(0.398)
+    assert summary["max"] == 0.2
+    assert 0.001 <= summary["p50"] < 0.001 * 1.19
+    assert 0.1 <= summary["p99"] < 0.1 * 1.19
+    assert histogram.percentile(100) == 0.2
+
+
+def test_durations_out_of_range() -> None:
+    """Test durations beyond the buckets are counted."""
+    histogram = LatencyHistogram()
+    histogram.add(0.0)
+    histogram.add(60.0)
+    assert histogram.count == 2
+    assert histogram.percentile(50) == 1 / 1_000_000
+    assert histogram.percentile(99) == 60.0
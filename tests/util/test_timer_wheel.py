@@ -0,0 +1,152 @@
+"""Test the timer wheel."""
+
+import asyncio
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from homeassistant.util.async_ import get_scheduled_timer_handles
+from homeassistant.util.timer_wheel import (
+    TimerWheel,
+    get_timer_wheel,
+    is_timer_wheel_handle,
+)
+
+
+async def test_timers_share_one_loop_timer() -> None:
+    """Test the timers of the wheel only schedule one event loop timer."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    # Start at a whole second so the slots of the timers are known
+    now = int(loop.time())
+    calls = []
+    for delay in (5.5, 5.2, 7.0):
+        wheel.call_at(now + delay, calls.append, delay)
+
+    handles = [
+        handle
+        for handle in get_scheduled_timer_handles(loop)
+        if is_timer_wheel_handle(handle)
+    ]
+    assert len(handles) == 1
+    # The wheel wakes up at the end of the first slot
+    assert handles[0].when() == now + 6
+    assert wheel.stats() == {
+        "pending": 3,
+        "slots": 2,
+        "max_per_slot": 2,
+        "next_wakeup": now + 6,
+    }
+
+    wheel.run_due(now + 5.6)
+    assert calls == [5.2, 5.5]
+    assert [timer.when() for timer in wheel.timers()] == [now + 7.0]
+    # A timer at a whole second is in the slot ending at it
+    assert wheel.stats()["next_wakeup"] == now + 7
+
+    wheel.run_due(now + 10)
+    assert calls == [5.2, 5.5, 7.0]
+    assert wheel.stats() == {
+        "pending": 0,
+        "slots": 0,
+        "max_per_slot": 0,
+        "next_wakeup": None,
+    }
+
+
+async def test_timers_of_a_slot_share_one_call_at() -> None:
+    """Test timers within one second only schedule the event loop timer once."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    now = int(loop.time())
+    callback = Mock()
+    with patch.object(loop, "call_at", wraps=loop.call_at) as call_at:
+        # Later timers are added first to make sure
+        # an earlier deadline does not reschedule it
+        for number in reversed(range(100)):
+            wheel.call_at(now + 10 + (number + 1) / 100, callback, number)
+        assert call_at.call_count == 1
+        assert call_at.call_args.args[0] == now + 11
+
+        # A timer in an earlier slot reschedules it
+        wheel.call_at(now + 5.5, callback, -1)
+        assert call_at.call_count == 2
+        assert call_at.call_args.args[0] == now + 6
+
+        wheel.run_due(now + 6)
+        callback.assert_called_once_with(-1)
+        assert call_at.call_count == 3
+        assert call_at.call_args.args[0] == now + 11
+
+        # All timers of the slot run in the same wakeup
+        wheel.run_due(now + 11)
+        assert callback.call_count == 101
+        assert [call.args[0] for call in callback.call_args_list[1:]] == list(
+            range(100)
+        )
+        assert call_at.call_count == 3
+    assert wheel.stats()["next_wakeup"] is None
+
+
+async def test_cancel_timer() -> None:
+    """Test cancelled timers do not run."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    now = loop.time()
+    callback = Mock()
+    timer = wheel.call_at(now + 1, callback)
+    # Cancelled by a timer which runs in the same wakeup
+    wheel.call_at(now + 0.5, timer.cancel)
+
+    wheel.run_due(now + 2)
+    assert timer.cancelled()
+    callback.assert_not_called()
+    assert wheel.timers() == []
+
+
+async def test_timers_run_when_due() -> None:
+    """Test the event loop timer runs the due timers."""
+    loop = asyncio.get_running_loop()
+    wheel = get_timer_wheel(loop)
+    assert get_timer_wheel(loop) is wheel
+    future = loop.create_future()
+    timer = wheel.call_later(0.01, future.set_result, "done")
+    assert not timer.cancelled()
+    assert await future == "done"
+    assert timer.cancelled()
+
+
+async def test_shared_now() -> None:
+    """Test the timers of a slot in one wakeup share the time of a clock."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    clock = Mock(side_effect=time.time)
+    now = int(loop.time())
+    times = []
+    for delay in (0.1, 0.2, 1.1):
+        wheel.call_at(now + delay, lambda: times.append(wheel.shared_now(clock)))
+
+    wheel.run_due(now + 2)
+    assert len(times) == 3
+    assert times[0] == times[1]
+    # The clock is read again for the next slot
+    assert clock.call_count == 2
+
+    wheel.shared_now(clock)
+    assert clock.call_count == 3
+
+
+async def test_exception_in_timer(caplog: pytest.LogCaptureFixture) -> None:
+    """Test an exception in a timer does not prevent the others from running."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    now = loop.time()
+    callback = Mock()
+    wheel.call_at(now + 0.1, Mock(side_effect=RuntimeError("boom")))
+    wheel.call_at(now + 0.2, callback)
+
+    wheel.run_due(now + 1)
+    callback.assert_called_once_with()
+    assert "Exception in callback <Mock" in caplog.text
+    assert "RuntimeError: boom" in caplog.text